@@ -2,12 +2,16 @@ import os
 from dotenv import load_dotenv
 from alembic import context
 from sqlalchemy import engine_from_config, pool
+from sqlalchemy.engine import make_url
 
 load_dotenv()
 
 config = context.config
 # .env에 있는 DSN 불러오기
 target_url = os.getenv("PG_DSN")
+# 드라이버는 psycopg(3)만 설치: postgresql:// 기본 드라이버(psycopg2) 대신 psycopg 사용
+if target_url and make_url(target_url).drivername == "postgresql":
+    target_url = make_url(target_url).set(drivername="postgresql+psycopg").render_as_string(hide_password=False)
 
 def run_migrations_offline():
     context.configure(
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark: MERGE vs. two-statement bridge sync in elt/stg_to_core.
+
+Loads the policies currently in ``core.policy``, normalizes their payloads and
+randomly changes a share of their code lists (``--change``), using only codes
+already present in master so no master rows are created. Every repetition
+runs all bridge syncs for the whole set with each strategy inside one
+transaction and rolls it back, so the database is left untouched.
+
+Both strategies must report identical insert/delete counts for the same input.
+
+Requires DATABASE_URL (same as stg_to_core) and a populated core schema.
+
+Usage example:
+
+    python bench/bench_bridge_sync.py --change 0.3 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "elt"))
+
+import stg_to_core as stc  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+STRATEGIES = (stc.BRIDGE_TWO_STEP, stc.BRIDGE_MERGE)
+
+
+def load_batch(engine) -> stc.PolicyBatch:
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT id AS policy_id, content_hash AS record_hash, payload AS raw_json FROM core.policy ORDER BY id"
+        )).mappings().all()
+    return stc.normalize_rows([dict(r) for r in rows])
+
+
+def mutate(batch: stc.PolicyBatch, codes: Dict[str, List[str]], share: float, seed: int) -> stc.PolicyBatch:
+    rnd = random.Random(seed)
+    lists = {spec.attr: batch.links[spec.attr].to_lists(len(batch)) for spec in stc.BRIDGES}
+    for i in range(len(batch)):
+        if rnd.random() >= share:
+            continue
+        for spec in stc.BRIDGES:
+            pool = codes[spec.lookup]
+            if pool:
+                lists[spec.attr][i] = rnd.sample(pool, min(len(pool), rnd.randint(0, 3)))
+    return batch.replace(**lists)
+
+
+def run_once(engine, batch: stc.PolicyBatch, strategy: str):
+    counts = {}
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            started = time.perf_counter()
+            for spec in stc.BRIDGES:
+                res = stc.sync_bridge(conn, batch, spec, commit=False, strategy=strategy)
+                counts[spec.table] = (res["inserted"], res["deleted"])
+            elapsed = time.perf_counter() - started
+        finally:
+            trans.rollback()
+    return elapsed, counts
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--change", type=float, default=0.3, help="share of policies whose codes change (default: 0.3)")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per strategy (default: 5)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    engine = stc.get_engine()
+    policies = load_batch(engine)
+    if not policies:
+        print("core.policy is empty; run the ETL first.")
+        return 1
+    with engine.connect() as conn:
+        codes = {spec.lookup: sorted(stc.get_lookup(conn, spec.lookup)) for spec in stc.BRIDGES}
+        print(f"server={conn.dialect.server_version_info} policies={len(policies):,} change={args.change}")
+
+    timings: Dict[str, List[float]] = {s: [] for s in STRATEGIES}
+    for rep in range(args.repeat):
+        batch = mutate(policies, codes, args.change, args.seed + rep)
+        results = {}
+        for strategy in (STRATEGIES if rep % 2 == 0 else STRATEGIES[::-1]):   # 순서 영향 상쇄
+            elapsed, counts = run_once(engine, batch, strategy)
+            timings[strategy].append(elapsed)
+            results[strategy] = counts
+        if results[stc.BRIDGE_MERGE] != results[stc.BRIDGE_TWO_STEP]:
+            print(f"count mismatch in repetition {rep}: {results}")
+            return 1
+        if rep == 0:
+            for table, (ins, dele) in results[stc.BRIDGE_MERGE].items():
+                print(f"  {table:<36} +{ins:<7} -{dele}")
+
+    base = statistics.median(timings[stc.BRIDGE_TWO_STEP])
+    for strategy in STRATEGIES:
+        med = statistics.median(timings[strategy])
+        print(f"  {strategy:<9} median {med:7.3f}s  min {min(timings[strategy]):7.3f}s  x{base / med:4.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
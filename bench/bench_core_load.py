@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark: core.policy staging loads in elt/stg_to_core.
+
+Compares three ways of loading the same normalized policies into the
+``tmp_policy_upsert`` staging table used by ``upsert_policy``:
+
+* ``executemany`` – one INSERT per row (SQLAlchemy ``text()`` + list of dicts)
+* ``unnest``      – one INSERT ... SELECT FROM unnest(typed arrays)
+* ``copy``        – psycopg binary COPY with typed rows (current implementation)
+
+It then times the full ``upsert_policy`` (binary COPY + INSERT ... ON CONFLICT)
+with every policy title changed, so each row takes the update path.
+
+Policies are read from ``core.policy`` and re-normalized. Every repetition runs
+inside one transaction that is rolled back, so the database is left untouched.
+
+Requires DATABASE_URL (same as stg_to_core) and a populated core schema.
+
+Usage example:
+
+    python bench/bench_core_load.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "elt"))
+
+import stg_to_core as stc  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+STAGE = "tmp_policy_upsert"
+
+
+def load_batch(engine) -> stc.PolicyBatch:
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT id AS policy_id, content_hash AS record_hash, payload AS raw_json FROM core.policy ORDER BY id"
+        )).mappings().all()
+    return stc.normalize_rows([dict(r) for r in rows])
+
+
+def stage_executemany(conn, cols: Dict[str, List]) -> None:
+    names = [c for c, _ in stc.POLICY_COPY_COLUMNS]
+    conn.execute(
+        text(f"INSERT INTO {STAGE} ({', '.join(names)}) VALUES ({', '.join(':' + c for c in names)})"),
+        [dict(zip(names, values)) for values in zip(*[cols[c] for c in names])],
+    )
+
+
+def stage_unnest(conn, cols: Dict[str, List]) -> None:
+    args = ", ".join(f"CAST(:{c} AS {t}[])" for c, t in stc.POLICY_COPY_COLUMNS)
+    conn.execute(
+        text(f"INSERT INTO {STAGE} SELECT * FROM unnest({args})"),
+        {c: cols[c] for c, _ in stc.POLICY_COPY_COLUMNS},
+    )
+
+
+def stage_copy(conn, cols: Dict[str, List]) -> None:
+    stc.copy_rows(conn, STAGE, stc.POLICY_COPY_COLUMNS, zip(*[cols[c] for c, _ in stc.POLICY_COPY_COLUMNS]))
+
+
+def timed_rollback(engine, fn: Callable) -> float:
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            started = time.perf_counter()
+            fn(conn)
+            return time.perf_counter() - started
+        finally:
+            trans.rollback()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per variant (default: 5)")
+    args = parser.parse_args(argv)
+
+    engine = stc.get_engine()
+    batch = load_batch(engine)
+    if not batch:
+        print("core.policy is empty; run the ETL first.")
+        return 1
+    cols = stc.policy_copy_columns(batch)
+    print(f"driver={engine.dialect.driver} policies={len(batch):,}")
+
+    stagers = {"executemany": stage_executemany, "unnest": stage_unnest, "copy": stage_copy}
+    timings: Dict[str, List[float]] = {name: [] for name in stagers}
+    for rep in range(args.repeat):
+        for name, stage in (stagers.items() if rep % 2 == 0 else reversed(stagers.items())):   # 순서 영향 상쇄
+            def run(conn, stage=stage):
+                stc.create_policy_stage(conn)
+                stage(conn, cols)
+            timings[name].append(timed_rollback(engine, run))
+
+    base = statistics.median(timings["executemany"])
+    print("  staging load:")
+    for name in stagers:
+        med = statistics.median(timings[name])
+        print(f"    {name:<12} median {med:7.3f}s  {len(batch) / med:10,.0f} rows/s  x{base / med:5.1f}")
+
+    changed = batch.replace(title=[f"{title or ''} (bench)" for title in batch.values("title")])
+    upserts = [timed_rollback(engine, lambda conn: stc.upsert_policy(conn, changed, commit=False))
+               for _ in range(args.repeat)]
+    print(f"  upsert_policy (all rows updated) median {statistics.median(upserts):7.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
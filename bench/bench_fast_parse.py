@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Microbenchmark: elt/fast_parse vs. datetime.strptime.
+
+Compares three ways of parsing the date fields of a batch of policies:
+
+* ``strptime``  – the previous stg_to_core implementation (strptime per field)
+* ``slice``     – fast_parse fixed-format slicing parsers, cache bypassed
+* ``cached``    – fast_parse public functions (slicing + LRU cache)
+
+Inputs are drawn from a pool of ``--distinct`` values per field, mimicking how
+deadlines and ``aplyYmd`` ranges repeat across policies. A small share of
+malformed values is mixed in.
+
+Usage example:
+
+    python bench/bench_fast_parse.py --rows 100000 --distinct 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "elt"))
+
+import fast_parse  # noqa: E402
+from fast_parse import KST  # noqa: E402
+
+MALFORMED = ["", "-", "2025-13-01", "20250230", "20250101 ~", "bad"]
+
+
+def strptime_period(value: str):
+    try:
+        start, end = value.split("~")
+        return (
+            datetime.strptime(start.strip(), "%Y%m%d").date(),
+            datetime.strptime(end.strip(), "%Y%m%d").date(),
+        )
+    except Exception:
+        return None, None
+
+
+def strptime_date(value: str):
+    try:
+        return datetime.strptime(value, "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def strptime_datetime(value: str):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").replace(tzinfo=KST)
+    except ValueError:
+        return None
+
+
+def make_pools(distinct: int, seed: int) -> Dict[str, List[str]]:
+    rnd = random.Random(seed)
+    base = date(2024, 1, 1)
+    periods, dates, stamps = [], [], []
+    for _ in range(distinct):
+        start = base + timedelta(days=rnd.randrange(730))
+        end = start + timedelta(days=rnd.randrange(1, 365))
+        periods.append(f"{start:%Y%m%d} ~ {end:%Y%m%d}")
+        dates.append(f"{start:%Y%m%d}")
+        stamp = datetime.combine(start, datetime.min.time()) + timedelta(seconds=rnd.randrange(86400))
+        stamps.append(f"{stamp:%Y-%m-%d %H:%M:%S}")
+    return {"period": periods + MALFORMED, "date": dates + MALFORMED, "datetime": stamps + MALFORMED}
+
+
+def make_inputs(pools: Dict[str, List[str]], rows: int, seed: int) -> Dict[str, List[str]]:
+    rnd = random.Random(seed + 1)
+    return {field: [rnd.choice(pool) for _ in range(rows)] for field, pool in pools.items()}
+
+
+def run(parsers: Dict[str, Callable[[str], object]], inputs: Dict[str, List[str]]) -> float:
+    fast_parse.cache_clear()    # 매 반복마다 빈 캐시에서 시작
+    started = time.perf_counter()
+    for field, values in inputs.items():
+        parse = parsers[field]
+        for v in values:
+            parse(v)
+    return time.perf_counter() - started
+
+
+def uncached(fn: Callable) -> Callable:
+    """lru_cache 래퍼를 벗긴 원래 파서 (FAST_PARSE_CACHE_SIZE=0이면 그대로)"""
+    return getattr(fn, "__wrapped__", fn)
+
+
+def best_of(repeat: int, fn: Callable[[], float]) -> float:
+    return min(fn() for _ in range(repeat))
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="values per field (default: 100000)")
+    parser.add_argument("--distinct", type=int, default=300, help="distinct values per field (default: 300)")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions, best time is reported (default: 5)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    inputs = make_inputs(make_pools(args.distinct, args.seed), args.rows, args.seed)
+
+    # 결과가 같은지 먼저 확인 (strptime 기준, YYYYMMDD 입력만 사용하므로 동일해야 함)
+    for v in inputs["period"][:1000]:
+        assert fast_parse.parse_period(v) == strptime_period(v), v
+    for v in inputs["date"][:1000]:
+        assert fast_parse.parse_date(v) == strptime_date(v), v
+    for v in inputs["datetime"][:1000]:
+        assert fast_parse.parse_datetime_kst(v) == strptime_datetime(v), v
+
+    variants = {
+        "strptime": {"period": strptime_period, "date": strptime_date, "datetime": strptime_datetime},
+        "slice": {
+            "period": uncached(fast_parse._parse_period),
+            "date": uncached(fast_parse._parse_date),
+            "datetime": uncached(fast_parse._parse_datetime_kst),
+        },
+        "cached": {"period": fast_parse.parse_period, "date": fast_parse.parse_date, "datetime": fast_parse.parse_datetime_kst},
+    }
+
+    total = args.rows * len(inputs)
+    print(f"rows/field={args.rows:,} distinct/field={args.distinct:,} cache={fast_parse.FAST_PARSE_CACHE_SIZE} values={total:,}")
+    baseline = None
+    for name, parsers in variants.items():
+        elapsed = best_of(args.repeat, lambda: run(parsers, inputs))
+        baseline = baseline or elapsed
+        print(f"  {name:<9} {elapsed:8.3f}s  {total / elapsed / 1e6:6.2f} M values/s  x{baseline / elapsed:5.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
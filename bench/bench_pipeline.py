@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""Benchmark: the four ELT stages on a synthetic catalog.
+
+Runs ``raw_ingest`` (against a stand-in youthcenter API serving
+``bench/synthetic.py`` pages), ``upsert_landing``, ``refresh_current`` and
+``run_etl`` for an initial load (day 0) of ``--n`` policies followed by
+``--days`` daily runs with ``--change-rate`` churn, and writes per-stage wall
+times, row counts, the etl_metrics step breakdown and table sizes as JSON.
+
+Two result files can be compared (per day and stage, median over repeats):
+
+    python bench/bench_pipeline.py --n 10000 --days 2 --out before.json
+    git checkout <branch>
+    python bench/bench_pipeline.py --n 10000 --days 2 --out after.json
+    python bench/bench_pipeline.py --compare before.json after.json
+
+Requires BENCH_DSN pointing at a DEDICATED database with the ``sql/`` schema
+applied (as in docker-compose). raw/stg/core/master tables are TRUNCATED at the
+start of every repetition.
+
+Notes:
+
+* The stand-in API renders pages on the fly in a separate process, so the
+  ``raw`` stage includes generation time (~0.1 ms per policy); the
+  ``fetch_page`` / ``insert_page`` steps separate it from the DB work.
+  The request interval (REQUEST_INTERVAL_MS) is set to 0.
+* Stage modules read their settings at import time; the ones the benchmark
+  depends on (DSNs, API URL, page size, metrics export) are set here, other
+  variables (ETL_BATCH_SIZE, ETL_SHARDS, ...) are taken from the environment.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "elt"))
+sys.path.insert(0, str(ROOT / "bench"))
+
+import synthetic  # noqa: E402
+
+STAGES = ("raw", "landing", "current", "core")
+
+RESET_SQL = """
+TRUNCATE raw.youthpolicy_pages, stg.youthpolicy_landing, stg.youthpolicy_current,
+         core.policy, meta.etl_unknown_code,
+         master.region, master.category, master.keyword, master.education,
+         master.major, master.job_status, master.specialization
+RESTART IDENTITY CASCADE
+"""
+
+SIZE_TABLES = (
+    "raw.youthpolicy_pages", "stg.youthpolicy_landing", "stg.youthpolicy_current",
+    "core.policy", "core.policy_region", "core.policy_keyword",
+)
+
+
+# ---------- stand-in API ----------
+def _serve(spec: synthetic.CatalogSpec, day, port_out) -> None:
+    """API process: GET ?pageNum=&pageSize= -> page of the catalog for the current ``day`` value."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            q = parse_qs(urlparse(self.path).query)
+            page_no = int(q.get("pageNum", ["1"])[0])
+            page_size = int(q.get("pageSize", ["100"])[0])
+            body = json.dumps(synthetic.api_page(spec, page_no, page_size, day.value), ensure_ascii=False).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    port_out.send(server.server_address[1])
+    server.serve_forever()
+
+
+def start_api(spec: synthetic.CatalogSpec):
+    ctx = multiprocessing.get_context("spawn")
+    day = ctx.Value("i", 0)
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_serve, args=(spec, day, send), daemon=True)
+    proc.start()
+    port = recv.recv()
+    return proc, day, f"http://127.0.0.1:{port}/go/ythip/getPlcy"
+
+
+# ---------- setup ----------
+def configure_env(dsn: str, api_url: str, page_size: int) -> None:
+    os.environ.update({
+        "PG_DSN": dsn,
+        "DATABASE_URL": dsn,
+        "BASE_URL": api_url,
+        "API_KEY": "bench",
+        "PAGE_SIZE": str(page_size),
+        "START_PAGE": "1",
+        "END_PAGE": "0",
+        "REQUEST_INTERVAL_MS": "0",
+        "ETL_METRICS_DB": "0",
+        "ETL_METRICS_DIR": "",
+        "LOG_LEVEL": os.getenv("LOG_LEVEL", "WARNING"),
+    })
+
+
+def reset_database(mods: Dict[str, Any]) -> None:
+    """bootstrap every stage, truncate ETL/master tables and load the synthetic master rows"""
+    import psycopg
+
+    with psycopg.connect(os.environ["PG_DSN"]) as conn:
+        for name in ("raw_ingest", "stg_landing", "stg_refresh_current"):
+            mods[name].bootstrap(conn)
+        mods["stg_to_core"].bootstrap(mods["engine"])
+        master = synthetic.master_rows()
+        with conn.cursor() as cur:
+            cur.execute(RESET_SQL)
+            cur.executemany(
+                "INSERT INTO master.region (code, name, zip_code, full_name, kind) VALUES (%s, %s, %s, %s, %s)",
+                master["region"],
+            )
+            for code, name, parent, level in master["category"]:
+                cur.execute(
+                    "INSERT INTO master.category (code, name, parent_id, level) "
+                    "VALUES (%s, %s, (SELECT id FROM master.category WHERE code = %s), %s)",
+                    (code, name, parent, level),
+                )
+            cur.executemany("INSERT INTO master.keyword (name) VALUES (%s)", master["keyword"])
+            for table in ("education", "major", "job_status", "specialization"):
+                cur.executemany(f"INSERT INTO master.{table} (code, name) VALUES (%s, %s)", master[table])
+        conn.commit()
+    mods["stg_to_core"].MASTER_CACHE.invalidate()
+
+
+def table_sizes() -> Dict[str, int]:
+    import psycopg
+
+    with psycopg.connect(os.environ["PG_DSN"]) as conn:
+        return {
+            t: conn.execute("SELECT pg_total_relation_size(%s::regclass)", (t,)).fetchone()[0]
+            for t in SIZE_TABLES
+        }
+
+
+# ---------- stages ----------
+def run_stage(name: str, mods: Dict[str, Any], verbose: bool) -> Dict[str, Any]:
+    import etl_metrics
+    import psycopg
+
+    module = {"raw": "raw_ingest", "landing": "stg_landing", "current": "stg_refresh_current", "core": "stg_to_core"}[name]
+    metrics = mods[module].METRICS
+    metrics.steps.clear()
+    out = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stdout if verbose else out):
+        if name == "core":
+            mods["stg_to_core"].run_etl(engine=mods["engine"])
+        else:
+            with psycopg.connect(os.environ["PG_DSN"]) as conn:
+                etl_metrics.instrument(conn)
+                if name == "raw":
+                    mods["raw_ingest"].ingest_pages(conn)
+                elif name == "landing":
+                    pages = mods["stg_landing"].load_raw_pages(conn)
+                    if pages:
+                        mods["stg_landing"].upsert_landing(conn, pages)
+                else:
+                    mods["stg_refresh_current"].refresh_current(conn)
+    seconds = time.perf_counter() - started
+    steps = [asdict(s) for s in metrics.rows()]
+    return {
+        "seconds": round(seconds, 4),
+        "round_trips": sum(s["round_trips"] for s in steps),
+        "steps": steps,
+    }
+
+
+def run_scenario(args: argparse.Namespace, spec: synthetic.CatalogSpec, api_day, mods: Dict[str, Any]) -> Dict[str, Any]:
+    reset_database(mods)
+    days = []
+    for day in range(args.days + 1):
+        api_day.value = day
+        stages = {name: run_stage(name, mods, args.verbose) for name in STAGES}
+        days.append({
+            "day": day,
+            "catalog": spec.size(day),
+            "changed": spec.size(0) if day == 0 else spec.changed_count(day),
+            "stages": stages,
+            "total_seconds": round(sum(s["seconds"] for s in stages.values()), 4),
+        })
+        print(f"  day {day}: " + "  ".join(f"{n}={s['seconds']:.2f}s" for n, s in stages.items())
+              + f"  total={days[-1]['total_seconds']:.2f}s", file=sys.stderr)
+    return {"days": days, "sizes": table_sizes()}
+
+
+def summarize(runs: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """{"day<d>": {stage: median seconds, "total": ...}} over repetitions"""
+    out: Dict[str, Dict[str, float]] = {}
+    for d in range(len(runs[0]["days"])):
+        key = f"day{d}"
+        out[key] = {
+            name: round(statistics.median(r["days"][d]["stages"][name]["seconds"] for r in runs), 4)
+            for name in STAGES
+        }
+        out[key]["total"] = round(statistics.median(r["days"][d]["total_seconds"] for r in runs), 4)
+    return out
+
+
+def git_revision() -> Dict[str, Any]:
+    def git(*cmd: str) -> str:
+        return subprocess.run(["git", *cmd], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    return {"commit": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+# ---------- compare ----------
+def compare(base_path: str, new_path: str) -> int:
+    base, new = (json.loads(Path(p).read_text(encoding="utf-8")) for p in (base_path, new_path))
+    if base["params"] != new["params"]:
+        print(f"warning: params differ\n  base: {base['params']}\n  new:  {new['params']}")
+    print(f"base {str(base['git']['commit'])[:10]}  new {str(new['git']['commit'])[:10]}")
+    print(f"  {'':<6}{'stage':<9}{'base s':>10}{'new s':>10}{'ratio':>8}")
+    for day, stages in base["summary"].items():
+        for name, b in stages.items():
+            n = new["summary"].get(day, {}).get(name)
+            if n is None:
+                continue
+            ratio = f"x{b / n:.2f}" if n else "n/a"
+            print(f"  {day:<6}{name:<9}{b:>10.3f}{n:>10.3f}{ratio:>8}")
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=10_000, help="policies on day 0 (1k .. 1M, default: 10000)")
+    parser.add_argument("--days", type=int, default=1, help="daily incremental runs after the initial load (default: 1)")
+    parser.add_argument("--change-rate", type=float, default=0.05, help="share of policies changed per day (default: 0.05)")
+    parser.add_argument("--new-rate", type=float, default=0.002, help="new policies per day as a share of n (default: 0.002)")
+    parser.add_argument("--page-size", type=int, default=100, help="API page size (default: 100)")
+    parser.add_argument("--repeat", type=int, default=1, help="repetitions of the whole scenario (default: 1)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="write JSON results to this file (default: stdout)")
+    parser.add_argument("--verbose", action="store_true", help="show stage output")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two result files and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(*args.compare)
+
+    dsn = os.getenv("BENCH_DSN")
+    if not dsn:
+        parser.error("BENCH_DSN is required (dedicated database, tables are truncated)")
+
+    spec = synthetic.CatalogSpec(args.n, args.seed, args.change_rate, args.new_rate)
+    api_proc, api_day, api_url = start_api(spec)
+    try:
+        configure_env(dsn, api_url, args.page_size)
+        import raw_ingest
+        import stg_landing
+        import stg_refresh_current
+        import stg_to_core
+
+        stg_to_core.DEBUG = False
+        mods: Dict[str, Any] = {
+            "raw_ingest": raw_ingest, "stg_landing": stg_landing,
+            "stg_refresh_current": stg_refresh_current, "stg_to_core": stg_to_core,
+            "engine": stg_to_core.get_engine(),
+        }
+        with mods["engine"].connect() as conn:
+            server_version = ".".join(map(str, conn.dialect.server_version_info or ()))
+
+        runs = []
+        for rep in range(args.repeat):
+            print(f"repetition {rep + 1}/{args.repeat} (n={args.n:,}, days={args.days}, change={args.change_rate})", file=sys.stderr)
+            runs.append(run_scenario(args, spec, api_day, mods))
+    finally:
+        api_proc.terminate()
+
+    result = {
+        "bench": "pipeline",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": git_revision(),
+        "params": {
+            "n": args.n, "days": args.days, "change_rate": args.change_rate, "new_rate": args.new_rate,
+            "page_size": args.page_size, "seed": args.seed, "repeat": args.repeat,
+            "env": {k: os.environ[k] for k in sorted(os.environ) if k.startswith("ETL_") and k != "ETL_RUN_ID"},
+        },
+        "host": {"python": platform.python_version(), "postgres": server_version, "cpus": os.cpu_count()},
+        "summary": summarize(runs),
+        "runs": runs,
+    }
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+        print(f"wrote {args.out}", file=sys.stderr)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
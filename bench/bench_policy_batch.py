@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark: memory and load-prep cost of the normalized change set in elt/stg_to_core.
+
+Normalizes ``--n`` synthetic policies (bench/synthetic.py) into three
+representations of the same values:
+
+* ``dataclass`` – a list of plain (dict-backed) dataclass records, the previous
+  ``normalize_rows`` output
+* ``slotted``   – a list of ``NormalizedPolicy`` records (now ``slots=True``)
+* ``batch``     – ``PolicyBatch`` (per-field columns, flat code-link arrays)
+
+Memory is what each variant retains after normalization (tracemalloc, the
+intermediate frame already freed), not counting the raw_json payloads that
+all of them reference.
+
+It then times preparing the ``core.policy`` COPY input: one params dict per
+record (previous ``_policy_params``) against ``policy_copy_columns``.
+
+No database is needed.
+
+Usage example:
+
+    python bench/bench_policy_batch.py --n 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import hashlib
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "elt"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import stg_to_core as stc  # noqa: E402
+from synthetic import CatalogSpec  # noqa: E402
+
+# the previous record type: same fields, instance __dict__
+LegacyPolicy = dataclasses.make_dataclass(
+    "LegacyPolicy",
+    [(f.name, f.type, dataclasses.field(default=None)) for f in dataclasses.fields(stc.NormalizedPolicy)],
+)
+
+
+def changed_rows(n: int) -> List[Dict[str, Any]]:
+    rows = []
+    for policy in CatalogSpec(n).iter_policies():
+        body = json.dumps(policy, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        rows.append({"policy_id": policy["plcyNo"], "record_hash": hashlib.md5(body).hexdigest(), "raw_json": policy})
+    return rows
+
+
+def build_records(cls, rows: List[Dict[str, Any]]) -> List[Any]:
+    frame = stc.normalize_frame(rows)
+    names = list(frame.columns)
+    columns = [frame[name].tolist() for name in names]
+    return [cls(**dict(zip(names, values))) for values in zip(*columns)]
+
+
+def traced(build: Callable[[], Any]) -> Tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        out = build()
+        gc.collect()
+        return out, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def legacy_copy_rows(records: List[Any]) -> List[Tuple[Any, ...]]:
+    """previous upsert_policy staging: params dict per record, then a tuple per row"""
+    params = []
+    for item in {item.id: item for item in records}.values():
+        row = {c: getattr(item, c) for c in stc.POLICY_COLUMNS}
+        row["payload"] = json.dumps(item.payload, ensure_ascii=False)
+        row["group_hashes"] = json.dumps({
+            group: stc._group_hash([row[c] for c in cols]) for group, cols in stc.POLICY_COLUMN_GROUPS.items()
+        })
+        params.append(row)
+    return [tuple(p[c] for c, _ in stc.POLICY_COPY_COLUMNS) for p in params]
+
+
+def batch_copy_rows(batch: stc.PolicyBatch) -> List[Tuple[Any, ...]]:
+    cols = stc.policy_copy_columns(batch)
+    return list(zip(*[cols[c] for c, _ in stc.POLICY_COPY_COLUMNS]))
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=20000, help="policies (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions of the COPY prep timing (default: 3)")
+    args = parser.parse_args(argv)
+
+    rows = changed_rows(args.n)
+    builders = {
+        "dataclass": lambda: build_records(LegacyPolicy, rows),
+        "slotted": lambda: build_records(stc.NormalizedPolicy, rows),
+        "batch": lambda: stc.normalize_rows(rows),
+    }
+    built: Dict[str, Any] = {}
+    sizes: Dict[str, int] = {}
+    for name, build in builders.items():
+        built[name], sizes[name] = traced(build)
+    links = sum(len(v) for v in built["batch"].links.values())
+    vocab = sum(len(v.vocab) for v in built["batch"].links.values())
+    print(f"policies={args.n:,} code links={links:,} ({links / args.n:.1f}/policy, {vocab:,} distinct codes)")
+    base = sizes["dataclass"]
+    print("  container memory:")
+    for name, size in sizes.items():
+        print(f"    {name:<10} {size / 2**20:8.1f} MiB  {size / args.n:7.0f} B/policy  x{base / size:4.1f}")
+
+    if legacy_copy_rows(built["dataclass"]) != batch_copy_rows(built["batch"]):
+        print("COPY rows differ between record and batch staging")
+        return 1
+
+    timings: Dict[str, List[float]] = {"records": [], "batch": []}
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        legacy_copy_rows(built["dataclass"])
+        timings["records"].append(time.perf_counter() - started)
+        started = time.perf_counter()
+        batch_copy_rows(built["batch"])
+        timings["batch"].append(time.perf_counter() - started)
+    base_t = statistics.median(timings["records"])
+    print("  core.policy COPY prep:")
+    for name, ts in timings.items():
+        med = statistics.median(ts)
+        print(f"    {name:<10} median {med:7.3f}s  x{base_t / med:4.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Synthetic youth-policy catalog for the ELT benchmarks.
+
+Builds API items by mutating ``tools/raw_json_example.json``. Every policy is a
+pure function of ``(seed, index, day)``, so catalogs of 1k to 1M policies can
+be streamed page by page without holding them in memory, and two runs with the
+same parameters produce byte-identical payloads.
+
+Distributions (loosely modelled on the youthcenter catalog):
+
+* regions    – ~15 % nationwide (every sigungu zip), ~10 % province-wide,
+               the rest one to three sigungu of a single province
+* keywords   – one to three from a Zipf-weighted vocabulary, ~2 % rare
+               one-off keywords that the core sync has to create in master
+* codes      – education / major / job / specialization requirements are
+               "unrestricted" for ~60 % of policies, otherwise one to three
+               codes from ``tools/values.csv``
+* categories – large / medium category pairs, ~10 % with two mediums
+* text       – support/description bodies of varying length
+
+Daily churn: on each simulated day a policy changes with probability
+``change_rate`` (text edit plus, half of the time, a requirement/region/
+keyword change) and ``new_rate * n`` new policies appear at the end of the
+catalog.
+
+Usage example (print two policies of day 1 as JSON):
+
+    python bench/synthetic.py --n 1000 --day 1 --show 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import csv
+import json
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE_PATH = ROOT / "tools" / "raw_json_example.json"
+VALUES_PATH = ROOT / "tools" / "values.csv"
+
+# 시도 코드 -> (이름, 시군구 수), 시군구 zip = 시도코드 + 110, 120, ...
+PROVINCES: Tuple[Tuple[str, str, int], ...] = (
+    ("11", "서울특별시", 25), ("26", "부산광역시", 16), ("27", "대구광역시", 9),
+    ("28", "인천광역시", 10), ("29", "광주광역시", 5), ("30", "대전광역시", 5),
+    ("31", "울산광역시", 5), ("36", "세종특별자치시", 1), ("41", "경기도", 31),
+    ("43", "충청북도", 11), ("44", "충청남도", 15), ("46", "전라남도", 22),
+    ("47", "경상북도", 22), ("48", "경상남도", 18), ("50", "제주특별자치도", 2),
+    ("51", "강원특별자치도", 18), ("52", "전북특별자치도", 14),
+)
+
+CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "일자리": ("취업", "재직자", "창업"),
+    "주거": ("주택 및 거주지", "기숙사", "전월세 및 주거급여 지원"),
+    "교육": ("미래역량강화", "교육비지원", "온라인교육"),
+    "복지문화": ("취약계층 및 금융지원", "건강", "예술인지원", "문화활동"),
+    "참여권리": ("청년참여", "정책인프라구축", "청년국제교류", "권익보호"),
+}
+
+KEYWORDS: Tuple[str, ...] = (
+    "교육지원", "취업지원", "보조금", "바우처", "인턴", "대출", "금융지원", "주거지원",
+    "장학금", "창업", "맞춤형상담서비스", "해외진출", "중소기업", "공공임대주택", "심리지원",
+    "문화활동", "신용회복", "출산", "육아", "벤처", "장기미취업청년", "청년가장", "자격증",
+    "교통비", "전세자금", "월세지원", "멘토링", "직업훈련", "농업", "귀농", "예술",
+    "스포츠", "봉사", "국제교류", "청년참여", "정책제안", "건강검진", "마음건강", "자산형성",
+    "적금",
+)
+KEYWORD_WEIGHTS = tuple(1.0 / (rank + 1) for rank in range(len(KEYWORDS)))   # Zipf
+RARE_KEYWORD_SHARE = 0.02
+
+NATIONWIDE_SHARE = 0.15
+PROVINCE_WIDE_SHARE = 0.10
+UNRESTRICTED_SHARE = 0.6
+
+# API 필드 -> values.csv 분류 (코드 목록 요건)
+REQUIREMENT_FIELDS = ("schoolCd", "plcyMajorCd", "jobCd", "sbizCd")
+APPLY_TYPES = (("0057001", 0.7), ("0057002", 0.25), ("0057003", 0.05))   # 특정기간 / 상시 / 마감
+
+SENTENCES: Tuple[str, ...] = (
+    "- 지원대상: 관내 거주(주민등록 기준) 19~39세 청년",
+    "- 지원금액: 1인당 월 최대 20만원(최대 12개월)",
+    "- 지원인원: 300명 내외(예산 소진 시 조기 마감)",
+    "- 신청방법: 온라인 신청 후 구비서류 제출",
+    "- 선정방법: 소득 기준 및 거주기간 등을 종합 심사",
+    "- 중복수혜 불가(유사 사업 수혜자 제외)",
+    "- 문의: 담당 부서 청년정책팀",
+    "- 지급방식: 선정자 계좌로 매월 말 지급",
+)
+
+
+@lru_cache(maxsize=1)
+def example_item() -> Dict[str, Any]:
+    with EXAMPLE_PATH.open(encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+@lru_cache(maxsize=1)
+def requirement_codes() -> Dict[str, Tuple[Tuple[str, ...], str]]:
+    """API 필드 -> (제한 코드들, 제한없음 코드)"""
+    out: Dict[str, Tuple[List[str], str]] = {f: ([], "") for f in REQUIREMENT_FIELDS}
+    with VALUES_PATH.open(encoding="utf-8-sig", newline="") as fp:
+        for row in csv.DictReader(fp):
+            field = row["분류(영문)"].strip()
+            if field not in out:
+                continue
+            codes, unrestricted = out[field]
+            if row["ETL값"].strip() == "UNRESTRICTED":
+                out[field] = (codes, row["코드"].strip())
+            else:
+                codes.append(row["코드"].strip())
+    return {f: (tuple(codes), unrestricted) for f, (codes, unrestricted) in out.items()}
+
+
+def province_zips(code: str, count: int) -> Tuple[str, ...]:
+    return tuple(f"{code}{110 + 10 * i:03d}" for i in range(count))
+
+
+ZIPS_BY_PROVINCE: Dict[str, Tuple[str, ...]] = {code: province_zips(code, n) for code, _, n in PROVINCES}
+ALL_ZIPS: Tuple[str, ...] = tuple(z for zips in ZIPS_BY_PROVINCE.values() for z in zips)
+
+
+def master_rows() -> Dict[str, List[Tuple[Any, ...]]]:
+    """
+    Master rows the synthetic catalog refers to, per table:
+    region (code, name, zip_code, full_name, kind), category (code, name, parent_code, level),
+    education/major/job_status/specialization (code, name), keyword (name,) for the vocabulary.
+    """
+    regions = []
+    for code, name, n in PROVINCES:
+        regions.append((code, name, None, name, "PROVINCE"))
+        for i, z in enumerate(province_zips(code, n)):
+            regions.append((z, f"{name[:2]}{i + 1:02d}구", z, f"{name} {name[:2]}{i + 1:02d}구", "CITY"))
+    categories = []
+    for li, (large, mediums) in enumerate(CATEGORIES.items()):
+        categories.append((f"L{li}", large, None, "LARGE"))
+        categories += [(f"L{li}M{mi}", medium, f"L{li}", "MEDIUM") for mi, medium in enumerate(mediums)]
+    lookups = {"schoolCd": "education", "plcyMajorCd": "major", "jobCd": "job_status", "sbizCd": "specialization"}
+    out: Dict[str, List[Tuple[Any, ...]]] = {"region": regions, "category": categories, "keyword": [(k,) for k in KEYWORDS]}
+    with VALUES_PATH.open(encoding="utf-8-sig", newline="") as fp:
+        for row in csv.DictReader(fp):
+            table = lookups.get(row["분류(영문)"].strip())
+            if table:
+                out.setdefault(table, []).append((row["코드"].strip(), row["코드내용"].strip()))
+    return out
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    """Catalog size and churn; policy ``i`` of day ``d`` depends only on these and ``(i, d)``."""
+    n: int
+    seed: int = 42
+    change_rate: float = 0.05   # share of policies changed per day
+    new_rate: float = 0.002     # new policies per day, as a share of n
+
+    def size(self, day: int) -> int:
+        return self.n + int(self.n * self.new_rate) * day
+
+    def version(self, index: int, day: int) -> int:
+        """How many times policy ``index`` changed up to ``day`` (day 0 = initial catalog)."""
+        return sum(
+            1 for d in range(1, day + 1)
+            if random.Random(f"{self.seed}:{index}:day{d}").random() < self.change_rate
+        )
+
+    def policy(self, index: int, day: int = 0) -> Dict[str, Any]:
+        return make_policy(self.seed, index, self.version(index, day))
+
+    def iter_policies(self, day: int = 0, start: int = 0, stop: int | None = None) -> Iterator[Dict[str, Any]]:
+        for index in range(start, min(self.size(day), stop if stop is not None else self.size(day))):
+            yield self.policy(index, day)
+
+    def page(self, page_no: int, page_size: int, day: int = 0) -> List[Dict[str, Any]]:
+        """1-based API page"""
+        start = (page_no - 1) * page_size
+        return list(self.iter_policies(day, start, start + page_size))
+
+    def changed_count(self, day: int) -> int:
+        """Policies whose payload differs between ``day - 1`` and ``day`` (incl. new ones)."""
+        old = self.size(day - 1)
+        return sum(
+            1 for i in range(old)
+            if random.Random(f"{self.seed}:{i}:day{day}").random() < self.change_rate
+        ) + self.size(day) - old
+
+
+def _pick_codes(rnd: random.Random, field: str) -> str:
+    codes, unrestricted = requirement_codes()[field]
+    if rnd.random() < UNRESTRICTED_SHARE or not codes:
+        return unrestricted
+    return ",".join(sorted(rnd.sample(codes, rnd.randint(1, min(3, len(codes))))))
+
+
+def _pick_zips(rnd: random.Random) -> str:
+    r = rnd.random()
+    if r < NATIONWIDE_SHARE:
+        return ",".join(ALL_ZIPS)
+    province = rnd.choice(PROVINCES)[0]
+    zips = ZIPS_BY_PROVINCE[province]
+    if r < NATIONWIDE_SHARE + PROVINCE_WIDE_SHARE:
+        return ",".join(zips)
+    return ",".join(rnd.sample(zips, rnd.randint(1, min(3, len(zips)))))
+
+
+def _pick_keywords(rnd: random.Random, index: int) -> str:
+    words = set(rnd.choices(KEYWORDS, weights=KEYWORD_WEIGHTS, k=rnd.randint(1, 3)))
+    if rnd.random() < RARE_KEYWORD_SHARE:
+        words.add(f"{rnd.choice(KEYWORDS)}{index % 5000}")
+    return ",".join(sorted(words))
+
+
+def _pick_period(rnd: random.Random, item: Dict[str, Any]) -> None:
+    apply_type = rnd.choices([c for c, _ in APPLY_TYPES], weights=[w for _, w in APPLY_TYPES])[0]
+    item["aplyPrdSeCd"] = apply_type
+    if apply_type == "0057001":
+        start = 20250101 + 100 * rnd.randint(0, 11) + rnd.randint(0, 27)
+        end_month = rnd.randint((start // 100) % 100, 12)
+        end = 20250000 + 100 * end_month + rnd.randint(1, 28)
+        item["aplyYmd"] = f"{start} ~ {max(start, end)}"
+    else:
+        item["aplyYmd"] = ""
+
+
+def _body(rnd: random.Random) -> str:
+    return "\n".join(rnd.choices(SENTENCES, k=rnd.randint(2, 12)))
+
+
+def _apply_edit(rnd: random.Random, item: Dict[str, Any], index: int, version: int) -> None:
+    """One daily change: always a text edit, half of the time also requirements/regions/keywords."""
+    item["plcySprtCn"] = f"{item['plcySprtCn']}\n- 변경 {version}: {rnd.choice(SENTENCES)[2:]}"
+    item["lastMdfcnDt"] = f"2025-10-{min(28, version):02d} {rnd.randint(9, 18):02d}:{rnd.randint(0, 59):02d}:00"
+    if rnd.random() < 0.5:
+        kind = rnd.randrange(3)
+        if kind == 0:
+            field = rnd.choice(REQUIREMENT_FIELDS)
+            item[field] = _pick_codes(rnd, field)
+        elif kind == 1:
+            item["zipCd"] = _pick_zips(rnd)
+        else:
+            item["plcyKywdNm"] = _pick_keywords(rnd, index)
+
+
+def make_policy(seed: int, index: int, version: int = 0) -> Dict[str, Any]:
+    """Policy ``index`` after ``version`` daily changes (deterministic)."""
+    rnd = random.Random(f"{seed}:{index}")
+    item = copy.deepcopy(example_item())
+    item["plcyNo"] = f"2025{index:016d}"
+    large = rnd.choice(tuple(CATEGORIES))
+    mediums = CATEGORIES[large]
+    item["lclsfNm"] = large
+    item["mclsfNm"] = ",".join(rnd.sample(mediums, 2 if rnd.random() < 0.1 else 1))
+    item["plcyNm"] = f"{rnd.choice(PROVINCES)[1]} 청년 {item['mclsfNm'].split(',')[0]} 지원사업 {index}"
+    item["plcyKywdNm"] = _pick_keywords(rnd, index)
+    item["zipCd"] = _pick_zips(rnd)
+    for field in REQUIREMENT_FIELDS:
+        item[field] = _pick_codes(rnd, field)
+    _pick_period(rnd, item)
+    min_age = rnd.choice((0, 15, 18, 19))
+    item["sprtTrgtMinAge"], item["sprtTrgtMaxAge"] = str(min_age), str(rnd.choice((29, 34, 39, 45)))
+    item["sprtTrgtAgeLmtYn"] = "Y" if min_age == 0 else "N"
+    item["earnMaxAmt"] = str(rnd.choice((0, 0, 3000, 5000)))
+    item["inqCnt"] = str(rnd.randint(0, 50000))
+    item["plcySprtCn"] = _body(rnd)
+    item["plcyExplnCn"] = _body(rnd)
+    for v in range(1, version + 1):
+        _apply_edit(random.Random(f"{seed}:{index}:v{v}"), item, index, v)
+    return item
+
+
+def api_page(spec: CatalogSpec, page_no: int, page_size: int, day: int = 0) -> Dict[str, Any]:
+    """Response body in the youthcenter shape that raw_ingest / stg_landing read."""
+    return {
+        "resultCode": 200,
+        "resultMessage": "성공",
+        "result": {
+            "paging": {"totCount": spec.size(day), "pageNum": page_no, "pageSize": page_size},
+            "youthPolicyList": spec.page(page_no, page_size, day),
+        },
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=1000)
+    parser.add_argument("--day", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--change-rate", type=float, default=0.05)
+    parser.add_argument("--show", type=int, default=1, help="number of policies to print")
+    args = parser.parse_args(argv)
+
+    spec = CatalogSpec(args.n, args.seed, args.change_rate)
+    for item in spec.iter_policies(args.day, 0, args.show):
+        print(json.dumps(item, ensure_ascii=False, indent=2))
+    print(f"# size={spec.size(args.day):,} changed_on_day={spec.changed_count(args.day) if args.day else spec.size(0):,}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
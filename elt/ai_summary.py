@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+ai_summary.py
+- core.policy.summary_ai 비동기 채움 워커 (core 동기화와 별도 프로세스로 실행)
+- 요약 대상 텍스트(plcyNm, plcyExplnCn, plcySprtCn)의 해시를 키로 meta.ai_summary_cache에 저장
+  -> 텍스트가 바뀌지 않은 정책은 다시 요약하지 않고 캐시에서 바로 반영
+- 캐시에 없는 텍스트만 배치로 묶어 모델 호출, 동시 호출 수 제한
+- core.policy.summary_content_hash = 요약을 마지막으로 맞춘 시점의 content_hash
+  -> content_hash와 다른 정책(신규/변경)만 해시 계산/조회, 바뀐 정책이 없으면 전체 스캔 없음
+- 모델은 교체 가능: 기본 'stub'(로컬, 외부 호출 없음) 또는 'package.module:factory'
+
+흐름:
+  1) 변경된 정책 중 캐시에 있는 요약을 core.policy에 일괄 반영 (+ summary_content_hash 갱신)
+  2) 남은 변경 정책의 텍스트 해시 목록 조회 (해시 중복 제거)
+  3) AI_SUMMARY_BATCH_SIZE 건씩 모델 호출 (최대 AI_SUMMARY_CONCURRENCY개 동시)
+     배치마다 캐시 저장 + 해당 정책 반영 후 커밋 (중단/실패분은 변경 상태로 남아 다음 실행에서 처리)
+
+ENV (.env 권장):
+  PG_DSN=postgresql://<user>:<pass>@<host>:<port>/<db>
+  AI_SUMMARY_MODEL=stub             # stub | package.module:factory
+  AI_SUMMARY_BATCH_SIZE=16          # 모델 호출 1회당 텍스트 수
+  AI_SUMMARY_CONCURRENCY=4          # 동시 모델 호출 수
+  AI_SUMMARY_LIMIT=0                # 1회 실행 시 요약할 최대 텍스트 수 (0 = 전체)
+  AI_SUMMARY_STUB_DELAY_MS=0        # stub 모델 인위 지연 (부하 테스트용)
+  LOG_LEVEL=INFO
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, Protocol, Sequence, Tuple
+
+import psycopg
+
+try:
+    from dotenv import load_dotenv  # optional
+    load_dotenv()
+except Exception:
+    pass
+
+# ------------ ENV ------------
+def env_str(name: str, default: str | None = None) -> str:
+    v = os.getenv(name, default)
+    if v is None or v == "":
+        raise RuntimeError(f"Missing environment variable: {name}")
+    return v
+
+def env_int(name: str, default: int) -> int:
+    v = os.getenv(name)
+    return int(v) if v not in (None, "") else default
+
+PG_DSN = env_str("PG_DSN")
+AI_SUMMARY_MODEL = os.getenv("AI_SUMMARY_MODEL", "stub")
+AI_SUMMARY_BATCH_SIZE = max(1, env_int("AI_SUMMARY_BATCH_SIZE", 16))
+AI_SUMMARY_CONCURRENCY = max(1, env_int("AI_SUMMARY_CONCURRENCY", 4))
+AI_SUMMARY_LIMIT = env_int("AI_SUMMARY_LIMIT", 0)
+AI_SUMMARY_STUB_DELAY_MS = env_int("AI_SUMMARY_STUB_DELAY_MS", 0)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+logging.basicConfig(
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    format="%(asctime)s %(levelname)s ai_summary :: %(message)s",
+)
+log = logging.getLogger("ai_summary")
+
+# ------------ Bootstrap ------------
+BOOTSTRAP_SQL = """
+create schema if not exists meta;
+
+create table if not exists meta.ai_summary_cache (
+  text_hash  char(64)    primary key,   -- sha256(plcyNm | plcyExplnCn | plcySprtCn)
+  summary    text        not null,
+  model      text        not null,
+  created_at timestamptz not null default now()
+);
+
+-- 요약을 마지막으로 맞춘 시점의 content_hash (다르면 처리 대상)
+alter table core.policy add column if not exists summary_content_hash text;
+create index if not exists ix_policy_summary_stale on core.policy(id)
+  where summary_content_hash is distinct from content_hash;
+"""
+
+def bootstrap(conn: psycopg.Connection) -> None:
+    with conn.cursor() as cur:
+        cur.execute(BOOTSTRAP_SQL)
+    conn.commit()
+    log.info("Bootstrap: meta.ai_summary_cache, core.policy.summary_content_hash ready")
+
+# 요약 대상 텍스트 해시 (필드 구분자 U+001F, 없는 필드는 빈 문자열)
+# - STALE_SQL(summary_content_hash != content_hash)로 거른 정책에만 계산
+TEXT_HASH_SQL = """
+encode(sha256(convert_to(concat_ws(E'\\x1f',
+    coalesce(p.payload->>'plcyNm', ''),
+    coalesce(p.payload->>'plcyExplnCn', ''),
+    coalesce(p.payload->>'plcySprtCn', '')), 'UTF8')), 'hex')
+"""
+
+# 요약을 아직 맞추지 않은 정책 (ix_policy_summary_stale 부분 인덱스와 같은 조건)
+STALE_SQL = "p.summary_content_hash is distinct from p.content_hash"
+
+# ------------ Model ------------
+@dataclass(frozen=True)
+class SummaryRequest:
+    text_hash: str
+    title: str
+    explanation: str
+    support: str
+    policy_ids: Tuple[str, ...] = ()   # 이 텍스트를 가진 정책 (저장 시 이 정책만 반영)
+
+
+class SummaryModel(Protocol):
+    name: str
+
+    async def summarize(self, batch: Sequence[SummaryRequest]) -> List[str]:
+        """batch와 같은 순서로 요약문 반환"""
+        ...
+
+
+class StubModel:
+    """로컬 스텁: 제목 + 설명 첫 문장 (외부 호출 없음, 결과 결정적)"""
+    name = "stub-v1"
+
+    def __init__(self, delay_ms: int = AI_SUMMARY_STUB_DELAY_MS, max_chars: int = 200) -> None:
+        self.delay_ms = delay_ms
+        self.max_chars = max_chars
+
+    async def summarize(self, batch: Sequence[SummaryRequest]) -> List[str]:
+        if self.delay_ms > 0:
+            await asyncio.sleep(self.delay_ms / 1000)
+        out = []
+        for req in batch:
+            body = " ".join((req.explanation or req.support).split())
+            first = body.split(". ")[0]
+            out.append(f"{req.title.strip()}: {first}"[: self.max_chars] if first else req.title.strip())
+        return out
+
+
+def load_model(spec: str = AI_SUMMARY_MODEL) -> SummaryModel:
+    """'stub' 또는 'package.module:factory' (factory()가 SummaryModel 반환)"""
+    if spec == "stub":
+        return StubModel()
+    module_name, sep, attr = spec.partition(":")
+    if not sep:
+        raise RuntimeError(f"Invalid AI_SUMMARY_MODEL (expected 'stub' or 'module:factory'): {spec}")
+    return getattr(importlib.import_module(module_name), attr)()
+
+# ------------ Core ------------
+async def apply_cached(conn: psycopg.AsyncConnection, policy_ids: Optional[List[str]] = None) -> int:
+    """
+    변경된 정책(STALE_SQL)에 캐시된 요약을 반영하고 summary_content_hash를 맞춤.
+    검색 벡터는 요약이 실제로 바뀐 정책만 다시 계산.
+    policy_ids 지정 시 그중 해당 정책만 (PK 조회).
+    """
+    only = "and p.id = any(%s)" if policy_ids is not None else ""
+    async with conn.cursor() as cur:
+        await cur.execute(f"""
+            update core.policy p
+               set summary_ai = c.summary,
+                   search_tsv = case when p.summary_ai is distinct from c.summary
+                                     then core.policy_search_tsv(p.title, p.summary_raw, p.description_raw, c.summary)
+                                     else p.search_tsv end,
+                   summary_content_hash = p.content_hash
+              from meta.ai_summary_cache c
+             where {STALE_SQL}
+               and c.text_hash = {TEXT_HASH_SQL}
+               {only}
+        """, (policy_ids,) if policy_ids is not None else None)
+        return cur.rowcount
+
+async def fetch_pending(conn: psycopg.AsyncConnection, limit: int = AI_SUMMARY_LIMIT) -> List[SummaryRequest]:
+    """변경된 정책 중 캐시에 없는 텍스트 (해시 기준 중복 제거, 같은 텍스트를 가진 정책 id 목록 포함)"""
+    async with conn.cursor() as cur:
+        await cur.execute(f"""
+            select h.text_hash, h.title, h.explanation, h.support,
+                   array_agg(h.id order by h.id)
+              from (select {TEXT_HASH_SQL} as text_hash,
+                           coalesce(p.payload->>'plcyNm', '') as title,
+                           coalesce(p.payload->>'plcyExplnCn', '') as explanation,
+                           coalesce(p.payload->>'plcySprtCn', '') as support,
+                           p.id
+                      from core.policy p
+                     where {STALE_SQL}) h
+             where not exists (select 1 from meta.ai_summary_cache c where c.text_hash = h.text_hash)
+             group by h.text_hash, h.title, h.explanation, h.support   -- 같은 해시 = 같은 텍스트
+             order by h.text_hash
+             {"limit %s" if limit > 0 else ""}
+        """, (limit,) if limit > 0 else None)
+        return [SummaryRequest(*r[:4], policy_ids=tuple(r[4])) for r in await cur.fetchall()]
+
+async def store_batch(conn: psycopg.AsyncConnection, model_name: str, batch: Sequence[SummaryRequest], summaries: List[str]) -> int:
+    async with conn.transaction():
+        async with conn.cursor() as cur:
+            await cur.execute("""
+                insert into meta.ai_summary_cache (text_hash, summary, model)
+                select * from unnest(%s::text[], %s::text[], %s::text[])
+                on conflict (text_hash) do nothing
+            """, ([r.text_hash for r in batch], summaries, [model_name] * len(batch)))
+        return await apply_cached(conn, [pid for r in batch for pid in r.policy_ids])
+
+async def summarize_pending(conn: psycopg.AsyncConnection, model: SummaryModel,
+                            batch_size: int = AI_SUMMARY_BATCH_SIZE,
+                            concurrency: int = AI_SUMMARY_CONCURRENCY,
+                            limit: int = AI_SUMMARY_LIMIT) -> Tuple[int, int, int]:
+    """반환: (요약한 텍스트 수, 반영된 정책 수, 실패한 배치 수)"""
+    pending = await fetch_pending(conn, limit)
+    await conn.commit()
+    if not pending:
+        return 0, 0, 0
+
+    sem = asyncio.Semaphore(concurrency)
+    db_lock = asyncio.Lock()   # 커넥션 하나를 배치 저장에 순차 사용
+    summarized = applied = failed = 0
+
+    async def run_batch(batch: List[SummaryRequest]) -> None:
+        nonlocal summarized, applied, failed
+        async with sem:
+            try:
+                summaries = await model.summarize(batch)
+                if len(summaries) != len(batch):
+                    raise RuntimeError(f"model returned {len(summaries)} summaries for {len(batch)} texts")
+            except Exception:
+                failed += 1
+                log.exception("Summary batch failed (%s texts), retried on next run", len(batch))
+                return
+        async with db_lock:
+            applied += await store_batch(conn, model.name, batch, summaries)
+            summarized += len(batch)
+
+    batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+    await asyncio.gather(*(run_batch(b) for b in batches))
+    return summarized, applied, failed
+
+async def run(model: Optional[SummaryModel] = None) -> int:
+    model = model or load_model()
+    started = time.monotonic()
+    async with await psycopg.AsyncConnection.connect(PG_DSN) as conn:
+        async with conn.transaction():
+            from_cache = await apply_cached(conn)
+        summarized, applied, failed = await summarize_pending(conn, model)
+    log.info("AI summary done: model=%s from_cache=%s summarized=%s applied=%s failed_batches=%s elapsed=%.1fs",
+             model.name, from_cache, summarized, applied, failed, time.monotonic() - started)
+    return 1 if failed else 0
+
+def main() -> None:
+    log.info("AI summary start (model=%s, batch=%s, concurrency=%s, limit=%s)",
+             AI_SUMMARY_MODEL, AI_SUMMARY_BATCH_SIZE, AI_SUMMARY_CONCURRENCY, AI_SUMMARY_LIMIT)
+    with psycopg.connect(PG_DSN) as conn:
+        bootstrap(conn)
+    raise SystemExit(asyncio.run(run()))
+
+if __name__ == "__main__":
+    main()
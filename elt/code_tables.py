@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+code_tables.py
+- 청년정책 API 코드값 -> core 테이블 enum 값 매핑을 한 곳에서 관리합니다.
+- 매핑 원본은 tools/values.csv 의 'ETL값' 컬럼입니다. (비어 있으면 매핑 없음 -> UNKNOWN)
+- 학력/전공/취업/특화 요건의 '제한없음' 코드는 ETL값=UNRESTRICTED 로 표시합니다.
+
+ENV (.env 권장):
+  CODE_VALUES_CSV=tools/values.csv   # 선택(기본: 저장소의 tools/values.csv)
+"""
+
+import csv
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+DEFAULT_VALUES_PATH = Path(__file__).resolve().parent.parent / "tools" / "values.csv"
+
+FIELD_COLUMN = "분류(영문)"
+CODE_COLUMN = "코드"
+ENUM_COLUMN = "ETL값"
+
+UNKNOWN = "UNKNOWN"
+UNRESTRICTED = "UNRESTRICTED"
+
+
+def load_code_enums(path: Path) -> Dict[str, Dict[str, str]]:
+    """values.csv -> {필드명(소문자): {코드: enum}}"""
+    if not path.exists():
+        raise FileNotFoundError(f"Value mapping CSV not found: {path}")
+
+    tables: Dict[str, Dict[str, str]] = {}
+    with path.open("r", encoding="utf-8-sig", newline="") as fp:
+        for row in csv.DictReader(fp):
+            field = (row.get(FIELD_COLUMN) or "").strip()
+            code = (row.get(CODE_COLUMN) or "").strip()
+            enum = (row.get(ENUM_COLUMN) or "").strip()
+            if not field or not code or not enum:
+                continue
+            tables.setdefault(field.lower(), {})[code] = enum
+    return tables
+
+
+CODE_ENUMS: Dict[str, Dict[str, str]] = load_code_enums(
+    Path(os.getenv("CODE_VALUES_CSV") or DEFAULT_VALUES_PATH)
+)
+
+
+def code_table(field: str) -> Dict[str, str]:
+    """필드의 코드 -> enum 테이블 (API 필드명 대소문자 차이 허용, 예: bizPrdSeCd / bizPrdSecd)"""
+    return CODE_ENUMS.get(field.lower(), {})
+
+
+def code_enum(field: str, code: Any) -> str:
+    if not isinstance(code, str):
+        return UNKNOWN
+    return code_table(field).get(code, UNKNOWN)
+
+
+def is_restricted(field: str, code: Any) -> bool:
+    """'제한없음' 코드 하나만 지정된 경우에만 False"""
+    if not isinstance(code, str):
+        return True
+    return code_table(field).get(code) != UNRESTRICTED
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+etl_metrics.py
+- ETL 단계(raw / landing / current / core)별 세부 단계(step) 계측 공용 모듈
+- step마다 소요 시간, 입력/출력 건수, INSERT/UPDATE/DELETE 건수, 바이트, DB 왕복 수, 성공 여부 기록
+  * 같은 step을 여러 번 실행하면(페이지/배치 반복) 한 행으로 누적 (calls = 실행 횟수)
+  * DB 왕복 수 = 실행한 SQL 문장 수 (execute/executemany/COPY 각 1회, 서버 커서 fetch 1회)
+  * 스레드별로 측정하므로 서로 다른 step을 여러 스레드에서 동시에 실행해도 됨 (stg_to_core 브릿지 병렬 동기화)
+- 실행 종료 시 두 곳으로 내보냄
+  1) meta.etl_stage_stats (실행 이력, stg_to_core --plan 예상 시간 산출에도 사용)
+  2) Prometheus textfile collector 형식 파일 (ETL_METRICS_DIR/<stage>.prom, 마지막 실행 값)
+- add_statement_listener: 계측 커서의 문장별 소요 시간 관찰 훅 (profiling.py PROFILE=sql)
+
+사용 예:
+  METRICS = StageMetrics("landing")
+  instrument(conn)                        # psycopg Connection (SQLAlchemy는 instrument_engine)
+  with METRICS.step("upsert_landing", rows_in=len(items)) as st:
+      ...
+      st.rows_out += cur.rowcount
+      st.bytes += n_bytes
+  METRICS.flush(conn)
+
+ENV (.env 권장):
+  ETL_RUN_ID=<uuid>           # 선택: 여러 단계를 한 실행으로 묶을 때 (기본: 프로세스마다 새 uuid)
+  ETL_METRICS_DB=1            # 1 = meta.etl_stage_stats 기록
+  ETL_METRICS_DIR=            # Prometheus textfile 디렉터리 (비우면 파일 미작성)
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import psycopg
+
+log = logging.getLogger("etl_metrics")
+
+RUN_ID = os.getenv("ETL_RUN_ID") or str(uuid.uuid4())
+ETL_METRICS_DB = os.getenv("ETL_METRICS_DB", "1") == "1"
+ETL_METRICS_DIR = os.getenv("ETL_METRICS_DIR") or None
+
+METRIC_PREFIX = "youthpolicy_etl"
+
+# ------------ Bootstrap ------------
+BOOTSTRAP_SQL = """
+create schema if not exists meta;
+
+-- ETL step별 실행 기록 (etl_metrics)
+create table if not exists meta.etl_stage_stats (
+  id          bigint      generated always as identity primary key,
+  run_id      uuid        not null,
+  recorded_at timestamptz not null default now(),
+  stage       text        not null,   -- raw | landing | current | core
+  step        text        not null,   -- fetch_page, upsert_landing, policy, policy_region, ...
+  ok          boolean     not null default true,
+  calls       int         not null default 1,
+  rows_in     bigint      not null default 0,
+  rows_out    bigint      not null default 0,
+  inserted    bigint      not null default 0,
+  updated     bigint      not null default 0,
+  deleted     bigint      not null default 0,
+  bytes       bigint      not null default 0,
+  round_trips bigint      not null default 0,
+  seconds     float8      not null
+);
+create index if not exists idx_etl_stage_stats_step on meta.etl_stage_stats(stage, step, id desc);
+"""
+
+def bootstrap(conn: psycopg.Connection) -> None:
+    with conn.cursor() as cur:
+        cur.execute(BOOTSTRAP_SQL)
+    conn.commit()
+
+# ------------ DB 왕복 수 ------------
+_local = threading.local()
+
+def round_trips() -> int:
+    """현재 스레드에서 지금까지 실행한 SQL 문장 수"""
+    return getattr(_local, "round_trips", 0)
+
+def _count(n: int = 1) -> None:
+    _local.round_trips = round_trips() + n
+
+# ------------ SQL 문장 관찰 (profiling PROFILE=sql) ------------
+# listener(cursor, kind, query, params, seconds): 성공한 문장마다 호출 (kind = execute | executemany | copy | fetch)
+StatementListener = Callable[[psycopg.Cursor, str, Any, Any, float], None]
+_statement_listeners: List[StatementListener] = []
+
+def add_statement_listener(fn: StatementListener) -> None:
+    _statement_listeners.append(fn)
+
+def remove_statement_listener(fn: StatementListener) -> None:
+    if fn in _statement_listeners:
+        _statement_listeners.remove(fn)
+
+def _observed(cursor: psycopg.Cursor, kind: str, run: Callable[[], Any], query: Any, params: Any = None) -> Any:
+    """run() 실행, listener가 있으면 소요 시간과 함께 알림 (없으면 시간 측정도 생략)"""
+    if not _statement_listeners:
+        return run()
+    t0 = time.perf_counter()
+    result = run()
+    seconds = time.perf_counter() - t0
+    for fn in list(_statement_listeners):
+        fn(cursor, kind, query, params, seconds)
+    return result
+
+
+class CountingCursor(psycopg.Cursor):
+    def execute(self, query: Any, params: Any = None, **kwargs: Any):
+        _count()
+        return _observed(self, "execute", lambda: super(CountingCursor, self).execute(query, params, **kwargs), query, params)
+
+    def executemany(self, query: Any, params_seq: Any, **kwargs: Any):
+        _count()   # psycopg 3는 파이프라인으로 한 번에 전송
+        return _observed(self, "executemany", lambda: super(CountingCursor, self).executemany(query, params_seq, **kwargs), query)
+
+    @contextmanager
+    def copy(self, statement: Any, params: Any = None, **kwargs: Any) -> Iterator[Any]:
+        _count()
+        t0 = time.perf_counter()
+        with super().copy(statement, params, **kwargs) as cp:
+            yield cp
+        # COPY는 블록 전체(데이터 전송 포함) 시간
+        seconds = time.perf_counter() - t0
+        for fn in list(_statement_listeners):
+            fn(self, "copy", statement, None, seconds)
+
+
+class CountingServerCursor(psycopg.ServerCursor):
+    def execute(self, query: Any, params: Any = None, **kwargs: Any):
+        _count()
+        return _observed(self, "execute", lambda: super(CountingServerCursor, self).execute(query, params, **kwargs), query, params)
+
+    def fetchmany(self, *args: Any, **kwargs: Any):
+        _count()
+        return _observed(self, "fetch", lambda: super(CountingServerCursor, self).fetchmany(*args, **kwargs), f"FETCH FROM {self.name}")
+
+    def fetchall(self, *args: Any, **kwargs: Any):
+        _count()
+        return _observed(self, "fetch", lambda: super(CountingServerCursor, self).fetchall(*args, **kwargs), f"FETCH ALL FROM {self.name}")
+
+
+def instrument(conn: psycopg.Connection) -> psycopg.Connection:
+    """psycopg Connection의 커서가 DB 왕복 수를 세도록 설정"""
+    conn.cursor_factory = CountingCursor
+    conn.server_cursor_factory = CountingServerCursor
+    return conn
+
+def instrument_engine(engine: Any) -> Any:
+    """SQLAlchemy Engine(postgresql+psycopg)이 새로 여는 커넥션마다 instrument 적용"""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        instrument(dbapi_connection)
+
+    return engine
+
+# ------------ Stats ------------
+@dataclass
+class StepStats:
+    stage: str
+    step: str
+    ok: bool = True
+    calls: int = 0
+    rows_in: int = 0
+    rows_out: int = 0
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    bytes: int = 0
+    round_trips: int = 0
+    seconds: float = 0.0
+
+    def add_counts(self, counts: Dict[str, Any]) -> None:
+        """sync_* 반환값({"inserted", "updated", "deleted", ...}) 누적, rows_out = 변경 건수 합"""
+        for key in ("inserted", "updated", "deleted"):
+            n = int(counts.get(key) or 0)
+            setattr(self, key, getattr(self, key) + n)
+            self.rows_out += n
+
+
+@dataclass
+class StageMetrics:
+    """ETL 단계 하나(스크립트 하나)의 step별 계측값"""
+    stage: str
+    run_id: str = RUN_ID
+    steps: Dict[str, StepStats] = field(default_factory=dict)
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+    _lock: Any = field(default_factory=threading.Lock, repr=False)
+
+    def _active(self) -> List[StepStats]:
+        """현재 스레드에서 실행 중인 step 스택"""
+        stack = getattr(self._local, "active", None)
+        if stack is None:
+            stack = self._local.active = []
+        return stack
+
+    @contextmanager
+    def step(self, name: str, rows_in: int = 0) -> Iterator[StepStats]:
+        """
+        name step의 시간/DB 왕복 수 측정, 건수/바이트는 yield된 StepStats에 호출자가 더함.
+        예외 발생 시 ok=False로 기록하고 예외는 그대로 전달.
+        같은 step을 여러 스레드에서 동시에 실행하지는 않는다고 가정 (step이 다르면 무관).
+        """
+        with self._lock:
+            st = self.steps.get(name)
+            if st is None:
+                st = self.steps[name] = StepStats(self.stage, name)
+            st.calls += 1
+            st.rows_in += rows_in
+        rt0, t0 = round_trips(), time.perf_counter()
+        active = self._active()
+        active.append(st)
+        try:
+            yield st
+        except BaseException:
+            st.ok = False
+            raise
+        finally:
+            active.pop()
+            st.seconds += time.perf_counter() - t0
+            st.round_trips += round_trips() - rt0
+
+    def add(self, **counts: int) -> None:
+        """현재 스레드에서 실행 중인 가장 안쪽 step에 건수/바이트 누적 (step 밖에서 호출되면 무시)"""
+        active = self._active()
+        if not active:
+            return
+        st = active[-1]
+        for key, n in counts.items():
+            setattr(st, key, getattr(st, key) + n)
+
+    def merge(self, steps: Iterable[StepStats]) -> None:
+        """다른 프로세스(샤드 워커)가 계측한 step 값을 같은 이름의 step에 합산"""
+        with self._lock:
+            for other in steps:
+                st = self.steps.get(other.step)
+                if st is None:
+                    st = self.steps[other.step] = StepStats(self.stage, other.step)
+                st.ok = st.ok and other.ok
+                for key in ("calls", "rows_in", "rows_out", "inserted", "updated", "deleted", "bytes", "round_trips", "seconds"):
+                    setattr(st, key, getattr(st, key) + getattr(other, key))
+
+    def rows(self) -> List[StepStats]:
+        with self._lock:
+            return list(self.steps.values())
+
+    def save(self, conn: psycopg.Connection) -> int:
+        """meta.etl_stage_stats에 step별 한 행씩 기록 (커밋은 호출자)"""
+        rows = self.rows()
+        if not rows:
+            return 0
+        with conn.cursor() as cur:
+            cur.executemany(
+                """
+                insert into meta.etl_stage_stats
+                    (run_id, stage, step, ok, calls, rows_in, rows_out, inserted, updated, deleted, bytes, round_trips, seconds)
+                values (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                [(self.run_id, s.stage, s.step, s.ok, s.calls, s.rows_in, s.rows_out,
+                  s.inserted, s.updated, s.deleted, s.bytes, s.round_trips, s.seconds) for s in rows],
+            )
+        return len(rows)
+
+    def render_textfile(self) -> str:
+        """Prometheus 텍스트 형식 (node_exporter textfile collector)"""
+        gauges = (
+            ("step_seconds", "seconds", "Wall time spent in the ETL step during the last run"),
+            ("step_calls", "calls", "Number of times the ETL step ran during the last run"),
+            ("step_rows_in", "rows_in", "Rows read by the ETL step during the last run"),
+            ("step_rows_out", "rows_out", "Rows written or changed by the ETL step during the last run"),
+            ("step_inserted_rows", "inserted", "Rows inserted by the ETL step during the last run"),
+            ("step_updated_rows", "updated", "Rows updated by the ETL step during the last run"),
+            ("step_deleted_rows", "deleted", "Rows deleted by the ETL step during the last run"),
+            ("step_bytes", "bytes", "Payload bytes handled by the ETL step during the last run"),
+            ("step_round_trips", "round_trips", "SQL statements executed by the ETL step during the last run"),
+            ("step_success", "ok", "1 if the ETL step finished without error during the last run"),
+        )
+        rows = self.rows()
+        lines: List[str] = []
+        for name, attr, help_text in gauges:
+            metric = f"{METRIC_PREFIX}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+            for s in rows:
+                value = getattr(s, attr)
+                lines.append(f'{metric}{{stage="{_label(s.stage)}",step="{_label(s.step)}"}} {float(value):g}')
+        metric = f"{METRIC_PREFIX}_last_run_timestamp_seconds"
+        lines += [
+            f"# HELP {metric} Unix time the ETL stage started its last run",
+            f"# TYPE {metric} gauge",
+            f'{metric}{{stage="{_label(self.stage)}"}} {self.started_at.timestamp():.0f}',
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, directory: Optional[str] = ETL_METRICS_DIR) -> Optional[str]:
+        """directory/<stage>.prom 원자적 교체 (임시 파일 작성 후 rename)"""
+        if not directory:
+            return None
+        path = os.path.join(directory, f"{self.stage}.prom")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render_textfile())
+        os.replace(tmp, path)
+        return path
+
+    def flush(self, conn: Optional[psycopg.Connection]) -> None:
+        """
+        meta.etl_stage_stats 기록(ETL_METRICS_DB=1, 커밋 포함) + textfile 작성.
+        실패해도 ETL 결과에는 영향 없도록 경고만 남김 (실패한 실행의 finally에서도 호출)
+        """
+        if ETL_METRICS_DB and conn is not None:
+            try:
+                if conn.info.transaction_status == psycopg.pq.TransactionStatus.INERROR:
+                    conn.rollback()
+                self.save(conn)
+                conn.commit()
+            except Exception:
+                log.warning("Failed to record %s stats into meta.etl_stage_stats", self.stage, exc_info=True)
+        try:
+            self.write_textfile()
+        except OSError:
+            log.warning("Failed to write %s metrics textfile", self.stage, exc_info=True)
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{s.step}={s.seconds:.2f}s/{s.rows_in}->{s.rows_out}/rt={s.round_trips}" for s in self.rows()
+        )
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
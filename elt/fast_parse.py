@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+fast_parse.py
+- 청년정책 API 날짜/기간 문자열 파서 (stg_to_core 정규화용)
+- 고정 형식은 문자열 슬라이싱으로 바로 date/datetime 생성 (strptime 미사용)
+- 같은 값(마감일, "20250101 ~ 20251210" 같은 신청기간)이 정책마다 반복되므로
+  원본 문자열 기준 LRU 캐시 적용
+- 형식이 어긋난 값(빈 문자열, 리스트/숫자, 잘못된 날짜, 구분자 누락 등)은 예외 없이 None
+
+지원 형식:
+  날짜      : "YYYYMMDD", "YYYY-MM-DD"            (bizPrdBgngYmd, bizPrdEndYmd)
+  기간      : "YYYYMMDD ~ YYYYMMDD"               (aplyYmd)
+  일시(KST) : "YYYY-MM-DD HH:MM:SS"               (lastMdfcnDt, frstRegDt)
+  * 자릿수가 다른 값(예: "2024-8-1 9:00:00")은 strptime으로 한 번 더 시도
+
+ENV (.env 권장):
+  FAST_PARSE_CACHE_SIZE=4096   # 파서별 LRU 캐시 크기, 0 = 캐시 미사용
+"""
+
+import os
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+KST = timezone(timedelta(hours=9))
+
+FAST_PARSE_CACHE_SIZE = int(os.getenv("FAST_PARSE_CACHE_SIZE") or 4096)
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _digits(s: str) -> bool:
+    return s.isascii() and s.isdigit()
+
+
+def _ymd(s: str) -> Optional[date]:
+    if len(s) == 8 and _digits(s):
+        y, m, d = s[0:4], s[4:6], s[6:8]
+    elif len(s) == 10 and s[4] == "-" and s[7] == "-":
+        y, m, d = s[0:4], s[5:7], s[8:10]
+        if not _digits(y + m + d):
+            return None
+    else:
+        return None
+    try:
+        return date(int(y), int(m), int(d))
+    except ValueError:      # 20250230 등 존재하지 않는 날짜
+        return None
+
+
+def _parse_date(s: str) -> Optional[date]:
+    return _ymd(s.strip())
+
+
+def _parse_period(s: str) -> Tuple[Optional[date], Optional[date]]:
+    parts = s.split("~")
+    if len(parts) != 2:
+        return None, None
+    start, end = _ymd(parts[0].strip()), _ymd(parts[1].strip())
+    if start is None or end is None:
+        return None, None
+    return start, end
+
+
+def _parse_datetime_kst(s: str) -> Optional[datetime]:
+    s = s.strip()
+    if (
+        len(s) == 19
+        and s[4] == "-" and s[7] == "-" and s[10] == " " and s[13] == ":" and s[16] == ":"
+        and _digits(s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19])
+    ):
+        try:
+            return datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]), tzinfo=KST,
+            )
+        except ValueError:
+            return None
+    # 자릿수가 다른 값 등은 기존과 같이 strptime으로 해석
+    try:
+        return datetime.strptime(s, DATETIME_FORMAT).replace(tzinfo=KST)
+    except ValueError:
+        return None
+
+
+if FAST_PARSE_CACHE_SIZE > 0:
+    _parse_date = lru_cache(maxsize=FAST_PARSE_CACHE_SIZE)(_parse_date)
+    _parse_period = lru_cache(maxsize=FAST_PARSE_CACHE_SIZE)(_parse_period)
+    _parse_datetime_kst = lru_cache(maxsize=FAST_PARSE_CACHE_SIZE)(_parse_datetime_kst)
+
+
+# ---------- 공개 함수 (str 외 입력은 캐시 키로 쓰지 않고 바로 None) ----------
+
+def parse_date(value: Any) -> Optional[date]:
+    """YYYYMMDD / YYYY-MM-DD -> date, 그 외 None"""
+    if not isinstance(value, str) or not value:
+        return None
+    return _parse_date(value)
+
+
+def parse_period(value: Any) -> Tuple[Optional[date], Optional[date]]:
+    """YYYYMMDD ~ YYYYMMDD -> (시작, 종료), 둘 중 하나라도 실패하면 (None, None)"""
+    if not isinstance(value, str) or not value:
+        return None, None
+    return _parse_period(value)
+
+
+def parse_datetime_kst(value: Any) -> Optional[datetime]:
+    """YYYY-MM-DD HH:MM:SS -> KST datetime, 그 외 None"""
+    if not isinstance(value, str) or not value:
+        return None
+    return _parse_datetime_kst(value)
+
+
+def cache_info() -> dict:
+    """파서별 캐시 적중/미스 (캐시 미사용이면 빈 dict)"""
+    if FAST_PARSE_CACHE_SIZE <= 0:
+        return {}
+    return {
+        "date": _parse_date.cache_info(),
+        "period": _parse_period.cache_info(),
+        "datetime_kst": _parse_datetime_kst.cache_info(),
+    }
+
+
+def cache_clear() -> None:
+    if FAST_PARSE_CACHE_SIZE > 0:
+        _parse_date.cache_clear()
+        _parse_period.cache_clear()
+        _parse_datetime_kst.cache_clear()
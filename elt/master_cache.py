@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+master_cache.py
+- master.* 룩업 테이블(코드 -> id, 우편번호 -> 지역명 등)을 프로세스 전역으로 캐시합니다.
+- 테이블별 버전(row 수, max(id), max(updated_at))을 한 번의 쿼리로 확인하여
+  바뀐 테이블의 맵만 다시 로드합니다.
+- SQLAlchemy Connection(stg_to_core)과 psycopg Connection(tools) 모두 지원합니다.
+
+ENV (.env 권장):
+  MASTER_CACHE_CHECK_SECONDS=30   # 버전 확인 최소 간격(초), 0 = 조회할 때마다 확인
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+MASTER_CACHE_CHECK_SECONDS = float(os.getenv("MASTER_CACHE_CHECK_SECONDS") or 30)
+
+
+@dataclass(frozen=True)
+class LookupSpec:
+    """master 테이블 하나에서 key_column -> value_column 맵을 만드는 설정"""
+    table: str
+    key_column: str
+    value_column: str
+    where: str = ""
+    first_wins: bool = False   # 키 중복 시 먼저 나온 값 유지 (기본: 마지막 값)
+    strip: bool = False        # 키/값 앞뒤 공백 제거 후 빈 값은 제외
+    key_max_length: Optional[int] = None  # 자동 생성 가능한 키 최대 길이 (컬럼 varchar 길이)
+
+    def select_sql(self) -> str:
+        where = f" WHERE {self.where}" if self.where else ""
+        return f"SELECT {self.key_column}, {self.value_column} FROM {self.table}{where} ORDER BY id"
+
+
+LOOKUPS: Dict[str, LookupSpec] = {
+    "subcategory": LookupSpec("master.category", "name", "id", "parent_id IS NOT NULL"),
+    "education": LookupSpec("master.education", "code", "id"),
+    "job_status": LookupSpec("master.job_status", "code", "id"),
+    "major": LookupSpec("master.major", "code", "id"),
+    "specialization": LookupSpec("master.specialization", "code", "id"),
+    "keyword": LookupSpec("master.keyword", "name", "id", key_max_length=64),
+    "region": LookupSpec("master.region", "zip_code", "id", "zip_code IS NOT NULL"),
+    "region_full_name": LookupSpec(
+        "master.region", "zip_code", "full_name",
+        "zip_code IS NOT NULL AND full_name IS NOT NULL",
+        first_wins=True, strip=True,
+    ),
+}
+
+
+def _fetch_all(conn: Any, sql: str) -> List[Tuple[Any, ...]]:
+    """SQLAlchemy Connection / psycopg Connection 공통 조회 (튜플 리스트 반환)"""
+    if hasattr(conn, "exec_driver_sql"):
+        return [tuple(r) for r in conn.exec_driver_sql(sql).fetchall()]
+    from psycopg.rows import tuple_row
+    with conn.cursor(row_factory=tuple_row) as cur:
+        cur.execute(sql)
+        return cur.fetchall()
+
+
+def _build_map(spec: LookupSpec, rows: List[Tuple[Any, Any]]) -> Dict[Any, Any]:
+    out: Dict[Any, Any] = {}
+    for key, value in rows:
+        if spec.strip:
+            key, value = str(key).strip(), str(value).strip()
+            if not key or not value:
+                continue
+        if spec.first_wins:
+            out.setdefault(key, value)
+        else:
+            out[key] = value
+    return out
+
+
+class MasterDataCache:
+    """
+    룩업 맵 캐시.
+    - get(): 마지막 확인 후 check_seconds가 지났으면 모든 대상 테이블 버전을 한 번에 확인,
+             버전이 바뀐 테이블의 맵만 무효화 후 필요 시 재로드
+    - 반환 맵은 읽기 전용(MappingProxyType)
+    """
+
+    def __init__(self, lookups: Mapping[str, LookupSpec], *, check_seconds: float = MASTER_CACHE_CHECK_SECONDS) -> None:
+        self._lookups = dict(lookups)
+        self._check_seconds = check_seconds
+        self._maps: Dict[str, Mapping[Any, Any]] = {}
+        self._versions: Dict[str, Tuple[Any, ...]] = {}
+        self._checked_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def _version_sql(self) -> str:
+        tables = sorted({spec.table for spec in self._lookups.values()})
+        return "\nUNION ALL\n".join(
+            f"SELECT '{t}', count(*), max(id), max(updated_at) FROM {t}" for t in tables
+        )
+
+    def _check_versions(self, conn: Any) -> None:
+        rows = _fetch_all(conn, self._version_sql())
+        versions = {r[0]: tuple(r[1:]) for r in rows}
+        changed = {t for t, v in versions.items() if self._versions.get(t) != v}
+        if changed:
+            for name, spec in self._lookups.items():
+                if spec.table in changed:
+                    self._maps.pop(name, None)
+        self._versions = versions
+        self._checked_at = time.monotonic()
+
+    def get(self, conn: Any, name: str) -> Mapping[Any, Any]:
+        spec = self._lookups[name]
+        with self._lock:
+            now = time.monotonic()
+            if self._checked_at is None or now - self._checked_at >= self._check_seconds:
+                self._check_versions(conn)
+            cached = self._maps.get(name)
+            if cached is None:
+                cached = MappingProxyType(_build_map(spec, _fetch_all(conn, spec.select_sql())))
+                self._maps[name] = cached
+            return cached
+
+    def merge(self, name: str, entries: Mapping[Any, Any]) -> Mapping[Any, Any]:
+        """
+        새로 생성된 master 항목을 캐시된 맵에 병합 (재조회 없이 같은 배치에서 바로 사용).
+        테이블 버전은 다음 확인 때 바뀐 것으로 보이므로 그때 한 번 재로드됨.
+        """
+        with self._lock:
+            cached = self._maps.get(name)
+            if cached is None:
+                # 캐시가 없으면 다음 get()에서 전체 재로드 (부분 맵을 캐시하지 않음)
+                return MappingProxyType(dict(entries))
+            merged = dict(cached)
+            merged.update(entries)
+            self._maps[name] = MappingProxyType(merged)
+            return self._maps[name]
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """맵 강제 무효화 (name=None이면 전체). 다음 get()에서 버전 확인부터 다시 수행"""
+        with self._lock:
+            if name is None:
+                self._maps.clear()
+            else:
+                self._maps.pop(name, None)
+            self._checked_at = None
+
+
+MASTER_CACHE = MasterDataCache(LOOKUPS)
+
+
+def get_lookup(conn: Any, name: str) -> Mapping[Any, Any]:
+    return MASTER_CACHE.get(conn, name)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+pipeline.py
+- raw → landing → current → core 전체 파이프라인을 한 프로세스에서 실행하는 오케스트레이터 (cron 잡 하나)
+- psycopg_pool 커넥션 풀 하나를 모든 단계가 공유
+  * psycopg 단계(raw/landing/current)는 풀에서 커넥션을 빌려 사용
+  * core(stg_to_core, SQLAlchemy)는 NullPool + creator로 같은 풀에서 빌리고 close() 시 풀에 반환
+- 각 스크립트의 BOOTSTRAP_SQL은 시작 시 선택된 단계만 한 번씩 실행
+- 단계 간 증분은 가능하면 메모리로 전달
+  * raw가 이번 실행에서 적재한 페이지(payload 포함)를 landing이 DB 재조회 없이 사용
+    (그 밖의 미처리 RAW 페이지만 DB에서 조회)
+- 실패한 단계의 하위 단계는 실행하지 않고(blocked) 종료 코드 1로 끝냄
+- 단계별 계측(etl_metrics)은 같은 run_id로 기록
+
+사용 예:
+  python elt/pipeline.py                      # 전체 실행
+  python elt/pipeline.py --skip raw           # API 수집 없이 기존 RAW부터
+  python elt/pipeline.py --from current       # current, core만 다시 실행
+  python elt/pipeline.py --only core          # core만 다시 실행
+
+ENV (.env 권장):
+  PG_DSN=postgresql://<user>:<pass>@<host>:<port>/<db>   # 모든 단계 공용 (core도 DATABASE_URL 대신 사용)
+  PIPELINE_POOL_SIZE=4        # 풀 최대 커넥션 수 (core는 읽기 1 + 쓰기 1, ETL_BRIDGE_WORKERS=N이면 1 + N 동시 사용 → 최소값으로 보정)
+  PIPELINE_POOL_TIMEOUT=30    # 커넥션 대기/최초 연결 제한 시간(초)
+  LOG_LEVEL=INFO
+  PROFILE=                    # 선택: cpu,mem,sql 프로파일 → PROFILE_DIR (전체 파이프라인 한 세션, profiling 참고)
+  * 단계별 ENV(BASE_URL, API_KEY, LOOKBACK_HOURS, ETL_BATCH_SIZE ...)는 각 스크립트 참고
+"""
+
+import argparse
+import importlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import psycopg
+from psycopg_pool import ConnectionPool
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool
+
+try:
+    from dotenv import load_dotenv  # optional
+    load_dotenv()
+except Exception:
+    pass
+
+# ------------ ENV ------------
+def env_str(name: str, default: str | None = None) -> str:
+    v = os.getenv(name, default)
+    if v is None or v == "":
+        raise RuntimeError(f"Missing environment variable: {name}")
+    return v
+
+def env_int(name: str, default: int) -> int:
+    v = os.getenv(name)
+    return int(v) if v not in (None, "") else default
+
+PG_DSN = env_str("PG_DSN")
+# core: 변경분 조회(샤드 잠금 포함) 커넥션 1 + 쓰기 커넥션 ETL_BRIDGE_WORKERS개
+PIPELINE_POOL_SIZE = max(1 + max(1, env_int("ETL_BRIDGE_WORKERS", 1)), env_int("PIPELINE_POOL_SIZE", 4))
+PIPELINE_POOL_TIMEOUT = env_int("PIPELINE_POOL_TIMEOUT", 30)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+logging.basicConfig(
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    format="%(asctime)s %(levelname)s %(name)s :: %(message)s",
+)
+log = logging.getLogger("pipeline")
+
+import etl_metrics  # noqa: E402  (로깅 설정 이후 import)
+import profiling  # noqa: E402
+
+# ------------ Pool ------------
+class PooledConnection(psycopg.Connection):
+    """
+    풀 커넥션 클래스 (psycopg_pool connection_class).
+    - SQLAlchemy creator로 빌려준 커넥션은 close() 시 닫지 않고 풀에 반환 (NullPool이 체크인마다 close 호출)
+    - 그 밖의 close()(풀 종료/축소)는 실제로 닫음
+    - 프록시 대신 하위 클래스: SQLAlchemy/psycopg가 isinstance(psycopg.Connection) 검사
+    """
+    _lent_pool: Optional[ConnectionPool] = None
+
+    def close(self) -> None:
+        pool = self._lent_pool
+        if pool is not None:
+            self._lent_pool = None
+            pool.putconn(self)
+        else:
+            super().close()
+
+    def add_notice_handler(self, callback: Callable) -> None:
+        # SQLAlchemy가 체크아웃마다 같은 핸들러를 등록하므로 중복 등록 방지
+        try:
+            self.remove_notice_handler(callback)
+        except ValueError:
+            pass
+        super().add_notice_handler(callback)
+
+
+def open_pool(dsn: str = PG_DSN) -> ConnectionPool:
+    """모든 단계 공용 풀 (새 커넥션마다 etl_metrics 왕복 수 계측 적용), 최초 연결 실패 시 바로 예외"""
+    pool = ConnectionPool(
+        dsn,
+        min_size=1,
+        max_size=PIPELINE_POOL_SIZE,
+        timeout=PIPELINE_POOL_TIMEOUT,
+        connection_class=PooledConnection,
+        configure=etl_metrics.instrument,
+        name="youthpolicy-etl",
+        open=True,
+    )
+    pool.wait(timeout=PIPELINE_POOL_TIMEOUT)
+    return pool
+
+def pooled_engine(pool: ConnectionPool) -> Engine:
+    """pool에서 커넥션을 빌려 쓰는 SQLAlchemy 엔진 (stg_to_core용)"""
+    def creator() -> PooledConnection:
+        conn = pool.getconn()
+        conn._lent_pool = pool
+        return conn
+
+    # URL은 연결에 쓰이지 않지만 core 샤드 프로세스(ETL_SHARDS>1)가 자체 엔진을 만들 때 사용
+    return create_engine(
+        make_url(PG_DSN).set(drivername="postgresql+psycopg"),
+        creator=creator,
+        poolclass=NullPool,
+        future=True,
+    )
+
+# ------------ Stages ------------
+@dataclass
+class PipelineContext:
+    pool: ConnectionPool
+    engine: Engine
+    # 단계 간 메모리 전달 (예: "raw_pages" = raw가 이번에 적재한 페이지)
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+def _run_raw(ctx: PipelineContext) -> str:
+    raw_ingest = importlib.import_module("raw_ingest")
+    pages: List[Dict[str, Any]] = []
+    ctx.data["raw_pages"] = pages
+    with ctx.pool.connection() as conn:
+        try:
+            n = raw_ingest.ingest_pages(conn, pages_out=pages)
+        finally:
+            raw_ingest.METRICS.flush(conn)
+    return f"pages={n}"
+
+def _run_landing(ctx: PipelineContext) -> str:
+    stg_landing = importlib.import_module("stg_landing")
+    fresh = ctx.data.get("raw_pages") or []
+    with ctx.pool.connection() as conn:
+        try:
+            pages = stg_landing.load_raw_pages(conn, exclude_ids=[p["ingest_id"] for p in fresh]) + fresh
+            if pages:
+                stg_landing.upsert_landing(conn, pages)
+        finally:
+            stg_landing.METRICS.flush(conn)
+    return f"pages={len(pages)} (from memory={len(fresh)})"
+
+def _run_current(ctx: PipelineContext) -> str:
+    stg_refresh_current = importlib.import_module("stg_refresh_current")
+    with ctx.pool.connection() as conn:
+        try:
+            stg_refresh_current.refresh_current(conn)
+        finally:
+            stg_refresh_current.METRICS.flush(conn)
+    return "ok"
+
+def _run_core(ctx: PipelineContext) -> str:
+    stg_to_core = importlib.import_module("stg_to_core")
+    stg_to_core.run_etl(engine=ctx.engine)   # 계측 기록은 run_etl이 수행
+    return "ok"
+
+def _bootstrap_psycopg(module: str) -> Callable[[PipelineContext], None]:
+    def run(ctx: PipelineContext) -> None:
+        with ctx.pool.connection() as conn:
+            importlib.import_module(module).bootstrap(conn)
+    return run
+
+def _bootstrap_core(ctx: PipelineContext) -> None:
+    importlib.import_module("stg_to_core").bootstrap(ctx.engine)
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    deps: Tuple[str, ...]
+    run: Callable[[PipelineContext], str]
+    bootstrap: Callable[[PipelineContext], None]
+
+
+STAGES: Tuple[Stage, ...] = (
+    Stage("raw", (), _run_raw, _bootstrap_psycopg("raw_ingest")),
+    Stage("landing", ("raw",), _run_landing, _bootstrap_psycopg("stg_landing")),
+    Stage("current", ("landing",), _run_current, _bootstrap_psycopg("stg_refresh_current")),
+    Stage("core", ("current",), _run_core, _bootstrap_core),
+)
+STAGE_NAMES = tuple(s.name for s in STAGES)
+
+# 단계 결과 상태
+OK, FAILED, SKIPPED, BLOCKED = "ok", "failed", "skipped", "blocked"
+
+
+def select_stages(only: Sequence[str] = (), skip: Sequence[str] = (), start: Optional[str] = None) -> List[str]:
+    """실행할 단계 이름 (STAGES 순서 유지). 선택되지 않은 상위 단계는 이미 완료된 것으로 간주"""
+    for name in (*only, *skip, *([start] if start else [])):
+        if name not in STAGE_NAMES:
+            raise ValueError(f"Unknown stage: {name} (choose from {', '.join(STAGE_NAMES)})")
+    names = list(only) if only else list(STAGE_NAMES)
+    if start:
+        names = [n for n in names if STAGE_NAMES.index(n) >= STAGE_NAMES.index(start)]
+    return [n for n in STAGE_NAMES if n in names and n not in skip]
+
+
+def run_pipeline(selected: Sequence[str], *, bootstrap: bool = True) -> Dict[str, str]:
+    """selected 단계를 의존 순서대로 실행, {단계: 상태} 반환 (실패 단계의 하위 단계는 blocked)"""
+    status: Dict[str, str] = {s.name: SKIPPED for s in STAGES}
+    with open_pool() as pool:
+        engine = pooled_engine(pool)
+        ctx = PipelineContext(pool, engine)
+        try:
+            if bootstrap:
+                for stage in STAGES:
+                    if stage.name in selected:
+                        stage.bootstrap(ctx)
+
+            for stage in STAGES:
+                if stage.name not in selected:
+                    continue
+                if any(status[d] in (FAILED, BLOCKED) for d in stage.deps):
+                    status[stage.name] = BLOCKED
+                    log.warning("Stage %s blocked (upstream failed)", stage.name)
+                    continue
+                started = time.monotonic()
+                log.info("Stage %s start", stage.name)
+                try:
+                    detail = stage.run(ctx)
+                except Exception:
+                    status[stage.name] = FAILED
+                    log.exception("Stage %s failed after %.1fs", stage.name, time.monotonic() - started)
+                    continue
+                status[stage.name] = OK
+                log.info("Stage %s done in %.1fs (%s)", stage.name, time.monotonic() - started, detail)
+        finally:
+            engine.dispose()
+    return status
+
+
+@profiling.profiled("pipeline")
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="raw → landing → current → core 파이프라인 (단일 프로세스)")
+    parser.add_argument("--only", default="", help=f"실행할 단계만 (쉼표 구분: {','.join(STAGE_NAMES)})")
+    parser.add_argument("--skip", default="", help="건너뛸 단계 (쉼표 구분)")
+    parser.add_argument("--from", dest="start", choices=STAGE_NAMES, help="이 단계부터 끝까지 다시 실행")
+    parser.add_argument("--no-bootstrap", action="store_true", help="BOOTSTRAP_SQL(DDL) 실행 생략")
+    args = parser.parse_args(argv)
+
+    split = lambda v: [x.strip() for x in v.split(",") if x.strip()]  # noqa: E731
+    try:
+        selected = select_stages(split(args.only), split(args.skip), args.start)
+    except ValueError as e:
+        parser.error(str(e))
+    if not selected:
+        parser.error("no stages selected")
+
+    log.info("Pipeline start (stages=%s, run_id=%s, pool_size=%s)", ",".join(selected), etl_metrics.RUN_ID, PIPELINE_POOL_SIZE)
+    started = time.monotonic()
+    try:
+        status = run_pipeline(selected, bootstrap=not args.no_bootstrap)
+    except Exception:
+        log.exception("Pipeline aborted")
+        return 1
+    log.info("Pipeline finished in %.1fs: %s", time.monotonic() - started,
+             ", ".join(f"{name}={st}" for name, st in status.items()))
+    return 1 if any(st in (FAILED, BLOCKED) for st in status.values()) else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
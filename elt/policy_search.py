@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+policy_search.py
+- core.policy.search_tsv(가중치 tsvector, GIN 인덱스) 기반 정책 검색 헬퍼
+- 가중치: 제목(A) > 요약(B) > 본문(C) > AI 요약(D)  (stg_to_core의 core.policy_search_tsv 참고)
+- 검색어는 websearch 문법 지원: 공백 = AND, "구문", or, -제외
+
+사용 예:
+  python elt/policy_search.py 청년 월세
+  python elt/policy_search.py '"취업 역량" -대학원' --limit 5
+
+ENV (.env 권장):
+  PG_DSN=postgresql://<user>:<pass>@<host>:<port>/<db>
+"""
+
+import argparse
+import os
+from typing import Any, Dict, List
+
+import psycopg
+from psycopg.rows import dict_row
+
+try:
+    from dotenv import load_dotenv  # optional
+    load_dotenv()
+except Exception:
+    pass
+
+# ts_rank_cd 가중치 배열 순서는 {D, C, B, A}
+RANK_WEIGHTS = "{0.1, 0.2, 0.4, 1.0}"
+
+SEARCH_SQL = """
+select p.id, p.title, p.status, p.apply_start, p.apply_end,
+       ts_rank_cd(%(weights)s::float4[], p.search_tsv, q.query, 1) as rank
+  from core.policy p,
+       websearch_to_tsquery('simple', %(q)s) as q(query)
+ where p.search_tsv @@ q.query
+ order by rank desc, p.id
+ limit %(limit)s offset %(offset)s
+"""
+
+def search_policies(conn: psycopg.Connection, q: str, *, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+    """검색어 q로 정책 검색, 가중치 순위(rank) 내림차순. 빈 검색어는 빈 결과"""
+    if not q or not q.strip():
+        return []
+    with conn.cursor(row_factory=dict_row) as cur:
+        cur.execute(SEARCH_SQL, {"q": q, "weights": RANK_WEIGHTS, "limit": limit, "offset": offset})
+        return cur.fetchall()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="core.policy 전문 검색")
+    parser.add_argument("query", nargs="+")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    with psycopg.connect(os.environ["PG_DSN"]) as conn:
+        for r in search_policies(conn, " ".join(args.query), limit=args.limit):
+            print(f"{r['rank']:.4f}  {r['id']}  {r['title']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+policy_status.py
+- core.policy.status 일배치 갱신 (KST 기준 '오늘'로 신청기간 경계를 넘은 정책만)
+  UPCOMING -> OPEN/CLOSED : apply_start <= 오늘      (ix_policy_apply_dates 범위 조회)
+  OPEN     -> CLOSED      : apply_end   <  오늘      (status = 'OPEN' 인 정책만, ALWAYS_OPEN 제외)
+- apply_type ALWAYS_OPEN/CLOSED는 날짜와 무관하게 OPEN/CLOSED 유지
+- 적재 시 상태는 stg_to_core(policy_status)가 계산, 이 잡은 날짜 변화분만 처리
+- 규칙은 SQL 함수 core.policy_status (stg_to_core.policy_status와 동일)
+
+ENV (.env 권장):
+  PG_DSN=postgresql://<user>:<pass>@<host>:<port>/<db>
+  STATUS_TODAY=YYYY-MM-DD   # 선택: 기준일 지정 (기본: 현재 KST 날짜)
+  STATUS_FULL_REFRESH=0     # 1이면 전체 정책 재계산 (최초 적용/규칙 변경 시)
+  LOG_LEVEL=INFO
+"""
+
+import os
+import logging
+from datetime import date, datetime, timezone, timedelta
+
+import psycopg
+
+try:
+    from dotenv import load_dotenv  # optional
+    load_dotenv()
+except Exception:
+    pass
+
+KST = timezone(timedelta(hours=9))
+
+# ------------ ENV ------------
+def env_str(name: str, default: str | None = None) -> str:
+    v = os.getenv(name, default)
+    if v is None or v == "":
+        raise RuntimeError(f"Missing environment variable: {name}")
+    return v
+
+PG_DSN = env_str("PG_DSN")
+STATUS_TODAY = os.getenv("STATUS_TODAY") or None
+STATUS_FULL_REFRESH = os.getenv("STATUS_FULL_REFRESH", "0") == "1"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+logging.basicConfig(
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    format="%(asctime)s %(levelname)s policy_status :: %(message)s",
+)
+log = logging.getLogger("policy_status")
+
+# ------------ Bootstrap ------------
+BOOTSTRAP_SQL = """
+create or replace function core.policy_status(apply_type text, apply_start date, apply_end date, today date)
+returns text language sql immutable parallel safe as $$
+  select case
+    when apply_type = 'CLOSED'      then 'CLOSED'
+    when apply_type = 'ALWAYS_OPEN' then 'OPEN'
+    when apply_type = 'PERIODIC' and apply_start is not null and apply_end is not null then
+      case when today < apply_start then 'UPCOMING'
+           when today <= apply_end  then 'OPEN'
+           else 'CLOSED' end
+    else 'UNKNOWN'
+  end
+$$;
+"""
+
+def bootstrap(conn: psycopg.Connection) -> None:
+    with conn.cursor() as cur:
+        cur.execute(BOOTSTRAP_SQL)
+    conn.commit()
+    log.info("Bootstrap: core.policy_status() ready")
+
+# ------------ Core ------------
+# 경계를 넘었을 수 있는 후보만 모아서 재계산 (값이 실제로 바뀐 행만 UPDATE)
+INCREMENTAL_SQL = """
+with cand as (
+    select id from core.policy
+     where status = 'UPCOMING' and apply_start <= %(today)s
+    union
+    select id from core.policy
+     where status = 'OPEN' and apply_end < %(today)s
+       and apply_type is distinct from 'ALWAYS_OPEN'   -- 기간이 지나도 OPEN 유지, 매일 재선택 방지
+), calc as (
+    select p.id, p.status as old_status,
+           core.policy_status(p.apply_type, p.apply_start, p.apply_end, %(today)s) as new_status
+      from core.policy p join cand using (id)
+)
+update core.policy p
+   set status = calc.new_status
+  from calc
+ where p.id = calc.id
+   and calc.new_status is distinct from calc.old_status
+returning calc.old_status, calc.new_status
+"""
+
+FULL_SQL = """
+with calc as (
+    select p.id, p.status as old_status,
+           core.policy_status(p.apply_type, p.apply_start, p.apply_end, %(today)s) as new_status
+      from core.policy p
+)
+update core.policy p
+   set status = calc.new_status
+  from calc
+ where p.id = calc.id
+   and calc.new_status is distinct from calc.old_status
+returning calc.old_status, calc.new_status
+"""
+
+def refresh_status(conn: psycopg.Connection, today: date, *, full: bool = False) -> dict:
+    """상태 갱신 후 {(old, new): 건수} 반환"""
+    with conn.cursor() as cur:
+        cur.execute(FULL_SQL if full else INCREMENTAL_SQL, {"today": today})
+        transitions: dict = {}
+        for old, new in cur.fetchall():
+            transitions[(old, new)] = transitions.get((old, new), 0) + 1
+    conn.commit()
+    return transitions
+
+def main() -> None:
+    today = date.fromisoformat(STATUS_TODAY) if STATUS_TODAY else datetime.now(KST).date()
+    log.info("Policy status refresh start (today=%s KST, full=%s)", today, STATUS_FULL_REFRESH)
+    with psycopg.connect(PG_DSN) as conn:
+        bootstrap(conn)
+        transitions = refresh_status(conn, today, full=STATUS_FULL_REFRESH)
+    for (old, new), n in sorted(transitions.items(), key=lambda kv: (str(kv[0][0]), str(kv[0][1]))):
+        log.info("  %s -> %s : %s", old, new, n)
+    log.info("Policy status refresh complete (updated=%s)", sum(transitions.values()))
+
+if __name__ == "__main__":
+    main()
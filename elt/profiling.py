@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+profiling.py
+- 모든 진입점 공용 프로파일링 스위치 (PROFILE=cpu|mem|sql, 쉼표로 여러 개)
+  * cpu: cProfile → profile.pstats (snakeviz/pstats로 열기) + profile.txt (누적 시간 상위 함수)
+  * mem: tracemalloc → tracemalloc.txt (할당 위치별 상위 목록, 최대 사용량)
+  * sql: etl_metrics 계측 커서의 문장별 소요 시간 → sql.jsonl (문장마다 한 줄) + sql_summary.txt (문장별 합계)
+         처음 보는 느린 문장(PROFILE_SQL_EXPLAIN_MS 이상)은 EXPLAIN 표본 → explain/<id>.txt
+         - 읽기 전용(SELECT/WITH) 문장: EXPLAIN (ANALYZE, BUFFERS) (같은 쿼리를 한 번 더 실행)
+         - INSERT/UPDATE/DELETE/MERGE: ANALYZE 없이 EXPLAIN (VERBOSE) (다시 실행하면 데이터가 바뀜)
+         - 트랜잭션 안에서는 SAVEPOINT로 감싸 EXPLAIN 실패가 본 작업에 영향 없음
+- 결과는 실행 디렉터리 PROFILE_DIR/<진입점>-<시각>-<run_id 앞 8자리>/ 에 기록
+- 중첩 호출(pipeline → stg_to_core.run_etl 등)은 바깥 세션 하나로 기록
+- 제약
+  * cProfile은 호출한 스레드만 측정 (브릿지 병렬 동기화 스레드, ETL_SHARDS 샤드 프로세스는 제외)
+  * sql은 etl_metrics.instrument/instrument_engine을 적용한 커넥션만 기록
+
+사용 예:
+  with profiling.profiled("stg_landing"):
+      ...
+
+ENV (.env 권장):
+  PROFILE=                    # cpu, mem, sql 중 쉼표 구분 (비우면 끔)
+  PROFILE_DIR=profiles        # 실행 디렉터리를 만들 상위 디렉터리
+  PROFILE_TOP=40              # 텍스트 요약에 표시할 상위 항목 수
+  PROFILE_MEM_FRAMES=1        # tracemalloc 스택 깊이 (1 = 할당 위치만)
+  PROFILE_SQL_EXPLAIN_MS=100  # 이 시간 이상 걸린 문장만 EXPLAIN 표본 (0 = 모든 문장, -1 = EXPLAIN 안 함)
+"""
+
+import cProfile
+import hashlib
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+import orjson
+import psycopg
+from psycopg import sql as pgsql
+from psycopg.pq import TransactionStatus
+
+import etl_metrics
+
+log = logging.getLogger("profiling")
+
+# ------------ ENV ------------
+def env_int(name: str, default: int) -> int:
+    v = os.getenv(name)
+    return int(v) if v not in (None, "") else default
+
+MODES = ("cpu", "mem", "sql")
+
+PROFILE = os.getenv("PROFILE", "")
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_TOP = env_int("PROFILE_TOP", 40)
+PROFILE_MEM_FRAMES = max(1, env_int("PROFILE_MEM_FRAMES", 1))
+PROFILE_SQL_EXPLAIN_MS = env_int("PROFILE_SQL_EXPLAIN_MS", 100)
+
+def parse_modes(value: str) -> List[str]:
+    modes = [m.strip().lower() for m in value.split(",") if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        raise ValueError(f"Unknown PROFILE mode: {', '.join(unknown)} (choose from {'|'.join(MODES)})")
+    return [m for m in MODES if m in modes]
+
+# ------------ SQL ------------
+_READ_ONLY_RE = re.compile(r"^\s*(select|with|values|table)\b", re.I)
+_DML_RE = re.compile(r"\b(insert|update|delete|merge)\b", re.I)
+_WRITE_RE = re.compile(r"\b(insert|update|delete|merge|create|drop|alter|truncate|lock|for\s+update|for\s+share|nextval|setval|pg_advisory\w*)\b", re.I)
+
+def _query_text(query: Any, conn: psycopg.Connection) -> str:
+    if isinstance(query, bytes):
+        return query.decode("utf-8", "replace")
+    if isinstance(query, pgsql.Composable):
+        return query.as_string(conn)
+    return str(query)
+
+def explain_options(text: str) -> Optional[str]:
+    """문장 종류별 EXPLAIN 옵션 (None = 표본 대상 아님)"""
+    if _READ_ONLY_RE.match(text) and not _WRITE_RE.search(text):
+        return "ANALYZE, BUFFERS"
+    if re.match(r"^\s*(insert|update|delete|merge|with)\b", text, re.I) and _DML_RE.search(text):
+        return "VERBOSE"
+    return None
+
+
+@dataclass
+class StatementStats:
+    text: str
+    kind: str
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    rows: int = 0
+
+
+@dataclass
+class SqlProfiler:
+    """etl_metrics statement listener: 문장별 기록 + 느린 문장 EXPLAIN 표본"""
+    run_dir: Path
+    explain_ms: int = PROFILE_SQL_EXPLAIN_MS
+    stats: Dict[str, StatementStats] = field(default_factory=dict)
+    explained: Set[str] = field(default_factory=set)
+    started: float = field(default_factory=time.perf_counter)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._log = open(self.run_dir / "sql.jsonl", "wb")
+
+    def __call__(self, cursor: psycopg.Cursor, kind: str, query: Any, params: Any, seconds: float) -> None:
+        text = _query_text(query, cursor.connection)
+        sid = hashlib.sha1(" ".join(text.split()).encode()).hexdigest()[:12]
+        rows = cursor.rowcount if kind != "copy" else -1
+        with self._lock:
+            st = self.stats.get(sid)
+            if st is None:
+                st = self.stats[sid] = StatementStats(text, kind)
+            st.calls += 1
+            st.seconds += seconds
+            st.max_seconds = max(st.max_seconds, seconds)
+            st.rows += max(rows, 0)
+            self._log.write(orjson.dumps({
+                "t": round(time.perf_counter() - self.started, 6),
+                "id": sid,
+                "kind": kind,
+                "ms": round(seconds * 1000, 3),
+                "rows": rows,
+                "thread": threading.current_thread().name,
+            }) + b"\n")
+            options = None
+            if (kind == "execute" and self.explain_ms >= 0 and seconds * 1000 >= self.explain_ms
+                    and sid not in self.explained and not isinstance(cursor, psycopg.ServerCursor)):
+                options = explain_options(text)
+                if options is not None:
+                    self.explained.add(sid)
+        if options is not None:
+            self._explain(cursor.connection, sid, text, options, params, seconds)
+
+    def _explain(self, conn: psycopg.Connection, sid: str, text: str, options: str, params: Any, seconds: float) -> None:
+        in_tx = conn.info.transaction_status == TransactionStatus.INTRANS
+        if conn.info.transaction_status not in (TransactionStatus.IDLE, TransactionStatus.INTRANS):
+            return
+        # 기본 Cursor 사용: EXPLAIN 자체는 기록/왕복 수 계측 대상이 아님
+        cur = psycopg.Cursor(conn)
+        try:
+            if in_tx:
+                cur.execute("SAVEPOINT etl_profile_explain")
+            try:
+                cur.execute(f"EXPLAIN ({options}) {text}", params)
+                plan = "\n".join(r[0] for r in cur.fetchall())
+            except psycopg.Error as e:
+                plan = f"EXPLAIN failed: {e}"
+                if in_tx:
+                    cur.execute("ROLLBACK TO SAVEPOINT etl_profile_explain")
+            if in_tx:
+                cur.execute("RELEASE SAVEPOINT etl_profile_explain")
+        except psycopg.Error as e:
+            log.warning("EXPLAIN sampling skipped for %s: %s", sid, e)
+            return
+        finally:
+            cur.close()
+        out = self.run_dir / "explain"
+        out.mkdir(exist_ok=True)
+        (out / f"{sid}.txt").write_text(
+            f"-- {seconds * 1000:.1f} ms, EXPLAIN ({options})\n{text.strip()}\n\n{plan}\n", encoding="utf-8",
+        )
+
+    def close(self) -> None:
+        self._log.close()
+        ranked = sorted(self.stats.items(), key=lambda kv: kv[1].seconds, reverse=True)
+        total = sum(st.seconds for st in self.stats.values())
+        lines = [f"statements={sum(st.calls for st in self.stats.values())} distinct={len(self.stats)} "
+                 f"total={total:.3f}s explained={len(self.explained)}", ""]
+        lines.append(f"{'id':<12} {'kind':<11} {'calls':>7} {'total_s':>9} {'mean_ms':>9} {'max_ms':>9} {'rows':>9}  statement")
+        for sid, st in ranked[:PROFILE_TOP]:
+            snippet = " ".join(st.text.split())[:120]
+            lines.append(f"{sid:<12} {st.kind:<11} {st.calls:>7} {st.seconds:>9.3f} "
+                         f"{st.seconds / st.calls * 1000:>9.2f} {st.max_seconds * 1000:>9.2f} {st.rows:>9}  {snippet}")
+        (self.run_dir / "sql_summary.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        (self.run_dir / "sql_statements.json").write_bytes(orjson.dumps(
+            {sid: {"kind": st.kind, "text": st.text} for sid, st in self.stats.items()}, option=orjson.OPT_INDENT_2,
+        ))
+
+# ------------ Session ------------
+@dataclass
+class ProfileSession:
+    name: str
+    modes: List[str]
+    run_dir: Path
+    cpu: Optional[cProfile.Profile] = None
+    sql: Optional[SqlProfiler] = None
+    started_tracemalloc: bool = False
+
+    def start(self) -> None:
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        if "mem" in self.modes and not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILE_MEM_FRAMES)
+            self.started_tracemalloc = True
+        if "sql" in self.modes:
+            self.sql = SqlProfiler(self.run_dir)
+            etl_metrics.add_statement_listener(self.sql)
+        if "cpu" in self.modes:
+            self.cpu = cProfile.Profile()
+            self.cpu.enable()
+
+    def stop(self) -> None:
+        # 측정 중지 → 메모리 스냅샷 → 파일 기록 순서 (결과 기록 자체의 할당/호출은 제외)
+        if self.cpu is not None:
+            self.cpu.disable()
+        if self.sql is not None:
+            etl_metrics.remove_statement_listener(self.sql)
+        if "mem" in self.modes and tracemalloc.is_tracing():
+            self._write_tracemalloc()
+            if self.started_tracemalloc:
+                tracemalloc.stop()
+        if self.cpu is not None:
+            self.cpu.dump_stats(str(self.run_dir / "profile.pstats"))
+            with open(self.run_dir / "profile.txt", "w", encoding="utf-8") as f:
+                stats = pstats.Stats(self.cpu, stream=f).strip_dirs()
+                stats.sort_stats("cumulative").print_stats(PROFILE_TOP)
+                stats.sort_stats("tottime").print_stats(PROFILE_TOP)
+        if self.sql is not None:
+            self.sql.close()
+
+    def _write_tracemalloc(self) -> None:
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        key = "traceback" if PROFILE_MEM_FRAMES > 1 else "lineno"
+        lines = [f"current={current / 2**20:.1f} MiB peak={peak / 2**20:.1f} MiB (frames={PROFILE_MEM_FRAMES})", ""]
+        for i, stat in enumerate(snapshot.statistics(key)[:PROFILE_TOP], 1):
+            frame = stat.traceback[0]
+            lines.append(f"#{i:<3} {stat.size / 2**10:>10.1f} KiB {stat.count:>8} blocks  {frame.filename}:{frame.lineno}")
+            for tb_line in (stat.traceback.format()[2:] if key == "traceback" else []):
+                lines.append(f"      {tb_line}")
+        (self.run_dir / "tracemalloc.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+_active: Optional[ProfileSession] = None
+
+@contextmanager
+def profiled(name: str, modes: Optional[str] = None) -> Iterator[Optional[ProfileSession]]:
+    """
+    PROFILE(또는 modes)이 설정되어 있으면 블록 실행을 프로파일링하고 세션 반환, 아니면 None.
+    이미 프로파일링 중이면(중첩 진입점) 바깥 세션을 그대로 반환
+    """
+    global _active
+    selected = parse_modes(PROFILE if modes is None else modes)
+    if not selected or _active is not None:
+        yield _active
+        return
+
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    session = ProfileSession(name, selected, Path(PROFILE_DIR) / f"{name}-{stamp}-{etl_metrics.RUN_ID[:8]}")
+    session.start()
+    _active = session
+    try:
+        yield session
+    finally:
+        _active = None
+        session.stop()
+        message = f"Profile ({','.join(selected)}) written to {session.run_dir}"
+        if logging.getLogger().handlers:
+            log.info(message)
+        else:   # 로깅 미설정 스크립트(stg_to_core, tools): stdout 출력(CSV 등)과 섞이지 않게 stderr
+            print(message, file=sys.stderr)
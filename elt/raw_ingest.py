@@ -13,14 +13,17 @@ raw_ingest.py
   END_PAGE=0           # 선택(0 또는 미지정=모든 페이지)
   HTTP_TIMEOUT=20      # 선택(초)
   RETRY_MAX=5          # 선택(기본 5회)
+  REQUEST_INTERVAL_MS=200  # 선택(페이지 요청 간격, 레이트리밋 여유)
   LOG_LEVEL=INFO       # 선택(DEBUG/INFO/WARN/ERROR)
+  ETL_METRICS_DIR=     # 선택(단계별 계측 textfile 디렉터리, etl_metrics 참고)
+  PROFILE=             # 선택(cpu,mem,sql 프로파일 → PROFILE_DIR, profiling 참고)
 """
 
 import os
 import math
 import time
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import httpx
 import orjson
@@ -29,6 +32,9 @@ from psycopg.rows import tuple_row
 from psycopg.types.json import Json
 from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 
+import etl_metrics
+import profiling
+
 try:
     # 로컬 실행 편의: .env 자동 로드 (없어도 무방)
     from dotenv import load_dotenv  # type: ignore
@@ -57,6 +63,7 @@ START_PAGE = env_int("START_PAGE", 1)
 END_PAGE   = env_int("END_PAGE", 0)  # 0 이면 끝까지
 HTTP_TIMEOUT = env_int("HTTP_TIMEOUT", 20)
 RETRY_MAX    = env_int("RETRY_MAX", 5)
+REQUEST_INTERVAL_MS = env_int("REQUEST_INTERVAL_MS", 200)
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
@@ -65,6 +72,8 @@ logging.basicConfig(
 )
 log = logging.getLogger("raw_ingest")
 
+METRICS = etl_metrics.StageMetrics("raw")
+
 # -------------------------
 # DB 부트스트랩 (idempotent)
 # -------------------------
@@ -93,6 +102,7 @@ def bootstrap(conn: psycopg.Connection) -> None:
     with conn.cursor() as cur:
         cur.execute(BOOTSTRAP_SQL)
     conn.commit()
+    etl_metrics.bootstrap(conn)
     log.info("DB bootstrap completed (raw.youthpolicy_pages ready)")
 
 # -------------------------
@@ -137,6 +147,8 @@ def fetch_page(cli: httpx.Client, page_no: int, page_size: int) -> Dict[str, Any
         "http_status": r.status_code,
         "json": js,
         "params": params,
+        "bytes": len(r.content),
+        "items": len(items) if isinstance(items, list) else 0,
     }
 
 def extract_paging_meta(js: Dict[str, Any]) -> tuple[int, int, int]:
@@ -163,72 +175,97 @@ def extract_paging_meta(js: Dict[str, Any]) -> tuple[int, int, int]:
 # -------------------------
 # 메인 루프
 # -------------------------
+@profiling.profiled("raw_ingest")
 def main() -> None:
     log.info("Starting RAW ingest → %s", BASE_URL)
-    inserted_rows = 0
 
     with psycopg.connect(PG_DSN, row_factory=tuple_row) as conn:
-        bootstrap(conn)
+        etl_metrics.instrument(conn)
+        try:
+            bootstrap(conn)
+            inserted_rows = ingest_pages(conn)
+        finally:
+            METRICS.flush(conn)
+
+    log.info("[OK] RAW ingest done. pages inserted=%s (%s)", inserted_rows, METRICS.summary())
 
-        # 트랜잭션: 각 페이지 단위로 커밋(대용량에서도 메모리 안정)
-        with httpx.Client() as cli:
-            page = max(1, START_PAGE)
-            last_page_seen = 0
+def ingest_pages(conn: psycopg.Connection, pages_out: Optional[List[Dict[str, Any]]] = None) -> int:
+    """
+    START_PAGE부터 마지막 페이지까지 받아 RAW에 적재, 적재한 페이지 수 반환.
+    - pages_out: 주어지면 적재한 페이지를 {"ingest_id", "page_no", "payload"}로 추가
+      (pipeline에서 landing 단계가 RAW를 다시 읽지 않고 바로 사용)
+    """
+    inserted_rows = 0
 
-            while True:
+    # 트랜잭션: 각 페이지 단위로 커밋(대용량에서도 메모리 안정)
+    with httpx.Client() as cli:
+        page = max(1, START_PAGE)
+        last_page_seen = 0
+
+        while True:
+            with METRICS.step("fetch_page", rows_in=1) as st:
                 resp = fetch_page(cli, page, PAGE_SIZE)
-                status = resp["http_status"]
-                js = resp["json"]
-                params = resp["params"]
-
-                # 페이징 메타 파싱
-                page_num, page_size, tot_page = extract_paging_meta(js)
-                if last_page_seen == 0 and tot_page:
-                    last_page_seen = tot_page
-                    log.info("Paging detected: total_pages=%s page_size=%s", last_page_seen, page_size)
-
-                # RAW 저장
-                with conn.cursor() as cur:
-                    cur.execute(
-                        """
-                        insert into raw.youthpolicy_pages
-                        (page_no, page_size, base_url, query_params, http_status, payload)
-                        values (%s, %s, %s, %s, %s, %s)
-                        """,
-                        (
-                            page,
-                            page_size,
-                            BASE_URL,
-                            Json(params),
-                            status,
-                            Json(js),
-                        )
+                st.rows_out += resp["items"]
+                st.bytes += resp["bytes"]
+            status = resp["http_status"]
+            js = resp["json"]
+            params = resp["params"]
+
+            # 페이징 메타 파싱
+            page_num, page_size, tot_page = extract_paging_meta(js)
+            if last_page_seen == 0 and tot_page:
+                last_page_seen = tot_page
+                log.info("Paging detected: total_pages=%s page_size=%s", last_page_seen, page_size)
+
+            # RAW 저장
+            with METRICS.step("insert_page", rows_in=1) as st, conn.cursor() as cur:
+                cur.execute(
+                    """
+                    insert into raw.youthpolicy_pages
+                    (page_no, page_size, base_url, query_params, http_status, payload)
+                    values (%s, %s, %s, %s, %s, %s)
+                    returning ingest_id
+                    """,
+                    (
+                        page,
+                        page_size,
+                        BASE_URL,
+                        Json(params),
+                        status,
+                        Json(js),
                     )
+                )
+                ingest_id = cur.fetchone()[0]
                 conn.commit()
-                inserted_rows += 1
-                log.info("Inserted RAW page: page=%s status=%s", page_num or page, status)
-
-                # 종료 조건 계산
-                if END_PAGE and page >= END_PAGE:
-                    log.info("END_PAGE reached: %s", END_PAGE)
-                    break
-
-                # tot_page 기반 종료
-                if last_page_seen and page >= last_page_seen:
-                    log.info("Reached last page: %s", last_page_seen)
-                    break
-
-                # items 길이 기반(메타 없을 때)
-                result = js.get("result", js)
-                items = result.get("youthPolicyList", result.get("items", []))
-                if isinstance(items, list) and len(items) == 0:
-                    log.info("Empty items; stopping at page=%s", page)
-                    break
-
-                page += 1
-                time.sleep(0.2)  # 과한 요청 방지(레이트리밋 여유)
-
-    log.info("[OK] RAW ingest done. pages inserted=%s", inserted_rows)
+                st.rows_out += cur.rowcount
+                st.inserted += cur.rowcount
+                st.bytes += resp["bytes"]
+            inserted_rows += 1
+            if pages_out is not None:
+                pages_out.append({"ingest_id": ingest_id, "page_no": page, "payload": js})
+            log.info("Inserted RAW page: page=%s status=%s", page_num or page, status)
+
+            # 종료 조건 계산
+            if END_PAGE and page >= END_PAGE:
+                log.info("END_PAGE reached: %s", END_PAGE)
+                break
+
+            # tot_page 기반 종료
+            if last_page_seen and page >= last_page_seen:
+                log.info("Reached last page: %s", last_page_seen)
+                break
+
+            # items 길이 기반(메타 없을 때)
+            result = js.get("result", js)
+            items = result.get("youthPolicyList", result.get("items", []))
+            if isinstance(items, list) and len(items) == 0:
+                log.info("Empty items; stopping at page=%s", page)
+                break
+
+            page += 1
+            time.sleep(REQUEST_INTERVAL_MS / 1000)  # 과한 요청 방지(레이트리밋 여유)
+
+    return inserted_rows
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
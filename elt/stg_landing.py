@@ -11,18 +11,23 @@ ENV (.env 권장):
   PROCESS_ONLY_UNSEEN=1      # 1 = 이미 처리한 RAW 페이지(ingest_id) 건너뜀
   BATCH_SIZE=1000
   LOG_LEVEL=INFO
+  ETL_METRICS_DIR=           # 선택: 단계별 계측 textfile 디렉터리 (etl_metrics 참고)
+  PROFILE=                   # 선택: cpu,mem,sql 프로파일 → PROFILE_DIR (profiling 참고)
 """
 
 import os
 import hashlib
 import logging
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
 
 import orjson
 import psycopg
 from psycopg.rows import dict_row
 from psycopg.types.json import Json
 
+import etl_metrics
+import profiling
+
 try:
     from dotenv import load_dotenv  # optional
     load_dotenv()
@@ -52,6 +57,8 @@ logging.basicConfig(
 )
 log = logging.getLogger("stg_landing_from_raw")
 
+METRICS = etl_metrics.StageMetrics("landing")
+
 # ---------- Bootstrap DDL (idempotent) ----------
 BOOTSTRAP_SQL = """
 create schema if not exists stg;
@@ -66,13 +73,45 @@ create table if not exists stg.youthpolicy_landing (
   primary key (policy_id, record_hash)
 );
 create index if not exists idx_stg_landing_raw on stg.youthpolicy_landing(raw_ingest_id);
-create index if not exists idx_stg_landing_policy on stg.youthpolicy_landing(policy_id);
+-- 정책별 최신/최초 버전 조회 (policy_id 단독 조회는 PK가 커버하므로 (policy_id) 인덱스는 대체)
+create index if not exists idx_stg_landing_policy_ingested on stg.youthpolicy_landing(policy_id, ingested_at desc);
+drop index if exists stg.idx_stg_landing_policy;
+-- append 순서 ≒ ingested_at 순서: 최근 구간(LOOKBACK) 조회는 BRIN으로 충분 (순서를 깨는 CLUSTER 금지, stg_landing_compact 참고)
+create index if not exists idx_stg_landing_ingested_brin on stg.youthpolicy_landing using brin(ingested_at);
+
+-- 'YYYY-MM-DD HH:MM:SS'(KST) -> timestamptz, 형식이 다르거나 없는 날짜면 null
+create or replace function stg.kst_ts(v text)
+returns timestamptz language plpgsql immutable parallel safe as $$
+begin
+  v := btrim(v);
+  if v !~ '^[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}$' then
+    return null;
+  end if;
+  return make_timestamp(substr(v, 1, 4)::int, substr(v, 6, 2)::int, substr(v, 9, 2)::int,
+                        substr(v, 12, 2)::int, substr(v, 15, 2)::int, substr(v, 18, 2)::int)
+         at time zone 'Asia/Seoul';
+exception when datetime_field_overflow then
+  return null;
+end $$;
+
+-- 수정일시를 컬럼으로 저장: 수정일 필터/정렬이 문서를 detoast하지 않음
+-- (기존 테이블에 처음 추가될 때 한 번 테이블 재작성)
+alter table stg.youthpolicy_landing
+  add column if not exists last_mdfcn_at timestamptz generated always as (stg.kst_ts(raw_json->>'lastMdfcnDt')) stored;
+-- 읽는 쿼리가 없던 생성 컬럼 정리 (적재마다 추출/저장 비용만 발생)
+alter table stg.youthpolicy_landing
+  drop column if exists frst_reg_at,
+  drop column if exists aply_ymd,
+  drop column if exists inq_cnt;
+create index if not exists idx_stg_landing_mdfcn on stg.youthpolicy_landing(last_mdfcn_at);
+create index if not exists idx_stg_landing_policy_mdfcn on stg.youthpolicy_landing(policy_id, last_mdfcn_at);
 """
 
 def bootstrap(conn: psycopg.Connection) -> None:
     with conn.cursor() as cur:
         cur.execute(BOOTSTRAP_SQL)
     conn.commit()
+    etl_metrics.bootstrap(conn)
     log.info("STG bootstrap complete (landing ready)")
 
 # ---------- Helpers ----------
@@ -139,6 +178,11 @@ def canonical_bytes(item: Dict[str, Any]) -> bytes:
 def record_hash(item: Dict[str, Any]) -> str:
     return hashlib.sha256(canonical_bytes(item)).hexdigest()
 
+def record_hash_and_size(item: Dict[str, Any]) -> Tuple[str, int]:
+    """record_hash + 정규화 JSON 바이트 수 (계측용, 직렬화는 한 번만)"""
+    data = canonical_bytes(item)
+    return hashlib.sha256(data).hexdigest(), len(data)
+
 def chunked(it: Iterable, size: int) -> Iterable[List]:
     buf: List = []
     for x in it:
@@ -150,52 +194,37 @@ def chunked(it: Iterable, size: int) -> Iterable[List]:
         yield buf
 
 # ---------- Core ----------
-def load_raw_pages(conn: psycopg.Connection) -> List[Dict[str, Any]]:
-    """처리할 RAW 페이지들을 로드."""
-    with conn.cursor(row_factory=dict_row) as cur:
-        if PROCESS_ONLY_UNSEEN:
-            if LOOKBACK_HOURS > 0:
-                cur.execute(
-                    """
-                    select p.ingest_id, p.page_no, p.payload
-                      from raw.youthpolicy_pages p
-                     where p.ingested_at >= now() - interval '%s hours'
-                       and not exists (
-                           select 1 from stg.youthpolicy_landing l
-                            where l.raw_ingest_id = p.ingest_id
-                       )
-                     order by p.ingested_at asc, p.page_no asc
-                    """,
-                    (LOOKBACK_HOURS,),
-                )
-            else:
-                cur.execute(
-                    """
-                    select p.ingest_id, p.page_no, p.payload
-                      from raw.youthpolicy_pages p
-                     where not exists (
-                           select 1 from stg.youthpolicy_landing l
-                            where l.raw_ingest_id = p.ingest_id
-                       )
-                     order by p.ingested_at asc, p.page_no asc
-                    """
-                )
-        else:
-            if LOOKBACK_HOURS > 0:
-                cur.execute(
-                    """
-                    select ingest_id, page_no, payload
-                      from raw.youthpolicy_pages
-                     where ingested_at >= now() - interval '%s hours'
-                     order by ingested_at asc, page_no asc
-                    """,
-                    (LOOKBACK_HOURS,),
-                )
-            else:
-                cur.execute(
-                    "select ingest_id, page_no, payload from raw.youthpolicy_pages order by ingested_at asc, page_no asc"
-                )
+def load_raw_pages(conn: psycopg.Connection, exclude_ids: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+    """
+    처리할 RAW 페이지들을 로드.
+    - exclude_ids: 이미 메모리에 있는 페이지(pipeline에서 raw 단계가 넘겨준 페이지)는 제외
+    """
+    where: List[str] = []
+    params: List[Any] = []
+    if LOOKBACK_HOURS > 0:
+        where.append("p.ingested_at >= now() - make_interval(hours => %s)")
+        params.append(LOOKBACK_HOURS)
+    if PROCESS_ONLY_UNSEEN:
+        where.append("""not exists (
+                   select 1 from stg.youthpolicy_landing l
+                    where l.raw_ingest_id = p.ingest_id
+               )""")
+    if exclude_ids:
+        where.append("p.ingest_id <> all(%s)")
+        params.append(list(exclude_ids))
+
+    with METRICS.step("load_raw_pages") as st, conn.cursor(row_factory=dict_row) as cur:
+        cur.execute(
+            f"""
+            select p.ingest_id, p.page_no, p.payload
+              from raw.youthpolicy_pages p
+             {"where " + " and ".join(where) if where else ""}
+             order by p.ingested_at asc, p.page_no asc
+            """,
+            params,
+        )
         rows = cur.fetchall()
+        st.rows_out += len(rows)
     log.info("Loaded RAW pages: %s (lookback=%sh, only_unseen=%s)", len(rows), LOOKBACK_HOURS, bool(PROCESS_ONLY_UNSEEN))
     return rows
 
@@ -204,7 +233,7 @@ def upsert_landing(conn: psycopg.Connection, pages: List[Dict[str, Any]]) -> Non
     total_items = 0
     surrogate_used = 0
 
-    with conn.cursor() as cur:
+    with METRICS.step("upsert_landing") as st, conn.cursor() as cur:
         for r in pages:
             ingest_id = r["ingest_id"]
             page_no = int(r["page_no"])
@@ -219,10 +248,12 @@ def upsert_landing(conn: psycopg.Connection, pages: List[Dict[str, Any]]) -> Non
                 pid = pick_policy_id(it)
                 if pid.startswith("SURR::"):
                     surrogate_used += 1
-                h = record_hash(it)
+                h, size = record_hash_and_size(it)
+                st.bytes += size
                 prepared.append((pid, h, Json(it), str(ingest_id), page_no))
 
             total_items += len(prepared)
+            st.rows_in += len(prepared)
 
             for batch in chunked(prepared, BATCH_SIZE):
                 cur.executemany(
@@ -234,20 +265,27 @@ def upsert_landing(conn: psycopg.Connection, pages: List[Dict[str, Any]]) -> Non
                     """,
                     batch,
                 )
+                st.rows_out += cur.rowcount
+                st.inserted += cur.rowcount
             conn.commit()
 
     log.info("Landing upsert complete. items=%s, surrogate_used=%s", total_items, surrogate_used)
 
+@profiling.profiled("stg_landing")
 def main() -> None:
     log.info("STG landing transform start")
     with psycopg.connect(PG_DSN) as conn:
-        bootstrap(conn)
-        pages = load_raw_pages(conn)
-        if not pages:
-            log.info("No RAW pages to process. Done.")
-            return
-        upsert_landing(conn, pages)
-    log.info("STG landing transform done")
+        etl_metrics.instrument(conn)
+        try:
+            bootstrap(conn)
+            pages = load_raw_pages(conn)
+            if not pages:
+                log.info("No RAW pages to process. Done.")
+                return
+            upsert_landing(conn, pages)
+        finally:
+            METRICS.flush(conn)
+    log.info("STG landing transform done (%s)", METRICS.summary())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+stg_landing_compact.py
+- stg.youthpolicy_landing 이력 압축 (주기 배치)
+- 정책별 버전 행(policy_id, record_hash, ingested_at, 생성 컬럼)은 모두 유지하고,
+  다음 버전으로 대체된 지 보존 기간이 지난 버전의 raw_json 본문만 요약 JSON으로 교체
+  · 요약 JSON = 생성 컬럼 원본 키(lastMdfcnDt) → last_mdfcn_at 값 유지
+  · 정책별 최신 버전(ingested_at 기준)과 stg.youthpolicy_current가 가리키는 버전은 건드리지 않음
+  · 교체한 행은 pruned_at 기록 (record_hash는 원본 본문 기준 그대로)
+- 정리 후 VACUUM (ANALYZE) 으로 TOAST 공간 재사용, LANDING_VACUUM_FULL=1이면 VACUUM FULL로 재작성
+  · VACUUM FULL은 기존 물리 순서(적재 순 ≒ ingested_at 순)대로 다시 써서 크기만 줄임
+    → idx_stg_landing_ingested_brin의 블록 범위가 계속 좁게 유지되어 최근 구간(LOOKBACK) 조회가 유효
+  · CLUSTER(policy_id 순 재배치)는 정책마다 최근 행을 힙 전체에 흩어 BRIN을 무력화하므로 쓰지 않음
+  · ACCESS EXCLUSIVE 잠금, 적재 없는 시간에 실행
+
+ENV (.env 권장):
+  PG_DSN=postgresql://<user>:<pass>@<host>:<port>/<db>
+  LANDING_RETENTION_DAYS=90     # 대체된 지 N일 지난 버전의 본문 정리 (최소 1)
+  LANDING_COMPACT_BATCH=5000    # UPDATE/커밋 단위 행 수
+  LANDING_COMPACT_DRY_RUN=0     # 1이면 대상 건수/크기만 출력
+  LANDING_VACUUM_FULL=0         # 1이면 정리 후 VACUUM (FULL, ANALYZE) (아니면 VACUUM (ANALYZE))
+  LOG_LEVEL=INFO
+  ETL_METRICS_DIR=              # 선택: 단계별 계측 textfile 디렉터리 (etl_metrics 참고)
+  PROFILE=                      # 선택: cpu,mem,sql 프로파일 → PROFILE_DIR (profiling 참고)
+"""
+
+import os
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import List, Tuple
+
+import psycopg
+
+import etl_metrics
+import profiling
+
+try:
+    from dotenv import load_dotenv  # optional
+    load_dotenv()
+except Exception:
+    pass
+
+# ------------ ENV ------------
+def env_str(name: str, default: str | None = None) -> str:
+    v = os.getenv(name, default)
+    if v is None or v == "":
+        raise RuntimeError(f"Missing environment variable: {name}")
+    return v
+
+def env_int(name: str, default: int) -> int:
+    v = os.getenv(name)
+    return int(v) if v not in (None, "") else default
+
+PG_DSN = env_str("PG_DSN")
+LANDING_RETENTION_DAYS = env_int("LANDING_RETENTION_DAYS", 90)
+LANDING_COMPACT_BATCH = env_int("LANDING_COMPACT_BATCH", 5000)
+LANDING_COMPACT_DRY_RUN = env_int("LANDING_COMPACT_DRY_RUN", 0)
+LANDING_VACUUM_FULL = env_int("LANDING_VACUUM_FULL", 0)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+logging.basicConfig(
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    format="%(asctime)s %(levelname)s stg_landing_compact :: %(message)s",
+)
+log = logging.getLogger("stg_landing_compact")
+
+METRICS = etl_metrics.StageMetrics("landing_compact")
+
+# ------------ Bootstrap ------------
+BOOTSTRAP_SQL = """
+alter table stg.youthpolicy_landing add column if not exists pruned_at timestamptz;
+"""
+
+def bootstrap(conn: psycopg.Connection) -> None:
+    with conn.cursor() as cur:
+        cur.execute(BOOTSTRAP_SQL)
+    conn.commit()
+    etl_metrics.bootstrap(conn)
+    log.info("Bootstrap: stg.youthpolicy_landing.pruned_at ready")
+
+# ------------ Core ------------
+# 정리 후에도 남기는 raw_json 키 (landing 생성 컬럼의 원본)
+STUB_KEYS = ("lastMdfcnDt",)
+
+# 대체 시각 = 같은 정책에서 ingested_at이 더 큰 다음 버전의 ingested_at
+# (최신 버전, 최신과 ingested_at이 같은 버전은 null → 대상 아님)
+CANDIDATES_SQL = """
+with versions as (
+    select l.policy_id, l.record_hash, l.pruned_at,
+           pg_column_size(l.raw_json) as body_bytes,
+           min(l.ingested_at) over (
+               partition by l.policy_id order by l.ingested_at
+               range between current row and unbounded following exclude group
+           ) as superseded_at
+      from stg.youthpolicy_landing l
+)
+select v.policy_id, v.record_hash, v.body_bytes
+  from versions v
+ where v.pruned_at is null
+   and v.superseded_at < %(cutoff)s
+   and not exists (
+       select 1 from stg.youthpolicy_current c
+        where c.policy_id = v.policy_id and c.record_hash = v.record_hash
+   )
+ order by v.policy_id, v.record_hash
+"""
+
+PRUNE_SQL = f"""
+update stg.youthpolicy_landing l
+   set raw_json  = jsonb_strip_nulls(jsonb_build_object({", ".join(f"'{k}', l.raw_json->'{k}'" for k in STUB_KEYS)})),
+       pruned_at = now()
+  from unnest(%(policy_ids)s::text[], %(record_hashes)s::bpchar[]) as t(policy_id, record_hash)
+ where l.policy_id = t.policy_id
+   and l.record_hash = t.record_hash
+   and l.pruned_at is null
+"""
+
+def find_candidates(conn: psycopg.Connection, cutoff: datetime) -> List[Tuple[str, str, int]]:
+    """정리 대상 (policy_id, record_hash, 본문 크기)"""
+    with METRICS.step("candidates") as st, conn.cursor() as cur:
+        cur.execute(CANDIDATES_SQL, {"cutoff": cutoff})
+        rows = cur.fetchall()
+        st.rows_out += len(rows)
+        st.bytes += sum(r[2] for r in rows)
+    conn.commit()
+    return rows
+
+def prune_bodies(conn: psycopg.Connection, candidates: List[Tuple[str, str, int]]) -> int:
+    """대상 본문을 요약 JSON으로 교체, 배치마다 커밋"""
+    pruned = 0
+    with METRICS.step("prune") as st, conn.cursor() as cur:
+        for i in range(0, len(candidates), LANDING_COMPACT_BATCH):
+            batch = candidates[i:i + LANDING_COMPACT_BATCH]
+            st.rows_in += len(batch)
+            cur.execute(PRUNE_SQL, {
+                "policy_ids": [r[0] for r in batch],
+                "record_hashes": [r[1] for r in batch],
+            })
+            st.rows_out += cur.rowcount
+            st.updated += cur.rowcount
+            pruned += cur.rowcount
+            conn.commit()
+    return pruned
+
+def reorganize(conn: psycopg.Connection, *, full: bool) -> None:
+    """VACUUM (FULL, ANALYZE)(물리 순서 유지 재작성) 또는 VACUUM (ANALYZE) - 트랜잭션 밖에서 실행"""
+    conn.commit()
+    conn.autocommit = True
+    try:
+        if full:
+            with METRICS.step("vacuum_full"):
+                conn.execute("vacuum (full, analyze) stg.youthpolicy_landing")
+        else:
+            with METRICS.step("vacuum"):
+                conn.execute("vacuum (analyze) stg.youthpolicy_landing")
+    finally:
+        conn.autocommit = False
+
+def landing_size(conn: psycopg.Connection) -> int:
+    row = conn.execute("select pg_total_relation_size('stg.youthpolicy_landing')").fetchone()
+    conn.commit()
+    return int(row[0])
+
+@profiling.profiled("stg_landing_compact")
+def main() -> None:
+    if LANDING_RETENTION_DAYS < 1:
+        raise RuntimeError("LANDING_RETENTION_DAYS must be >= 1")
+    cutoff = datetime.now(timezone.utc) - timedelta(days=LANDING_RETENTION_DAYS)
+    log.info("Landing compaction start (superseded before %s, retention=%sd, dry_run=%s, vacuum_full=%s)",
+             cutoff.isoformat(timespec="seconds"), LANDING_RETENTION_DAYS, bool(LANDING_COMPACT_DRY_RUN), bool(LANDING_VACUUM_FULL))
+    with psycopg.connect(PG_DSN) as conn:
+        etl_metrics.instrument(conn)
+        try:
+            bootstrap(conn)
+            size_before = landing_size(conn)
+            candidates = find_candidates(conn, cutoff)
+            log.info("Candidates: %s versions, %.1f MiB of raw_json",
+                     len(candidates), sum(r[2] for r in candidates) / 2**20)
+            if not LANDING_COMPACT_DRY_RUN:
+                pruned = prune_bodies(conn, candidates)
+                reorganize(conn, full=bool(LANDING_VACUUM_FULL))
+                size_after = landing_size(conn)
+                log.info("Pruned %s bodies. landing size %.1f MiB -> %.1f MiB",
+                         pruned, size_before / 2**20, size_after / 2**20)
+        finally:
+            METRICS.flush(conn)
+    log.info("Landing compaction done (%s)", METRICS.summary())
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ ENV (.env 권장):
   LOOKBACK_HOURS=24         # 최근 N시간 landing만 보고 최신 선택(0이면 전체 스캔)
   INACTIVE_AFTER_DAYS=14    # N일 이상 관측 안 되면 is_active=false (0이면 미적용)
   LOG_LEVEL=INFO
+  ETL_METRICS_DIR=          # 선택: 단계별 계측 textfile 디렉터리 (etl_metrics 참고)
+  PROFILE=                  # 선택: cpu,mem,sql 프로파일 → PROFILE_DIR (profiling 참고)
 """
 
 import os
@@ -18,6 +20,9 @@ from datetime import datetime, timezone, timedelta
 import psycopg
 from psycopg.rows import dict_row
 
+import etl_metrics
+import profiling
+
 try:
     from dotenv import load_dotenv  # optional
     load_dotenv()
@@ -46,6 +51,8 @@ logging.basicConfig(
 )
 log = logging.getLogger("stg_current_refresh")
 
+METRICS = etl_metrics.StageMetrics("current")
+
 # ------------ Bootstrap ------------
 BOOTSTRAP_SQL = """
 create schema if not exists stg;
@@ -64,6 +71,7 @@ def bootstrap(conn: psycopg.Connection) -> None:
     with conn.cursor() as cur:
         cur.execute(BOOTSTRAP_SQL)
     conn.commit()
+    etl_metrics.bootstrap(conn)
     log.info("Bootstrap: stg.youthpolicy_current ready")
 
 # ------------ Core ------------
@@ -74,73 +82,86 @@ def refresh_current(conn: psycopg.Connection) -> None:
 
     with conn.cursor(row_factory=dict_row) as cur:
         # 1) 최신 후보 집합(tmp_latest) 구성
-        if cutoff_ts is not None:
-            cur.execute("""
-                create temporary table tmp_latest on commit drop as
-                select distinct on (l.policy_id)
-                  l.policy_id, l.record_hash, l.ingested_at
-                from stg.youthpolicy_landing l
-                where l.ingested_at >= %s
-                order by l.policy_id, l.ingested_at desc;
-            """, (cutoff_ts,))
-        else:
+        with METRICS.step("latest") as st:
+            if cutoff_ts is not None:
+                cur.execute("""
+                    create temporary table tmp_latest on commit drop as
+                    select distinct on (l.policy_id)
+                      l.policy_id, l.record_hash, l.ingested_at
+                    from stg.youthpolicy_landing l
+                    where l.ingested_at >= %s
+                    order by l.policy_id, l.ingested_at desc;
+                """, (cutoff_ts,))
+            else:
+                cur.execute("""
+                    create temporary table tmp_latest on commit drop as
+                    select distinct on (l.policy_id)
+                      l.policy_id, l.record_hash, l.ingested_at
+                    from stg.youthpolicy_landing l
+                    order by l.policy_id, l.ingested_at desc;
+                """)
+            st.rows_out += cur.rowcount
+
+        # 2) 최초 관측 시각(전 구간) 집계: upsert 대상(tmp_latest) 정책만
+        #    (landing 압축은 버전 행을 지우지 않으므로 최초 시각 유지)
+        with METRICS.step("first_seen") as st:
             cur.execute("""
-                create temporary table tmp_latest on commit drop as
-                select distinct on (l.policy_id)
-                  l.policy_id, l.record_hash, l.ingested_at
+                create temporary table tmp_first_seen on commit drop as
+                select l.policy_id, min(l.ingested_at) as first_seen_at
                 from stg.youthpolicy_landing l
-                order by l.policy_id, l.ingested_at desc;
+                where l.policy_id in (select policy_id from tmp_latest)
+                group by l.policy_id;
             """)
-
-        # 2) 최초 관측 시각(전 구간) 집계
-        cur.execute("""
-            create temporary table tmp_first_seen on commit drop as
-            select policy_id, min(ingested_at) as first_seen_at
-            from stg.youthpolicy_landing
-            group by policy_id;
-        """)
+            st.rows_out += cur.rowcount
 
         # 3) 변경 건수 확인(디버깅용)
-        cur.execute("""
-            select count(*) as diff_count
-            from tmp_latest tl
-            join stg.youthpolicy_current c on c.policy_id = tl.policy_id
-            where c.record_hash <> tl.record_hash;
-        """)
-        diff_count = cur.fetchone()["diff_count"]
+        with METRICS.step("diff") as st:
+            cur.execute("""
+                select count(*) as diff_count
+                from tmp_latest tl
+                join stg.youthpolicy_current c on c.policy_id = tl.policy_id
+                where c.record_hash <> tl.record_hash;
+            """)
+            diff_count = cur.fetchone()["diff_count"]
+            st.rows_out += diff_count
         log.info("Diff (hash changed) in window: %s", diff_count)
 
         # 4) upsert 적용: 최신 해시 반영 + last_seen_at 갱신 + first_seen_at 최소값 유지
-        cur.execute("""
-            insert into stg.youthpolicy_current
-                (policy_id, record_hash, first_seen_at, last_seen_at, is_active)
-            select
-                tl.policy_id,
-                tl.record_hash,
-                fs.first_seen_at,
-                now(),
-                true
-            from tmp_latest tl
-            join tmp_first_seen fs using (policy_id)
-            on conflict (policy_id) do update
-              set last_seen_at = excluded.last_seen_at,
-                  is_active    = true,
-                  record_hash  = case
-                                   when stg.youthpolicy_current.record_hash <> excluded.record_hash
-                                   then excluded.record_hash
-                                   else stg.youthpolicy_current.record_hash
-                                 end,
-                  first_seen_at = least(stg.youthpolicy_current.first_seen_at, excluded.first_seen_at);
-        """)
+        with METRICS.step("upsert_current") as st:
+            cur.execute("""
+                insert into stg.youthpolicy_current
+                    (policy_id, record_hash, first_seen_at, last_seen_at, is_active)
+                select
+                    tl.policy_id,
+                    tl.record_hash,
+                    fs.first_seen_at,
+                    now(),
+                    true
+                from tmp_latest tl
+                join tmp_first_seen fs using (policy_id)
+                on conflict (policy_id) do update
+                  set last_seen_at = excluded.last_seen_at,
+                      is_active    = true,
+                      record_hash  = case
+                                       when stg.youthpolicy_current.record_hash <> excluded.record_hash
+                                       then excluded.record_hash
+                                       else stg.youthpolicy_current.record_hash
+                                     end,
+                      first_seen_at = least(stg.youthpolicy_current.first_seen_at, excluded.first_seen_at);
+            """)
+            st.rows_out += cur.rowcount
 
         # 5) 비활성 스윕(옵션) - interval 파라미터 대신 컷오프 타임스탬프 사용
         if INACTIVE_AFTER_DAYS > 0:
             inactive_cutoff = datetime.now(timezone.utc) - timedelta(days=INACTIVE_AFTER_DAYS)
-            cur.execute("""
-                update stg.youthpolicy_current
-                   set is_active = false
-                 where last_seen_at < %s;
-            """, (inactive_cutoff,))
+            with METRICS.step("inactive_sweep") as st:
+                cur.execute("""
+                    update stg.youthpolicy_current
+                       set is_active = false
+                     where last_seen_at < %s;
+                """, (inactive_cutoff,))
+                st.rows_out += cur.rowcount
+                st.updated += cur.rowcount
 
         # 6) 현황 로그
         cur.execute("select count(*) as seen_policies from tmp_latest;")
@@ -148,16 +169,22 @@ def refresh_current(conn: psycopg.Connection) -> None:
         cur.execute("select count(*) as current_rows from stg.youthpolicy_current;")
         cur_cnt = cur.fetchone()["current_rows"]
 
-    conn.commit()
+    with METRICS.step("commit"):
+        conn.commit()
     log.info("Upsert applied. seen_in_window=%s, current_total=%s, inactive_threshold=%sd",
              seen_cnt, cur_cnt, INACTIVE_AFTER_DAYS)
 
+@profiling.profiled("stg_refresh_current")
 def main() -> None:
     log.info("STG current refresh start (lookback=%sh, inactive_after=%sd)", LOOKBACK_HOURS, INACTIVE_AFTER_DAYS)
     with psycopg.connect(PG_DSN) as conn:
-        bootstrap(conn)
-        refresh_current(conn)
-    log.info("STG current refresh complete")
+        etl_metrics.instrument(conn)
+        try:
+            bootstrap(conn)
+            refresh_current(conn)
+        finally:
+            METRICS.flush(conn)
+    log.info("STG current refresh complete (%s)", METRICS.summary())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
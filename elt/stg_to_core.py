@@ -4,21 +4,36 @@ import os
 import unicodedata
 from dotenv import load_dotenv
 
+import psycopg
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.engine import Engine, Connection
+from sqlalchemy.engine import Engine, Connection, make_url
 
-from typing import Iterable, List, Dict, Any, Optional, Set
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Mapping, Optional, Sequence, Set, Tuple
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import partial
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
+import traceback
 from datetime import datetime, date, timezone, timedelta
 KST = timezone(timedelta(hours=9))
 
 from pprint import pprint
 
+import time
+
 import json
+import hashlib
+
+import numpy as np
+import pandas as pd
 
-from tqdm.auto import tqdm
+import etl_metrics
+import fast_parse
+import profiling
+from master_cache import LOOKUPS, MASTER_CACHE, get_lookup
+from code_tables import UNKNOWN, code_enum, is_restricted
 
 def _chunked(seq: List[Any], n: int) -> Iterable[List[Any]]:
     for i in range(0, len(seq), n):
@@ -28,9 +43,104 @@ def _chunked(seq: List[Any], n: int) -> Iterable[List[Any]]:
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 ETL_SOURCE = os.getenv("ETL_SOURCE")
+# 0 = 변경분 전체를 한 번에 처리, >0 = N건 단위로 스트리밍/정규화/동기화 후 배치별 커밋
+ETL_BATCH_SIZE = int(os.getenv("ETL_BATCH_SIZE") or 0)
+# 1 = core 동기화(upsert + 모든 sync_*)를 커넥션 하나, 트랜잭션 하나로 수행
+ETL_SINGLE_TX = os.getenv("ETL_SINGLE_TX", "0") == "1"
+# >1 = 정규화를 N개 프로세스로 병렬 수행 (ETL_NORMALIZE_CHUNK 건씩 분배), 0/1 = 현재 프로세스
+ETL_NORMALIZE_WORKERS = int(os.getenv("ETL_NORMALIZE_WORKERS") or 1)
+ETL_NORMALIZE_CHUNK = int(os.getenv("ETL_NORMALIZE_CHUNK") or 2000)
+# 브릿지 동기화 방식: auto(서버 버전으로 선택) | merge | two_step
+ETL_BRIDGE_STRATEGY = os.getenv("ETL_BRIDGE_STRATEGY", "auto")
+# >1 = upsert_policy 이후 하위 테이블(브릿지/eligibility) 동기화를 N개 스레드, 각자 커넥션에서 동시 실행
+#      (ETL_SINGLE_TX=1이면 커넥션 하나라 순차 실행)
+ETL_BRIDGE_WORKERS = int(os.getenv("ETL_BRIDGE_WORKERS") or 1)
+# 샤드 수: 변경분을 hash(policy_id) 기준 N개로 나눠 샤드별 프로세스/커넥션에서 동기화 (1 = 단일 프로세스)
+ETL_SHARDS = int(os.getenv("ETL_SHARDS") or 1)
+# 지정 시 이 샤드(0..ETL_SHARDS-1)만 현재 프로세스에서 실행 (샤드를 별도 잡/호스트로 돌릴 때)
+ETL_SHARD = int(os.environ["ETL_SHARD"]) if os.getenv("ETL_SHARD") else None
+# 동시에 실행할 샤드 프로세스 수 (0 = ETL_SHARDS)
+ETL_SHARD_WORKERS = int(os.getenv("ETL_SHARD_WORKERS") or 0)
+
+# --plan 예상 시간: 테이블별 최근 N개 기록(meta.etl_stage_stats)의 정책 1건당 평균 소요 시간 사용
+PLAN_HISTORY_RUNS = int(os.getenv("PLAN_HISTORY_RUNS") or 10)
+
+# DB 드라이버는 psycopg(3) 하나만 사용: 드라이버 미지정/psycopg2 URL도 psycopg로 연결
+PSYCOPG_DRIVERS = ("postgresql", "postgresql+psycopg2")
+
+def psycopg_url(url: str) -> str:
+    u = make_url(url)
+    if u.drivername in PSYCOPG_DRIVERS:
+        u = u.set(drivername="postgresql+psycopg")
+    return u.render_as_string(hide_password=False)
+
+# 단계별 계측 (meta.etl_stage_stats, ETL_METRICS_DIR/core.prom)
+METRICS = etl_metrics.StageMetrics("core")
 
 def get_engine() -> Engine:
-    return create_engine(DATABASE_URL, future=True)
+    return etl_metrics.instrument_engine(create_engine(psycopg_url(DATABASE_URL), future=True))
+
+def driver_connection(conn: Connection) -> psycopg.Connection:
+    """SQLAlchemy Connection 아래의 psycopg 커넥션 (같은 트랜잭션을 공유)"""
+    return conn.connection.driver_connection
+
+def copy_rows(conn: Connection, table: str, columns: Sequence[Tuple[str, str]], rows: Iterable[Sequence[Any]]) -> int:
+    """
+    rows를 table에 COPY ... FROM STDIN (FORMAT BINARY)로 적재, 적재 건수 반환.
+    - columns: (컬럼명, PostgreSQL 타입명) 순서대로, rows의 각 행은 같은 순서의 값
+    - 타입을 미리 지정하므로 값은 서버 바이너리 형식으로 바로 직렬화 (텍스트 파싱/캐스팅 없음)
+    - 호출자 트랜잭션 안에서 실행 (대상 테이블은 먼저 conn.execute로 만들어 둘 것)
+    """
+    n = 0
+    with driver_connection(conn).cursor() as cur:
+        with cur.copy(f"COPY {table} ({', '.join(c for c, _ in columns)}) FROM STDIN (FORMAT BINARY)") as cp:
+            cp.set_types([t for _, t in columns])
+            for row in rows:
+                cp.write_row(row)
+                n += 1
+    return n
+
+# core 동기화 보조 테이블 (idempotent)
+BOOTSTRAP_SQL = """
+create schema if not exists meta;
+
+-- upsert_policy 컬럼 그룹별 해시 (POLICY_COLUMN_GROUPS)
+alter table core.policy add column if not exists group_hashes jsonb;
+
+-- 검색용 가중치 tsvector: 제목(A) > 요약(B) > 본문(C) > AI 요약(D), NULL 컬럼은 빈 문자열
+-- (기존 ft_policy_text는 NULL 연결로 문서 전체가 NULL이 되어 검색 불가 -> 대체)
+create or replace function core.policy_search_tsv(title text, summary_raw text, description_raw text, summary_ai text)
+returns tsvector language sql immutable parallel safe as $$
+  select setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+      || setweight(to_tsvector('simple', coalesce(summary_raw, '')), 'B')
+      || setweight(to_tsvector('simple', coalesce(description_raw, '')), 'C')
+      || setweight(to_tsvector('simple', coalesce(summary_ai, '')), 'D')
+$$;
+alter table core.policy add column if not exists search_tsv tsvector;
+update core.policy
+   set search_tsv = core.policy_search_tsv(title, summary_raw, description_raw, summary_ai)
+ where search_tsv is null;
+drop index if exists core.ft_policy_text;
+create index if not exists ix_policy_search_tsv on core.policy using gin (search_tsv);
+
+-- master에 없는 코드로 버려진 링크 (브릿지별 격리)
+create table if not exists meta.etl_unknown_code (
+  bridge        text        not null,
+  code          text        not null,
+  policy_id     text        not null,
+  first_seen_at timestamptz not null default now(),
+  last_seen_at  timestamptz not null default now(),
+  seen_count    int         not null default 1,
+  primary key (bridge, code, policy_id)
+);
+create index if not exists idx_etl_unknown_code_policy on meta.etl_unknown_code(policy_id);
+"""
+
+def bootstrap(engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.exec_driver_sql(BOOTSTRAP_SQL)
+        conn.exec_driver_sql(etl_metrics.BOOTSTRAP_SQL)
+    print("✅ Bootstrap complete (meta tables ready).")
 
 def test_connection(engine: Engine) -> None:
     try:
@@ -42,41 +152,112 @@ def test_connection(engine: Engine) -> None:
 
 # stg.youthpolicy_current와 core.policy에서 해시값 비교 후
 # 신규/변경 정책에 대해서만 stg.youthpolicy_landing에서 데이터 가져오기
-def fetch_changed_rows(conn: Connection) -> List[Dict[str, Any]]:
-    sql = text(
-        """
-        SELECT  stg_c.policy_id,
-                stg_c.record_hash,
-                stg_l.raw_json
-        FROM    stg.youthpolicy_current AS stg_c
-        LEFT JOIN core.policy AS core_p
-        ON stg_c.policy_id = core_p.id
-        JOIN (
-            SELECT DISTINCT ON (policy_id) policy_id, raw_json
-            FROM stg.youthpolicy_landing
-            ORDER BY policy_id, ingested_at DESC
-        ) AS stg_l
-        ON stg_c.policy_id = stg_l.policy_id
-        WHERE   core_p.id IS NULL
-            OR  stg_c.record_hash <> core_p.content_hash;
-        """
-    )
-    rows = conn.execute(sql).mappings().all()
-    out: List[Dict[str, Any]] = []
-    for r in rows:
-        out.append({
-            "policy_id": r["policy_id"],
-            "record_hash": r["record_hash"],
-            "raw_json": r["raw_json"],
-        })
-    return out
+# (정책마다 idx_stg_landing_policy_ingested로 최신 버전 한 건만 조회, landing 전체 스캔 없음)
+CHANGED_ROWS_SQL = """
+    SELECT  stg_c.policy_id,
+            stg_c.record_hash,
+            stg_l.raw_json
+    FROM    stg.youthpolicy_current AS stg_c
+    LEFT JOIN core.policy AS core_p
+    ON stg_c.policy_id = core_p.id
+    JOIN LATERAL (
+        SELECT raw_json
+        FROM stg.youthpolicy_landing AS l
+        WHERE l.policy_id = stg_c.policy_id
+        ORDER BY l.ingested_at DESC
+        LIMIT 1
+    ) AS stg_l
+    ON true
+    WHERE   (core_p.id IS NULL
+        OR  stg_c.record_hash <> core_p.content_hash)
+"""
+
+# ---------- 샤드 ----------
+# policy_id는 hashtext 기준 SHARD_BUCKETS개 버킷으로 나뉘고, 버킷 b는 샤드 b % N에 속함.
+# 버킷마다 advisory lock 하나: 샤드는 자기 버킷 잠금을 모두 잡아야 실행되므로
+# 같은 샤드의 재실행이나 샤드 수(N)가 다른 실행이 같은 정책을 동시에 처리하지 않음.
+SHARD_BUCKETS = 64   # 2의 거듭제곱 (ETL_SHARDS 최대값)
+SHARD_LOCK_NAMESPACE = "stg_to_core.shard"   # pg_try_advisory_lock(hashtext(namespace), bucket)
+
+SHARD_FILTER_SQL = f"""    AND     (hashtext(stg_c.policy_id) & {SHARD_BUCKETS - 1}) % :shards = :shard
+"""
+
+def changed_rows_sql(shard: Optional[Tuple[int, int]] = None) -> str:
+    """CHANGED_ROWS_SQL, shard=(k, N)이면 샤드 k의 정책만 (파라미터 :shard, :shards)"""
+    return CHANGED_ROWS_SQL + (SHARD_FILTER_SQL if shard is not None else "")
+
+def shard_params(shard: Optional[Tuple[int, int]]) -> Dict[str, int]:
+    return {} if shard is None else {"shard": shard[0], "shards": shard[1]}
+
+def shard_buckets(shard: int, shards: int) -> List[int]:
+    """샤드 shard(0..shards-1)에 속한 버킷 번호"""
+    if not 1 <= shards <= SHARD_BUCKETS or not 0 <= shard < shards:
+        raise ValueError(f"invalid shard {shard} of {shards} (shards must be 1..{SHARD_BUCKETS})")
+    return [b for b in range(SHARD_BUCKETS) if b % shards == shard]
+
+def try_lock_buckets(conn: Connection, buckets: List[int]) -> bool:
+    """
+    버킷 advisory lock(세션 단위)을 모두 잡으면 True.
+    하나라도 다른 세션이 잡고 있으면 이미 잡은 것은 풀고 False (대기하지 않음)
+    """
+    rows = conn.execute(
+        text("SELECT b, pg_try_advisory_lock(hashtext(:ns), b) FROM unnest(CAST(:buckets AS INT[])) AS b"),
+        {"ns": SHARD_LOCK_NAMESPACE, "buckets": buckets},
+    ).all()
+    acquired = [b for b, ok in rows if ok]
+    if len(acquired) < len(buckets):
+        unlock_buckets(conn, acquired)
+        return False
+    conn.commit()   # 세션 잠금은 트랜잭션과 무관, 잠금 커넥션이 idle in transaction으로 남지 않도록
+    return True
 
+def unlock_buckets(conn: Connection, buckets: List[int]) -> None:
+    conn.execute(
+        text("SELECT pg_advisory_unlock(hashtext(:ns), b) FROM unnest(CAST(:buckets AS INT[])) AS b"),
+        {"ns": SHARD_LOCK_NAMESPACE, "buckets": buckets},
+    )
+    conn.commit()
 
-# TODO: 실제 AI 요약 API 호출 로직 구현 (파라미터, 로직, 반환값)
-def ai_summary(text: str) -> str:
-    return None
+def fetch_changed_rows(conn: Connection, shard: Optional[Tuple[int, int]] = None) -> List[Dict[str, Any]]:
+    with METRICS.step("fetch_changed_rows") as st:
+        rows = conn.execute(text(changed_rows_sql(shard)), shard_params(shard)).mappings().all()
+        out: List[Dict[str, Any]] = []
+        for r in rows:
+            out.append({
+                "policy_id": r["policy_id"],
+                "record_hash": r["record_hash"],
+                "raw_json": r["raw_json"],
+            })
+        st.rows_out += len(out)
+    return out
 
-@dataclass
+def iter_changed_rows(conn: Connection, batch_size: int, shard: Optional[Tuple[int, int]] = None) -> Iterator[List[Dict[str, Any]]]:
+    """
+    fetch_changed_rows의 스트리밍 버전.
+    - 서버 사이드 커서(stream_results)로 batch_size 건씩 끊어서 반환
+    - policy_id 순으로 정렬하여 체크포인트 로그가 진행 위치를 나타내도록 함
+    - conn은 스트리밍이 끝날 때까지 열려 있어야 함 (쓰기는 별도 커넥션에서 수행)
+    """
+    with METRICS.step("fetch_changed_rows"):
+        result = conn.execution_options(stream_results=True, max_row_buffer=batch_size).execute(
+            text(changed_rows_sql(shard) + "    ORDER BY stg_c.policy_id\n"), shard_params(shard)
+        )
+        parts = result.mappings().partitions(batch_size)
+    while True:
+        with METRICS.step("fetch_changed_rows") as st:
+            part = next(parts, None)
+            if part is None:
+                return
+            st.rows_out += len(part)
+            rows = [{
+                "policy_id": r["policy_id"],
+                "record_hash": r["record_hash"],
+                "raw_json": r["raw_json"],
+            } for r in part]
+        yield rows
+
+
+@dataclass(slots=True)   # 행 단위 보기 (normalize_row, PolicyBatch.record), 동기화는 PolicyBatch 사용
 class NormalizedPolicy:
     id: str
     ext_id: str
@@ -140,130 +321,299 @@ class NormalizedPolicy:
     regions: List[str] = None
 
 def normalize_row(row: Dict[str, Any]) -> NormalizedPolicy:
-    raw_json = row["raw_json"]
-
-    # core.policy
-    id = row["policy_id"]
-    ext_id = row["policy_id"]
-    ext_source = ETL_SOURCE
-    title = raw_json.get("plcyNm", "")
-    summary_raw = raw_json.get("plcyCn", "")
-    description_raw = raw_json.get("plcySprtCn", "")
-    summary_ai = ai_summary(raw_json)
-    status = set_policy_status(raw_json.get("aplyPrdSeCd", ""), raw_json.get("aplyYmd", ""))     # status는 DB단 트리거에서 처리하도록 변경
-    apply_start, apply_end = parse_period_field(raw_json.get("aplyYmd", ""))
-    last_external_modified = parse_modified_datetime(raw_json.get("lastMdfcnDt"))
-    views = int(raw_json.get("inqCnt", 0))
-    supervising_org = raw_json.get("sprvsnInstCdNm") or None
-    operating_org = raw_json.get("operInstCdNm") or None
-    apply_url = raw_json.get("aplyUrlAddr") or None
-    ref_url_1 = raw_json.get("refUrlAddr1") or None
-    ref_url_2 = raw_json.get("refUrlAddr2") or None
-    payload = raw_json
-    content_hash = row["record_hash"]
-
-    # core.policy_eligibility_* (다대다 관계)
-    subcategories = extract_list_from_payload(raw_json, "mclsfNm")
-    educations = extract_list_from_payload(raw_json, "schoolCd")
-    job_status = extract_list_from_payload(raw_json, "jobCd")
-    majors = extract_list_from_payload(raw_json, "plcyMajorCd")
-    specializations = extract_list_from_payload(raw_json, "sbizCd")
-
-    # core.policy_keyword, core.policy_region
-    keywords = extract_list_from_payload(raw_json, "plcyKywdNm")
-    regions = extract_list_from_payload(raw_json, "zipCd")
-
-    # core.policy_eligibility
-    marital_status = set_marital_status(raw_json.get("mrgSttsCd", ""))
-    age_min = to_int_or_none(raw_json.get("sprtTrgtMinAge", 0))
-    age_max = to_int_or_none(raw_json.get("sprtTrgtMaxAge", 0))
-    income_type = set_income_type(raw_json.get("earnCndSeCd", ""))
-    income_min = to_int_or_none(raw_json.get("earnMinAmt", 0))
-    income_max = to_int_or_none(raw_json.get("earnMaxAmt", 0))
-    income_text = raw_json.get("earnEtcCn") or None
-
-    # core.policy (추가 필드)
-    period_type = set_period_type(raw_json.get("bizPrdSeCd", ""))
-    period_start = parse_date(raw_json.get("bizPrdBgngYmd", ""))
-    period_end = parse_date(raw_json.get("bizPrdEndYmd", ""))
-    period_etc = clean_dash_to_null(raw_json.get("bizPrdEtcCn"))
-    apply_type = set_apply_type(raw_json.get("aplyPrdSeCd", ""))
-    announcement = clean_dash_to_null(raw_json.get("srngMthdCn"))
-    info_etc = clean_dash_to_null(raw_json.get("etcMttrCn"))
-    first_external_created = parse_modified_datetime(raw_json.get("frstRegDt", ""))
-    required_documents = clean_dash_to_null(raw_json.get("sbmsnDcmntCn"))
-    application_process = clean_dash_to_null(raw_json.get("plcyAplyMthdCn"))
-
-    # core.policy_eligibility (추가 필드)
-    eligibility_additional = clean_dash_to_null(raw_json.get("addAplyQlfcCndCn"))
-    eligibility_restrictive = clean_dash_to_null(raw_json.get("ptcpPrpTrgtCn"))
-    restrict_education = set_education_restriction(raw_json.get("schoolCd", ""))
-    restrict_major = set_major_restriction(raw_json.get("plcyMajorCd", ""))
-    restrict_job_status = set_job_status_restriction(raw_json.get("jobCd", ""))
-    restrict_specialization = set_specialization_restriction(raw_json.get("sbizCd", ""))
-
-    
-
-
-    return NormalizedPolicy(
-        id=id,
-        ext_id=ext_id,
-        ext_source=ext_source,
-        title=title,
-        summary_raw=summary_raw,
-        description_raw=description_raw,
-        summary_ai=summary_ai,
-        status=status,
-        apply_start=apply_start,
-        apply_end=apply_end,
-        last_external_modified=last_external_modified,
-        views=views,
-        supervising_org=supervising_org,
-        operating_org=operating_org,
-        apply_url=apply_url,
-        ref_url_1=ref_url_1,
-        ref_url_2=ref_url_2,
-        payload=payload,
-        content_hash=content_hash,
-
-        subcategories=subcategories,
-        educations=educations,
-        job_status=job_status,
-        majors=majors,
-        specializations=specializations,
-
-        keywords=keywords,
-        regions=regions,
-
-        marital_status=marital_status,
-        age_min=age_min,
-        age_max=age_max,
-        income_type=income_type,
-        income_min=income_min,
-        income_max=income_max,
-        income_text=income_text,
-
-        period_type=period_type,
-        period_start=period_start,
-        period_end=period_end,
-        period_etc=period_etc,
-
-        apply_type=apply_type,
-        announcement=announcement,
-        info_etc=info_etc,
-        first_external_created=first_external_created,
-        required_documents=required_documents,
-
-        application_process=application_process,
-
-        eligibility_additional=eligibility_additional,
-        eligibility_restrictive=eligibility_restrictive,
-        restrict_education=restrict_education,
-        restrict_major=restrict_major,
-        restrict_job_status=restrict_job_status,
-        restrict_specialization=restrict_specialization
-    )
-    
+    """정책 한 건 정규화 (normalize_frame과 같은 규칙, 디버깅/점검용 행 단위 보기)"""
+    return PolicyBatch.from_frame(normalize_frame([row])).record(0)
+
+# ---------- 정책 배치 (컬럼 단위 컨테이너) ----------
+# 동기화 단계 입력은 NormalizedPolicy 목록 대신 PolicyBatch 하나 (정책마다 객체/목록을 만들지 않음)
+# - 스칼라 필드: 필드별 값 목록 (null 없는 bool/int 필드는 numpy 배열)
+# - 코드 목록 필드(브릿지): 평탄화한 (policy_idx, code_idx) 배열 + 코드 사전 -> sync_bridge가 그대로 사용
+POLICY_LIST_FIELDS = ("subcategories", "educations", "job_status", "majors", "specializations", "keywords", "regions")
+POLICY_SCALAR_FIELDS = tuple(f.name for f in fields(NormalizedPolicy) if f.name not in POLICY_LIST_FIELDS)
+POLICY_ARRAY_DTYPES: Dict[str, Any] = {
+    "views": np.int64,
+    "restrict_education": np.bool_, "restrict_major": np.bool_,
+    "restrict_job_status": np.bool_, "restrict_specialization": np.bool_,
+}
+
+@dataclass
+class CodeLinks:
+    """
+    목록 필드 하나의 평탄화 결과: k번째 링크 = 배치의 policy_idx[k]번째 정책이 코드 vocab[code_idx[k]]를 가짐
+    (정책 순서, 정책 안 원래 순서). 같은 코드 문자열은 vocab에 한 번만 보관
+    """
+    policy_idx: np.ndarray   # int32
+    code_idx: np.ndarray     # int32, vocab 위치
+    vocab: List[str]
+
+    @classmethod
+    def from_lists(cls, lists: Sequence[Optional[List[str]]]) -> "CodeLinks":
+        positions: Dict[str, int] = {}
+        code_idx = [positions.setdefault(code, len(positions)) for v in lists if v for code in v]
+        return cls(
+            np.repeat(np.arange(len(lists), dtype=np.int32), [len(v) if v else 0 for v in lists]),
+            np.asarray(code_idx, dtype=np.int32),
+            list(positions),
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["CodeLinks"], offsets: Sequence[int]) -> "CodeLinks":
+        """여러 배치의 링크 연결 (policy_idx는 offsets만큼 이동, 코드 사전은 합침)"""
+        positions: Dict[str, int] = {}
+        policy_idx, code_idx = [], []
+        for part, offset in zip(parts, offsets):
+            remap = np.asarray([positions.setdefault(code, len(positions)) for code in part.vocab], dtype=np.int32)
+            policy_idx.append(part.policy_idx + np.int32(offset))
+            code_idx.append(remap[part.code_idx] if len(remap) else part.code_idx)
+        return cls(
+            np.concatenate(policy_idx).astype(np.int32),
+            np.concatenate(code_idx).astype(np.int32),
+            list(positions),
+        )
+
+    @property
+    def codes(self) -> List[str]:
+        return [self.vocab[i] for i in self.code_idx.tolist()]
+
+    def to_lists(self, n: int) -> List[List[str]]:
+        out: List[List[str]] = [[] for _ in range(n)]
+        for i, code in zip(self.policy_idx.tolist(), self.codes):
+            out[i].append(code)
+        return out
+
+    def __len__(self) -> int:
+        return len(self.code_idx)
+
+
+@dataclass
+class PolicyBatch:
+    """
+    정규화된 정책 배치 (행 순서 = 변경분 조회 순서).
+    - columns: POLICY_SCALAR_FIELDS -> 값 목록 또는 numpy 배열 (POLICY_ARRAY_DTYPES)
+    - links  : POLICY_LIST_FIELDS -> CodeLinks
+    - 값 객체(문자열, payload dict)는 raw_json과 공유, 정책별 객체는 만들지 않음
+    """
+    columns: Dict[str, Any]
+    links: Dict[str, CodeLinks]
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    @property
+    def ids(self) -> List[str]:
+        return self.columns["id"]
+
+    def values(self, name: str) -> List[Any]:
+        """필드 값 목록 (numpy 배열은 파이썬 값으로 변환: DB 어댑터/해시 입력용)"""
+        col = self.columns[name]
+        return col.tolist() if isinstance(col, np.ndarray) else col
+
+    def record(self, i: int) -> NormalizedPolicy:
+        """i번째 정책을 NormalizedPolicy로 (디버그 출력/점검용)"""
+        lists = {name: [links.vocab[c] for c in links.code_idx[links.policy_idx == i].tolist()]
+                 for name, links in self.links.items()}
+        return NormalizedPolicy(**{name: self.values(name)[i] for name in POLICY_SCALAR_FIELDS}, **lists)
+
+    def replace(self, **changes: Any) -> "PolicyBatch":
+        """필드 일부를 바꾼 새 배치 (목록 필드는 정책별 코드 목록으로 전달), 나머지 컬럼은 공유"""
+        columns, links = dict(self.columns), dict(self.links)
+        for name, values in changes.items():
+            if name in POLICY_LIST_FIELDS:
+                links[name] = CodeLinks.from_lists(values)
+            else:
+                columns[name] = _batch_column(name, values)
+        return PolicyBatch(columns, links)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "PolicyBatch":
+        """normalize_frame 결과 -> PolicyBatch (payload 컬럼이 없으면 None으로 채움)"""
+        n = len(frame)
+        columns = {
+            name: _batch_column(name, frame[name].tolist() if name in frame.columns else [None] * n)
+            for name in POLICY_SCALAR_FIELDS
+        }
+        return cls(columns, {name: CodeLinks.from_lists(frame[name].tolist()) for name in POLICY_LIST_FIELDS})
+
+    @classmethod
+    def from_records(cls, items: Sequence[NormalizedPolicy]) -> "PolicyBatch":
+        columns = {name: _batch_column(name, [getattr(it, name) for it in items]) for name in POLICY_SCALAR_FIELDS}
+        return cls(columns, {name: CodeLinks.from_lists([getattr(it, name) for it in items]) for name in POLICY_LIST_FIELDS})
+
+    @classmethod
+    def concat(cls, batches: Sequence["PolicyBatch"]) -> "PolicyBatch":
+        if not batches:
+            return cls.from_records([])
+        columns: Dict[str, Any] = {}
+        for name in POLICY_SCALAR_FIELDS:
+            parts = [b.columns[name] for b in batches]
+            columns[name] = np.concatenate(parts) if isinstance(parts[0], np.ndarray) else [v for p in parts for v in p]
+        offsets = np.cumsum([0] + [len(b) for b in batches[:-1]]).tolist()
+        links = {name: CodeLinks.concat([b.links[name] for b in batches], offsets) for name in POLICY_LIST_FIELDS}
+        return cls(columns, links)
+
+def _batch_column(name: str, values: List[Any]) -> Any:
+    dtype = POLICY_ARRAY_DTYPES.get(name)
+    return np.asarray(values, dtype=dtype) if dtype is not None else list(values)
+
+# ---------- 배치(컬럼 단위) 정규화 ----------
+# 정규화 규칙은 여기 한 곳: 필드 매핑(BATCH_*_KEYS) + 값 규칙(code_tables, fast_parse, to_int_or_none, clean_dash_to_null)
+# 정책 목록 전체에 컬럼 단위로 적용 (normalize_row도 이 경로를 사용)
+# NormalizedPolicy 필드 -> raw_json 키
+BATCH_TEXT_KEYS = {"title": "plcyNm", "summary_raw": "plcyCn", "description_raw": "plcySprtCn"}   # .get(k, "")
+BATCH_TEXT_OR_NONE_KEYS = {                                                                    # .get(k) or None
+    "supervising_org": "sprvsnInstCdNm", "operating_org": "operInstCdNm", "apply_url": "aplyUrlAddr",
+    "ref_url_1": "refUrlAddr1", "ref_url_2": "refUrlAddr2", "income_text": "earnEtcCn",
+}
+BATCH_DASH_TO_NULL_KEYS = {                                                                    # clean_dash_to_null
+    "period_etc": "bizPrdEtcCn", "announcement": "srngMthdCn", "info_etc": "etcMttrCn",
+    "required_documents": "sbmsnDcmntCn", "application_process": "plcyAplyMthdCn",
+    "eligibility_additional": "addAplyQlfcCndCn", "eligibility_restrictive": "ptcpPrpTrgtCn",
+}
+BATCH_INT_KEYS = {                                                                             # to_int_or_none
+    "age_min": "sprtTrgtMinAge", "age_max": "sprtTrgtMaxAge", "income_min": "earnMinAmt", "income_max": "earnMaxAmt",
+}
+BATCH_ENUM_KEYS = {                                                                            # code_enum
+    "marital_status": "mrgSttsCd", "income_type": "earnCndSeCd", "period_type": "bizPrdSeCd", "apply_type": "aplyPrdSeCd",
+}
+BATCH_RESTRICTION_KEYS = {                                                                     # is_restricted
+    "restrict_education": "schoolCd", "restrict_major": "plcyMajorCd",
+    "restrict_job_status": "jobCd", "restrict_specialization": "sbizCd",
+}
+BATCH_LIST_KEYS = {                                                                            # extract_list_from_payload
+    "subcategories": "mclsfNm", "educations": "schoolCd", "job_status": "jobCd", "majors": "plcyMajorCd",
+    "specializations": "sbizCd", "keywords": "plcyKywdNm", "regions": "zipCd",
+}
+
+def _obj_series(values: Iterable[Any]) -> pd.Series:
+    return pd.Series(values, dtype=object)
+
+def _nullify(series: pd.Series) -> pd.Series:
+    """NaN/NaT -> None (object 컬럼)"""
+    series = series.astype(object)
+    return series.where(series.notna(), None)
+
+def _by_unique(values: List[Any], convert: Callable[[pd.Series], pd.Series], na_value: Any = None) -> pd.Series:
+    """
+    고유값만 변환한 뒤 원래 위치로 펼침 (코드/날짜 컬럼은 정책 간 반복이 많음).
+    - 결측(None)은 na_value
+    - 리스트 등 해시 불가 값이 섞이면 factorize 불가 -> 전체를 그대로 변환
+    - 타입이 섞이면(1 / True / "1" / 1.0) 같은 값으로 묶일 수 있으므로 전체를 그대로 변환
+    """
+    s = _obj_series(values)
+    try:
+        if len({type(v) for v in values if v is not None}) > 1:
+            raise TypeError("mixed value types")
+        codes, uniques = pd.factorize(s)
+    except TypeError:
+        converted = _nullify(convert(s))
+        return _obj_series([na_value if v is None else c for v, c in zip(values, converted)])
+    lookup = np.empty(len(uniques) + 1, dtype=object)   # 마지막 칸 = 결측(code -1)
+    lookup[:-1] = _nullify(convert(_obj_series(uniques))).to_numpy(dtype=object)
+    lookup[-1] = na_value
+    return _obj_series(lookup[codes])
+
+def _to_int(s: pd.Series) -> pd.Series:
+    return s.map(to_int_or_none)
+
+def _dash_to_null(s: pd.Series) -> pd.Series:
+    return s.map(clean_dash_to_null)
+
+def normalize_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    fetch_changed_rows 결과 목록을 한 번에 정규화하여 컬럼 단위 DataFrame으로 반환.
+    - 컬럼 = NormalizedPolicy 필드, 행 순서 = rows 순서
+    - 결측값은 None (NaN/NaT 아님)
+    - 코드/날짜는 고유값만 벡터 변환 후 펼침
+    """
+    raws = [r["raw_json"] for r in rows]
+
+    def col(key: str, default: Any = None) -> List[Any]:
+        return [rj.get(key, default) for rj in raws]
+
+    data: Dict[str, pd.Series] = {
+        "id": _obj_series([r["policy_id"] for r in rows]),
+        "ext_id": _obj_series([r["policy_id"] for r in rows]),
+        "ext_source": _obj_series([ETL_SOURCE] * len(rows)),
+        "summary_ai": _obj_series([None] * len(rows)),   # ai_summary.py 워커가 채움
+        "payload": _obj_series(raws),
+        "content_hash": _obj_series([r["record_hash"] for r in rows]),
+    }
+    for field, key in BATCH_TEXT_KEYS.items():
+        data[field] = _obj_series(col(key, ""))
+    for field, key in BATCH_TEXT_OR_NONE_KEYS.items():
+        data[field] = _obj_series([v or None for v in col(key)])
+    for field, key in BATCH_DASH_TO_NULL_KEYS.items():
+        data[field] = _by_unique(col(key), _dash_to_null)
+    for field, key in BATCH_INT_KEYS.items():
+        data[field] = _by_unique(col(key, 0), _to_int)
+    for field, key in BATCH_ENUM_KEYS.items():
+        data[field] = _by_unique(col(key, ""), lambda s: s.map(lambda v: code_enum(key, v)), na_value=UNKNOWN)
+    for field, key in BATCH_RESTRICTION_KEYS.items():
+        data[field] = _by_unique(col(key, ""), lambda s: s.map(lambda v: is_restricted(key, v)), na_value=True)
+    for field, key in BATCH_LIST_KEYS.items():
+        data[field] = _by_unique(col(key), lambda s: s.map(lambda v: extract_list_from_payload({key: v}, key)), na_value=[])
+
+    data["views"] = _obj_series([0 if v is None else v for v in _by_unique(col("inqCnt", 0), _to_int)])   # 변환 불가 조회수는 0
+    periods = _by_unique(col("aplyYmd", ""), lambda s: s.map(fast_parse.parse_period), na_value=(None, None))
+    data["apply_start"] = _obj_series([p[0] for p in periods])
+    data["apply_end"] = _obj_series([p[1] for p in periods])
+    data["period_start"] = _by_unique(col("bizPrdBgngYmd", ""), lambda s: s.map(fast_parse.parse_date))
+    data["period_end"] = _by_unique(col("bizPrdEndYmd", ""), lambda s: s.map(fast_parse.parse_date))
+    data["last_external_modified"] = _by_unique(col("lastMdfcnDt"), lambda s: s.map(fast_parse.parse_datetime_kst))
+    data["first_external_created"] = _by_unique(col("frstRegDt", ""), lambda s: s.map(fast_parse.parse_datetime_kst))
+
+    today = kst_today()
+    data["status"] = _obj_series([
+        policy_status(t, s, e, today) for t, s, e in zip(data["apply_type"], data["apply_start"], data["apply_end"])
+    ])
+
+    return pd.DataFrame(data, columns=[f.name for f in fields(NormalizedPolicy)])
+
+def normalize_rows(rows: List[Dict[str, Any]]) -> PolicyBatch:
+    """normalize_frame 결과를 PolicyBatch로 변환 (sync 단계 입력용)"""
+    if not rows:
+        return PolicyBatch.from_records([])
+    return PolicyBatch.from_frame(normalize_frame(rows))
+
+# ---------- 병렬 정규화 (프로세스 풀) ----------
+# 워커 -> 부모로 보내는 결과(컬럼 단위 PolicyBatch)에는 payload(raw_json)를 싣지 않음: 부모가 이미 갖고 있으므로
+# 같은 위치의 row에서 다시 붙임 (executor.map은 입력 순서대로 결과를 돌려줌)
+def _normalize_chunk(rows: List[Tuple[str, str, Dict[str, Any]]]) -> PolicyBatch:
+    """워커 프로세스: (policy_id, record_hash, raw_json) 묶음 -> payload 없는 PolicyBatch"""
+    frame = normalize_frame([{"policy_id": p, "record_hash": h, "raw_json": rj} for p, h, rj in rows])
+    return PolicyBatch.from_frame(frame.drop(columns="payload"))
+
+def normalize_rows_parallel(rows: List[Dict[str, Any]], executor: Executor, chunk_size: int = ETL_NORMALIZE_CHUNK) -> PolicyBatch:
+    """
+    normalize_rows의 멀티 프로세스 버전.
+    - rows를 chunk_size 건씩 워커에 분배, 결과 순서 = rows 순서
+    - 결과의 content_hash가 같은 위치 row의 record_hash와 다르면 즉시 실패 (순서 어긋남 방지)
+    """
+    if not rows:
+        return PolicyBatch.from_records([])
+    chunks = [
+        [(r["policy_id"], r["record_hash"], r["raw_json"]) for r in rows[i : i + chunk_size]]
+        for i in range(0, len(rows), chunk_size)
+    ]
+    batch = PolicyBatch.concat(list(executor.map(_normalize_chunk, chunks)))
+    if len(batch) != len(rows):
+        raise RuntimeError(f"normalize returned {len(batch)} policies for {len(rows)} rows")
+    for row, content_hash in zip(rows, batch.columns["content_hash"]):
+        if content_hash != row["record_hash"]:
+            raise RuntimeError(f"normalize result out of order at policy_id={row['policy_id']}")
+    batch.columns["payload"] = [r["raw_json"] for r in rows]
+    return batch
+
+def normalize_executor(workers: int = ETL_NORMALIZE_WORKERS) -> Optional[ProcessPoolExecutor]:
+    """workers > 1이면 프로세스 풀, 아니면 None(현재 프로세스에서 정규화)"""
+    return ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+def normalize_policies(rows: List[Dict[str, Any]], executor: Optional[Executor] = None) -> PolicyBatch:
+    with METRICS.step("normalize", rows_in=len(rows)) as st:
+        batch = normalize_rows(rows) if executor is None else normalize_rows_parallel(rows, executor)
+        st.rows_out += len(batch)
+    return batch
+
 def extract_list_from_payload(payload: dict, field: str) -> list[str]:
     raw = payload.get(field)
     if raw is None:
@@ -272,119 +622,25 @@ def extract_list_from_payload(payload: dict, field: str) -> list[str]:
         return [str(x) for x in raw if x]
     return [t for t in str(raw).split(",") if t]
 
-def parse_modified_datetime(dt_str: str) -> datetime:
-    if dt_str:
-        try:
-            last_external_modified = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=KST)
-        except ValueError:
-            last_external_modified = None
-    return last_external_modified
-
-def parse_date(dt_str: str) -> date:
-    if dt_str:
-        try:
-            return datetime.strptime(dt_str, "%Y-%m-%d").date()
-        except ValueError:
-            return None
-    return None
-
-def set_income_type(earnCndSeCd: str) -> str:
-    if earnCndSeCd == "0043001":
-        return "ANY"
-    elif earnCndSeCd == "0043002":
-        return "RANGE"
-    elif earnCndSeCd == "0043003":
-        return "TEXT"
-    else:
-        return "UNKNOWN"
-    
-def set_marital_status(mrgSttsCd: str) -> str:
-    if mrgSttsCd == "0055001":
-        return "MARRIED"
-    elif mrgSttsCd == "0055002":
-        return "SINGLE"
-    elif mrgSttsCd == "0055003":
-        return "ANY"
-    else:
-        return "UNKNOWN"
-    
-# TODO: UPCOMING 상태 처리 필요
-def set_policy_status(aplyPrdSeCd: str, aplyYmd: str) -> str:
-    return None
-    # if aplyPrdSeCd == "0057003":
-    #     return "CLOSED"
-    # elif aplyPrdSeCd == "0057002":
-    #     return "OPEN"
-    # elif aplyPrdSeCd == "0057001":
-    #     apply_start, apply_end = parse_period_field(aplyYmd)
-    #     if apply_start and apply_end:
-    #         today = date.today()
-    #         if apply_start <= today <= apply_end:
-    #             return "OPEN"
-    #         else:
-    #             return "CLOSED"
-    #     else:
-    #         return "UNKNOWN"
-        
-def set_period_type(bizPrdSeCd: str) -> str:
-    if bizPrdSeCd == "0056001":
-        return "PERIODIC"
-    elif bizPrdSeCd == "0056002":
-        return "ETC"
-    else:
-        return "UNKNOWN"
-    
-def set_apply_type(aplyPrdSeCd: str) -> str:
-    if aplyPrdSeCd == "0057001":
-        return "PERIODIC"
-    elif aplyPrdSeCd == "0057002":
-        return "ALWAYS_OPEN"
-    elif aplyPrdSeCd == "0057003":
+# 신청 상태: 적재 시점(KST 오늘) 기준으로 계산, 이후 날짜 경계 통과는 policy_status.py 일배치가 갱신
+# (SQL 함수 core.policy_status와 같은 규칙 유지)
+def policy_status(apply_type: str, apply_start: Optional[date], apply_end: Optional[date], today: date) -> str:
+    if apply_type == "CLOSED":
         return "CLOSED"
-    else:
-        return "UNKNOWN"
-
-def set_education_restriction(schoolCd: str) -> bool:
-    if schoolCd == "0049010":
-        return False
-    else:
-        return True
-    
-def set_major_restriction(plcyMajorCd: str) -> bool:
-    if plcyMajorCd == "0011009":
-        return False
-    else:
-        return True
+    if apply_type == "ALWAYS_OPEN":
+        return "OPEN"
+    if apply_type == "PERIODIC" and apply_start and apply_end:
+        if today < apply_start:
+            return "UPCOMING"
+        return "OPEN" if today <= apply_end else "CLOSED"
+    return "UNKNOWN"
 
-def set_job_status_restriction(jobCd: str) -> bool:
-    if jobCd == "0013010":
-        return False
-    else:
-        return True
-
-def set_specialization_restriction(sbizCd: str) -> bool:
-    if sbizCd == "0014010":
-        return False
-    else:
-        return True
-    
-def parse_period_field(aplyYmd: str) -> tuple[Optional[date], Optional[date]]:
-    # 형식 참고 - "aplyYmd": "20240823 ~ 20240913"
-    try:
-        parts = aplyYmd.split("~")
-        if len(parts) != 2:
-            return None, None
-        start_str = parts[0].strip()
-        end_str = parts[1].strip()
-        apply_start = datetime.strptime(start_str, "%Y%m%d").date()
-        apply_end = datetime.strptime(end_str, "%Y%m%d").date()
-        return apply_start, apply_end
-    except Exception as e:
-        return None, None
+def kst_today() -> date:
+    return datetime.now(KST).date()
 
 def to_int_or_none(v: Any) -> Optional[int]:
-    """빈 문자열/None/변환 불가 -> None, 숫자/숫자형 문자열 -> int"""
-    if v is None:
+    """빈 문자열/None/bool/변환 불가 -> None, 숫자/숫자형 문자열(앞뒤 공백, 전각 숫자 허용) -> int"""
+    if v is None or isinstance(v, bool):
         return None
     if isinstance(v, int):
         return v
@@ -398,7 +654,7 @@ def to_int_or_none(v: Any) -> Optional[int]:
             return None
     try:
         return int(v)
-    except (TypeError, ValueError):
+    except (TypeError, ValueError, OverflowError):
         return None
 
 def clean_dash_to_null(value: Any) -> Optional[str]:
@@ -410,693 +666,965 @@ def clean_dash_to_null(value: Any) -> Optional[str]:
         return None
     return str_value
 
-def upsert_policy(conn: Connection, items: List[NormalizedPolicy]) -> int:
-    if not items:
+# core.policy 컬럼 그룹: 그룹별 해시(core.policy.group_hashes)가 바뀐 그룹의 컬럼만 갱신
+# - 바뀌지 않은 그룹은 기존 값을 그대로 대입 -> TOAST 재기록 없음, 인덱스 컬럼 불변이면 HOT 갱신 가능
+# - summary_ai는 ai_summary.py 워커만 갱신, content_hash/group_hashes는 항상 갱신
+# - search_tsv는 text 그룹이 바뀐 행만 다시 계산 (GIN 갱신 최소화)
+POLICY_COLUMN_GROUPS: Dict[str, tuple] = {
+    "text": ("title", "summary_raw", "description_raw"),            # 바뀌면 search_tsv 다시 계산
+    "payload": ("payload",),                                           # 큰 jsonb (TOAST)
+    "apply": ("status", "apply_start", "apply_end", "apply_type",
+              "period_type", "period_start", "period_end", "period_etc"),
+    "info": ("ext_id", "ext_source", "last_external_modified", "first_external_created", "views",
+             "supervising_org", "operating_org", "apply_url", "ref_url_1", "ref_url_2",
+             "announcement", "info_etc", "required_documents", "application_process"),
+}
+POLICY_COLUMNS = ("id", "summary_ai", "content_hash") + tuple(c for cols in POLICY_COLUMN_GROUPS.values() for c in cols)
+
+def _group_hash(values: Sequence[Any]) -> str:
+    """한 정책의 컬럼 그룹 값 -> md5 (payload는 이미 직렬화된 문자열 사용)"""
+    return hashlib.md5(json.dumps(list(values), ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+# upsert 스테이징(tmp_policy_upsert) 컬럼 타입 (binary COPY용)
+# - payload/group_hashes는 해시 계산에 쓴 직렬화 문자열 그대로 text로 적재 후 INSERT 시 jsonb 캐스팅
+POLICY_COPY_TYPES: Dict[str, str] = {
+    "id": "text", "summary_ai": "text", "content_hash": "text",
+    "title": "varchar", "summary_raw": "text", "description_raw": "text",
+    "payload": "text",
+    "status": "text", "apply_start": "date", "apply_end": "date", "apply_type": "text",
+    "period_type": "text", "period_start": "date", "period_end": "date", "period_etc": "text",
+    "ext_id": "varchar", "ext_source": "varchar",
+    "last_external_modified": "timestamptz", "first_external_created": "timestamptz", "views": "int4",
+    "supervising_org": "varchar", "operating_org": "varchar", "apply_url": "text",
+    "ref_url_1": "text", "ref_url_2": "text", "announcement": "text", "info_etc": "text",
+    "required_documents": "text", "application_process": "text",
+    "group_hashes": "text",
+}
+POLICY_COPY_COLUMNS = tuple((c, POLICY_COPY_TYPES[c]) for c in POLICY_COLUMNS + ("group_hashes",))
+POLICY_JSON_COLUMNS = ("payload", "group_hashes")
+
+def _policy_upsert_sql() -> str:
+    cols = POLICY_COLUMNS + ("group_hashes",)
+    select = [f"CAST(s.{c} AS jsonb)" if c in POLICY_JSON_COLUMNS else f"s.{c}" for c in cols]
+    assignments = [
+        f"{c} = CASE WHEN EXCLUDED.group_hashes->>'{group}' IS DISTINCT FROM p.group_hashes->>'{group}' "
+        f"THEN EXCLUDED.{c} ELSE p.{c} END"
+        for group, group_cols in POLICY_COLUMN_GROUPS.items() for c in group_cols
+    ]
+    assignments += [
+        "search_tsv = CASE WHEN EXCLUDED.group_hashes->>'text' IS DISTINCT FROM p.group_hashes->>'text' "
+        "THEN core.policy_search_tsv(EXCLUDED.title, EXCLUDED.summary_raw, EXCLUDED.description_raw, p.summary_ai) "
+        "ELSE p.search_tsv END",
+        "content_hash = EXCLUDED.content_hash",
+        "group_hashes = EXCLUDED.group_hashes",
+    ]
+    search_tsv = "core.policy_search_tsv(s.title, s.summary_raw, s.description_raw, s.summary_ai)"
+    return f"""
+        INSERT INTO core.policy AS p ({", ".join(cols)}, search_tsv)
+        SELECT {", ".join(select)}, {search_tsv}
+        FROM tmp_policy_upsert s
+        ON CONFLICT (id) DO UPDATE SET
+            {(","+chr(10)+"            ").join(assignments)}
+        WHERE p.group_hashes IS DISTINCT FROM EXCLUDED.group_hashes
+           OR p.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    """
+
+def create_policy_stage(conn: Connection) -> None:
+    """
+    upsert 스테이징 임시테이블(tmp_policy_upsert) 생성 (ON COMMIT DROP).
+    - 한 번 읽고 버리는 테이블이므로 문자열 컬럼은 STORAGE EXTERNAL (TOAST 압축 생략)
+    """
+    conn.execute(text(f"""
+        CREATE TEMP TABLE tmp_policy_upsert ({", ".join(f"{c} {t}" for c, t in POLICY_COPY_COLUMNS)})
+        ON COMMIT DROP
+    """))
+    conn.execute(text("ALTER TABLE tmp_policy_upsert " + ", ".join(
+        f"ALTER COLUMN {c} SET STORAGE EXTERNAL" for c, t in POLICY_COPY_COLUMNS if t in ("text", "varchar")
+    )))
+
+def policy_copy_columns(batch: PolicyBatch) -> Dict[str, List[Any]]:
+    """
+    PolicyBatch -> POLICY_COPY_COLUMNS 순서의 컬럼별 값 목록 (upsert 스테이징/--plan 입력).
+    - payload는 JSON 문자열로 직렬화, group_hashes는 행마다 그룹 값으로 계산 (행 dict를 만들지 않음)
+    - 같은 id가 여러 번 오면 처음 나온 위치에 마지막 값 사용
+    """
+    ids = batch.ids
+    last = {pid: i for i, pid in enumerate(ids)}
+    keep = list(last.values()) if len(last) < len(ids) else None
+
+    cols: Dict[str, List[Any]] = {}
+    for c in POLICY_COLUMNS:
+        values = batch.values(c)
+        cols[c] = values if keep is None else [values[i] for i in keep]
+    cols["payload"] = [json.dumps(p, ensure_ascii=False) for p in cols["payload"]]
+    group_hashes = zip(*[
+        [_group_hash(values) for values in zip(*[cols[c] for c in group_cols])]
+        for group_cols in POLICY_COLUMN_GROUPS.values()
+    ])
+    cols["group_hashes"] = [json.dumps(dict(zip(POLICY_COLUMN_GROUPS, hashes))) for hashes in group_hashes]
+    return cols
+
+def upsert_policy(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> int:
+    """
+    core.policy upsert.
+    - 신규: 전체 컬럼 INSERT
+    - 기존: 그룹 해시가 다른 그룹의 컬럼만 갱신, 모든 그룹/해시가 같으면 행을 건드리지 않음
+    - 배치 전체를 임시테이블(tmp_policy_upsert)에 binary COPY 후 INSERT ... SELECT 한 문장으로 반영
+      (같은 id가 여러 번 오면 마지막 값 사용)
+    """
+    if not len(batch):
         return {}
-    sql = text(
-        """
-        INSERT INTO core.policy (
-            id, ext_id, ext_source, title, summary_raw, description_raw, summary_ai,
-            status, apply_start, apply_end, last_external_modified, views,
-            supervising_org, operating_org, apply_url, ref_url_1, ref_url_2,
-            payload, content_hash,
-
-            period_type, period_start, period_end, period_etc,
-            apply_type, announcement, info_etc, first_external_created, required_documents, application_process
-        
-        ) VALUES (
-            :id, :ext_id, :ext_source, :title, :summary_raw, :description_raw, :summary_ai,
-            :status, :apply_start, :apply_end, :last_external_modified, :views,
-            :supervising_org, :operating_org, :apply_url, :ref_url_1, :ref_url_2,
-            :payload, :content_hash,
-
-            :period_type, :period_start, :period_end, :period_etc,
-            :apply_type, :announcement, :info_etc, :first_external_created, :required_documents, :application_process
-        
-        ) ON CONFLICT (id) DO UPDATE SET
-            ext_id = EXCLUDED.ext_id,
-            ext_source = EXCLUDED.ext_source,
-            title = EXCLUDED.title,
-            summary_raw = EXCLUDED.summary_raw,
-            description_raw = EXCLUDED.description_raw,
-            summary_ai = EXCLUDED.summary_ai,
-            status = EXCLUDED.status,
-            apply_start = EXCLUDED.apply_start,
-            apply_end = EXCLUDED.apply_end,
-            last_external_modified = EXCLUDED.last_external_modified,
-            views = EXCLUDED.views,
-            supervising_org = EXCLUDED.supervising_org,
-            operating_org = EXCLUDED.operating_org,
-            apply_url = EXCLUDED.apply_url,
-            ref_url_1 = EXCLUDED.ref_url_1,
-            ref_url_2 = EXCLUDED.ref_url_2,
-            payload = EXCLUDED.payload,
-            content_hash = EXCLUDED.content_hash,
-
-            period_type = EXCLUDED.period_type,
-            period_start = EXCLUDED.period_start,
-            period_end = EXCLUDED.period_end,
-            period_etc = EXCLUDED.period_etc,
-            apply_type = EXCLUDED.apply_type,
-            announcement = EXCLUDED.announcement,
-            info_etc = EXCLUDED.info_etc,
-            first_external_created = EXCLUDED.first_external_created,
-            required_documents = EXCLUDED.required_documents,
-            application_process = EXCLUDED.application_process
-        """)
-    params = [{
-        "id": item.id,
-        "ext_id": item.ext_id,
-        "ext_source": item.ext_source,
-        "title": item.title,
-        "summary_raw": item.summary_raw,
-        "description_raw": item.description_raw,
-        "summary_ai": item.summary_ai,
-        "status": item.status,
-        "apply_start": item.apply_start,
-        "apply_end": item.apply_end,
-        "last_external_modified": item.last_external_modified,
-        "views": item.views,
-        "supervising_org": item.supervising_org,
-        "operating_org": item.operating_org,
-        "apply_url": item.apply_url,
-        "ref_url_1": item.ref_url_1,
-        "ref_url_2": item.ref_url_2,
-        "payload": json.dumps(item.payload, ensure_ascii=False),
-        "content_hash": item.content_hash,
-
-        "period_type": item.period_type,
-        "period_start": item.period_start,
-        "period_end": item.period_end,
-        "period_etc": item.period_etc,
-        "apply_type": item.apply_type,
-        "announcement": item.announcement,
-        "info_etc": item.info_etc,
-        "first_external_created": item.first_external_created,
-        "required_documents": item.required_documents,
-        "application_process": item.application_process
-    } for item in items]
-
-    conn.execute(sql, params)
-    conn.commit()
-    return len(items)
+    cols = policy_copy_columns(batch)
+    create_policy_stage(conn)
+    copy_rows(conn, "tmp_policy_upsert", POLICY_COPY_COLUMNS, zip(*[cols[c] for c, _ in POLICY_COPY_COLUMNS]))
+    row = conn.execute(text(f"""
+        WITH up AS ({_policy_upsert_sql()}
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT count(*) FILTER (WHERE inserted)     AS inserted,
+               count(*) FILTER (WHERE NOT inserted) AS updated
+        FROM up
+    """)).mappings().one()
+    conn.execute(text("DROP TABLE tmp_policy_upsert"))
+    METRICS.add(
+        inserted=row["inserted"], updated=row["updated"], rows_out=row["inserted"] + row["updated"],
+        bytes=sum(len(p.encode("utf-8")) for p in cols["payload"]),
+    )
+    if commit:
+        conn.commit()
+    return len(batch)
+
+
+def _stage_tmp_policy(conn: Connection, policy_ids: List[str]) -> None:
+    """
+    동기화 대상 policy_id 임시테이블(tmp_policy) 준비.
+    - 트랜잭션당 한 번만 생성/적재 (ON COMMIT DROP)
+    - 단일 트랜잭션 모드에서는 여러 sync_* 함수가 같은 tmp_policy를 공유
+    - 중복 제거한 id를 binary COPY로 적재
+    """
+    exists = conn.execute(text("SELECT to_regclass('pg_temp.tmp_policy') IS NOT NULL")).scalar()
+    if exists:
+        return
+    conn.execute(text("CREATE TEMP TABLE tmp_policy (policy_id text) ON COMMIT DROP"))
+    copy_rows(conn, "tmp_policy", (("policy_id", "text"),), ((pid,) for pid in dict.fromkeys(policy_ids)))
+
 
+# master.* 룩업 맵은 master_cache에서 프로세스 전역으로 캐시 (버전 변경 시에만 재조회)
+def load_subcategory_id_map(conn: Connection) -> Mapping[str, int]:
+    return get_lookup(conn, "subcategory")
 
-def load_subcategory_id_map(conn: Connection) -> dict[str, int]:
-    sql = text("SELECT id, name FROM master.category WHERE parent_id IS NOT NULL")
-    rows = conn.execute(sql).mappings()
-    return {r["name"]: r["id"] for r in rows}
+def load_education_id_map(conn: Connection) -> Mapping[str, int]:
+    return get_lookup(conn, "education")
 
-def load_education_id_map(conn: Connection) -> dict[str, int]:
-    sql = text("SELECT id, code FROM master.education")
-    rows = conn.execute(sql).mappings()
-    return {r["code"]: r["id"] for r in rows}
+def load_job_status_id_map(conn: Connection) -> Mapping[str, int]:
+    return get_lookup(conn, "job_status")
 
-def load_job_status_id_map(conn: Connection) -> dict[str, int]:
-    sql = text("SELECT id, code FROM master.job_status")
-    rows = conn.execute(sql).mappings()
-    return {r["code"]: r["id"] for r in rows}
+def load_major_id_map(conn: Connection) -> Mapping[str, int]:
+    return get_lookup(conn, "major")
 
-def load_major_id_map(conn: Connection) -> dict[str, int]:
-    sql = text("SELECT id, code FROM master.major")
-    rows = conn.execute(sql).mappings()
-    return {r["code"]: r["id"] for r in rows}
+def load_specialization_id_map(conn: Connection) -> Mapping[str, int]:
+    return get_lookup(conn, "specialization")
 
-def load_specialization_id_map(conn: Connection) -> dict[str, int]:
-    sql = text("SELECT id, code FROM master.specialization")
-    rows = conn.execute(sql).mappings()
-    return {r["code"]: r["id"] for r in rows}
+def load_keyword_id_map(conn: Connection) -> Mapping[str, int]:
+    return get_lookup(conn, "keyword")
 
-def load_keyword_id_map(conn: Connection) -> dict[str, int]:
-    sql = text("SELECT id, name FROM master.keyword")
-    rows = conn.execute(sql).mappings()
-    return {r["name"]: r["id"] for r in rows}
+def load_subregion_id_map(conn: Connection) -> Mapping[str, int]:
+    return get_lookup(conn, "region")
 
-def load_subregion_id_map(conn: Connection) -> dict[str, int]:
-    sql = text("SELECT id, zip_code FROM master.region WHERE zip_code IS NOT NULL")
-    rows = conn.execute(sql).mappings()
-    return {r["zip_code"]: r["id"] for r in rows}
 
+ELIGIBILITY_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("policy_id", "TEXT"),
+    ("marital_status", "TEXT"),
+    ("age_min", "INTEGER"),
+    ("age_max", "INTEGER"),
+    ("income_type", "TEXT"),
+    ("income_min", "INTEGER"),
+    ("income_max", "INTEGER"),
+    ("income_text", "TEXT"),
+    ("eligibility_additional", "TEXT"),
+    ("eligibility_restrictive", "INTEGER"),
+    ("restrict_education", "BOOLEAN"),
+    ("restrict_major", "BOOLEAN"),
+    ("restrict_job_status", "BOOLEAN"),
+    ("restrict_specialization", "BOOLEAN"),
+)
 
-def sync_policy_eligibility(conn: Connection, items: List[Any]) -> Dict[str, int]:
+def sync_policy_eligibility(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> Dict[str, int]:
     """
-    NormalizedPolicy 값을 '있는 그대로' upsert.
+    PolicyBatch 값을 '있는 그대로' upsert.
     - 문자열 필드: 그대로 사용
     - 숫자 필드: 최소한의 int 캐스팅만 수행(실패/빈값 -> NULL)
+    - 컬럼별 타입 배열을 unnest 하여 배치 전체를 한 문장으로 upsert,
+      inserted/updated 건수는 RETURNING 결과를 집계하여 한 번에 반환
     - 반환 형식 통일: {"inserted": X, "deleted": 0, "unknown": Y}
         * deleted: 본 함수에서는 삭제 로직이 없으므로 항상 0
         * unknown: updated + skipped (업데이트되었거나 policy_id 미존재 등으로 건너뛴 건수)
     - 트랜잭션은 호출자 관리
     """
-    sql = text("""
-        INSERT INTO core.policy_eligibility
-            (policy_id, marital_status, age_min, age_max, income_type, income_min, income_max, income_text,
-             eligibility_additional, eligibility_restrictive, restrict_education, restrict_major, restrict_job_status, restrict_specialization)
-        VALUES
-            (:policy_id, :marital_status, :age_min, :age_max, :income_type, :income_min, :income_max, :income_text,
-             :eligibility_additional, :eligibility_restrictive, :restrict_education, :restrict_major, :restrict_job_status, :restrict_specialization)
-        ON CONFLICT (policy_id) DO UPDATE
-        SET
-            marital_status = EXCLUDED.marital_status,
-            age_min        = EXCLUDED.age_min,
-            age_max        = EXCLUDED.age_max,
-            income_type    = EXCLUDED.income_type,
-            income_min     = EXCLUDED.income_min,
-            income_max     = EXCLUDED.income_max,
-            income_text    = EXCLUDED.income_text,
-               
-            eligibility_additional  = EXCLUDED.eligibility_additional,
-            eligibility_restrictive = EXCLUDED.eligibility_restrictive,
-
-            restrict_education      = EXCLUDED.restrict_education,
-            restrict_major          = EXCLUDED.restrict_major,
-            restrict_job_status     = EXCLUDED.restrict_job_status,
-            restrict_specialization = EXCLUDED.restrict_specialization
-
-        RETURNING (xmax = 0) AS inserted
-    """)
-
-    inserted = updated = skipped = 0
-
-    for it in items:
-        pid = to_int_or_none(getattr(it, "id", None))
-        if pid is None:
-            skipped += 1
-            continue
-
-        params = {
-            "policy_id": pid,
-            "marital_status": getattr(it, "marital_status", None),  # 그대로
-            "age_min": to_int_or_none(getattr(it, "age_min", None)),
-            "age_max": to_int_or_none(getattr(it, "age_max", None)),
-            "income_type": getattr(it, "income_type", None),        # 그대로
-            "income_min": to_int_or_none(getattr(it, "income_min", None)),
-            "income_max": to_int_or_none(getattr(it, "income_max", None)),
-            "income_text": getattr(it, "income_text", None),        # 그대로
-
-            "eligibility_additional": getattr(it, "eligibility_additional", None),
-            "eligibility_restrictive": getattr(it, "eligibility_restrictive", None),
-
-            "restrict_education": getattr(it, "restrict_education", None),
-            "restrict_major": getattr(it, "restrict_major", None),
-            "restrict_job_status": getattr(it, "restrict_job_status", None),
-            "restrict_specialization": getattr(it, "restrict_specialization", None),
-        }
-
-        row = conn.execute(sql, params).fetchone()
-        if row and row[0] is True:
-            inserted += 1
+    # 배치 컬럼을 그대로 사용, policy_id가 숫자가 아닌 정책만 걸러냄
+    keep = [i for i, pid in enumerate(batch.ids) if to_int_or_none(pid) is not None]
+    skipped = len(batch) - len(keep)
+
+    columns: Dict[str, List[Any]] = {}
+    for name, _ in ELIGIBILITY_COLUMNS:
+        values = batch.values("id" if name == "policy_id" else name)
+        if name in ("age_min", "age_max", "income_min", "income_max"):
+            columns[name] = [to_int_or_none(values[i]) for i in keep]
+        elif name == "policy_id":
+            columns[name] = [str(values[i]) for i in keep]
         else:
-            updated += 1
-
-    deleted = 0
-    unknown = updated + skipped
-
-    conn.commit()
-    return {"inserted": inserted, "deleted": deleted, "unknown": unknown}
-
-def sync_policy_region(
-    conn: Connection,
-    items: List["NormalizedPolicy"],
-    *,
-    batch_size: int = 20000,
-    show_progress: bool = True,
-) -> Dict[str, Any]:
-    if not items:
-        return {"inserted": 0, "deleted": 0, "unknown": set()}
+            columns[name] = values if skipped == 0 else [values[i] for i in keep]   # 그대로
 
-    phase = tqdm(total=5, desc="policy_region phases", disable=not show_progress)
-
-    # 0) region map 로드
-    region_map = load_subregion_id_map(conn)
-    phase.update(1)
-
-    # 1) 아이템 스캔
-    target_pairs: List[Dict[str, Any]] = []
-    policy_ids: List[Dict[str, Any]] = []
-    unknown: Set[str] = set()
-
-    scan_bar = tqdm(items, desc="scan items", disable=not show_progress)
-    for item in scan_bar:
-        pid = getattr(item, "id", None)
-        if pid is None:
-            continue
-        policy_ids.append({"policy_id": pid})
-        for r in (getattr(item, "regions", []) or []):
-            rid = region_map.get(r)
-            if rid:
-                target_pairs.append({"policy_id": pid, "region_id": rid})
-            else:
-                unknown.add(r)
-    phase.update(1)
-
-    # 2) 임시테이블 생성
-    conn.execute(text("CREATE TEMP TABLE tmp_policy (policy_id TEXT) ON COMMIT DROP"))
-    conn.execute(text("CREATE TEMP TABLE tmp_policy_region (policy_id TEXT, region_id BIGINT) ON COMMIT DROP"))
-    phase.update(1)
-
-    # 3) 임시테이블 적재 (배치 + 진행바)
-    if policy_ids:
-        bar1 = tqdm(total=len(policy_ids), desc="load tmp_policy", disable=not show_progress)
-        for chunk in _chunked(policy_ids, batch_size):
-            conn.execute(text("INSERT INTO tmp_policy(policy_id) VALUES (:policy_id)"), chunk)
-            bar1.update(len(chunk))
-        bar1.close()
-
-    if target_pairs:
-        bar2 = tqdm(total=len(target_pairs), desc="load tmp_policy_region", disable=not show_progress)
-        for chunk in _chunked(target_pairs, batch_size):
-            conn.execute(
-                text("INSERT INTO tmp_policy_region(policy_id, region_id) VALUES (:policy_id, :region_id)"),
-                chunk,
-            )
-            bar2.update(len(chunk))
-        bar2.close()
-    phase.update(1)
-
-    # 4) 본 동기화(INSERT / DELETE)
-    #  - 기존 쿼리는 그대로 유지
-    r1 = conn.execute(text("""
-        INSERT INTO core.policy_region(policy_id, region_id)
-        SELECT t.policy_id, t.region_id
-        FROM tmp_policy_region t
-        LEFT JOIN core.policy_region pe
-          ON pe.policy_id = t.policy_id AND pe.region_id = t.region_id
-        WHERE pe.policy_id IS NULL
-    """))
-    inserted = r1.rowcount or 0
+    if not columns["policy_id"]:
+        return {"inserted": 0, "deleted": 0, "unknown": skipped}
 
-    r2 = conn.execute(text("""
-        DELETE FROM core.policy_region pe
-        USING tmp_policy p
-        WHERE pe.policy_id = p.policy_id
-          AND NOT EXISTS (
-              SELECT 1 FROM tmp_policy_region t
-              WHERE t.policy_id = pe.policy_id
-                AND t.region_id = pe.region_id
-          )
-    """))
-    deleted = r2.rowcount or 0
+    col_list = ", ".join(name for name, _ in ELIGIBILITY_COLUMNS)
+    unnest_args = ", ".join(f"CAST(:{name} AS {typ}[])" for name, typ in ELIGIBILITY_COLUMNS)
+    update_set = ",\n            ".join(
+        f"{name} = EXCLUDED.{name}" for name, _ in ELIGIBILITY_COLUMNS if name != "policy_id"
+    )
+    sql = text(f"""
+        WITH up AS (
+            INSERT INTO core.policy_eligibility ({col_list})
+            SELECT * FROM unnest({unnest_args})
+            ON CONFLICT (policy_id) DO UPDATE
+            SET
+            {update_set}
+            RETURNING (xmax = 0) AS inserted
+        )
+        SELECT count(*) FILTER (WHERE inserted)     AS inserted,
+               count(*) FILTER (WHERE NOT inserted) AS updated
+        FROM up
+    """)
 
-    conn.commit()
-    phase.update(1)
-    try:
-        phase.close()
-    except Exception:
-        pass
+    row = conn.execute(sql, columns).mappings().one()
+    inserted = row["inserted"]
+    updated = row["updated"]
 
-    if unknown:
-        print(f"⚠️ Unknown regions not in master: {sorted(unknown)}")
+    deleted = 0
+    unknown = updated + skipped
 
-    return {"inserted": inserted, "deleted": deleted, "unknown": unknown}
+    if commit:
+        conn.commit()
+    return {"inserted": inserted, "updated": updated, "deleted": deleted, "unknown": unknown}
 
-def sync_policy_keywords(conn: Connection, items: list[NormalizedPolicy]) -> dict:
-    if not items:
-        return {"inserted": 0, "deleted": 0, "unknown": set()}
+# 미등록 코드 처리 정책
+UNKNOWN_DROP = "drop"              # 링크만 버림
+UNKNOWN_QUARANTINE = "quarantine"  # 링크는 버리고 meta.etl_unknown_code에 기록
+UNKNOWN_CREATE = "create"          # master에 일괄 생성 후 같은 배치에서 링크 (생성 불가 코드는 격리)
 
-    keyword_map = load_keyword_id_map(conn)
+@dataclass(frozen=True)
+class BridgeSpec:
+    """
+    core.policy_* 다대다(브릿지) 테이블 동기화 설정.
+    - table     : core 스키마의 대상 테이블명
+    - fk_column : master 테이블을 가리키는 FK 컬럼
+    - attr      : 코드 목록 필드 (PolicyBatch.links 키, POLICY_LIST_FIELDS)
+    - lookup    : 코드 -> master id 매핑 (master_cache.LOOKUPS 이름)
+    - label     : 미등록 코드 로그용 이름
+    - on_unknown: 미등록 코드 처리 정책 (drop / quarantine / create)
+    """
+    table: str
+    fk_column: str
+    attr: str
+    lookup: str
+    label: str
+    on_unknown: str = UNKNOWN_QUARANTINE
+
+    @property
+    def tmp_table(self) -> str:
+        return f"tmp_{self.table}"
+
+
+# 새 브릿지 테이블은 여기에 설정만 추가하면 core_sync_steps에 포함됨 (실행 순서대로)
+BRIDGES: tuple[BridgeSpec, ...] = (
+    BridgeSpec("policy_category", "category_id", "subcategories", "subcategory", "subcategories"),
+    BridgeSpec("policy_eligibility_education", "education_id", "educations", "education", "educations"),
+    BridgeSpec("policy_eligibility_job_status", "job_status_id", "job_status", "job_status", "job statuses"),
+    BridgeSpec("policy_eligibility_major", "major_id", "majors", "major", "majors"),
+    BridgeSpec("policy_eligibility_specialization", "specialization_id", "specializations", "specialization", "specializations"),
+    # plcyKywdNm은 자유 텍스트라 신규 키워드가 계속 생김 -> master.keyword에 자동 생성
+    BridgeSpec("policy_keyword", "keyword_id", "keywords", "keyword", "keywords", on_unknown=UNKNOWN_CREATE),
+    BridgeSpec("policy_region", "region_id", "regions", "region", "regions"),
+)
+BRIDGE_BY_TABLE: Dict[str, BridgeSpec] = {b.table: b for b in BRIDGES}
+
+
+def creatable_master_codes(lookup: str, codes: Iterable[str]) -> List[str]:
+    """master에 자동 생성 가능한 코드 (빈 값, 키 길이 초과 제외)"""
+    spec = LOOKUPS[lookup]
+    return sorted({
+        c for c in codes
+        if c and (spec.key_max_length is None or len(c) <= spec.key_max_length)
+    })
+
+def provision_master_codes(conn: Connection, lookup: str, codes: Iterable[str]) -> Dict[str, int]:
+    """
+    미등록 코드를 master 테이블에 한 문장으로 일괄 생성하고 code -> id 반환.
+    - 이미 있는 코드는 ON CONFLICT로 건너뛰고 같은 문장 안에서 기존 id 조회
+    - 다른 샤드가 같은 코드를 동시에 생성한 경우(문장 시작 이후 커밋) 같은 문장에서는 보이지 않으므로 한 번 더 조회
+    - 키 길이 제한(key_max_length)을 넘는 코드는 생성하지 않음 (호출자가 격리 처리)
+    - 결과는 master_cache에 병합되어 같은 배치에서 바로 링크 가능
+    """
+    spec = LOOKUPS[lookup]
+    keys = creatable_master_codes(lookup, codes)
+    if not keys:
+        return {}
 
-    target_pairs, policy_ids, unknown = [], [], set()
-    for item in items:
-        policy_ids.append({"policy_id": item.id})
-        for k in item.keywords:
-            kid = keyword_map.get(k)
-            if kid:
-                target_pairs.append({"policy_id": item.id, "keyword_id": kid})
-            else:
-                unknown.add(k)
+    rows = conn.execute(
+        text(f"""
+            WITH ins AS (
+                INSERT INTO {spec.table} ({spec.key_column})
+                SELECT unnest(CAST(:keys AS TEXT[]))
+                ON CONFLICT ({spec.key_column}) DO NOTHING
+                RETURNING {spec.key_column} AS code, {spec.value_column} AS id
+            )
+            SELECT code, id FROM ins
+            UNION ALL
+            SELECT {spec.key_column}, {spec.value_column} FROM {spec.table}
+            WHERE {spec.key_column} = ANY(CAST(:keys AS TEXT[]))
+        """),
+        {"keys": keys},
+    ).all()
+    created = {code: ref_id for code, ref_id in rows}
+    missing = [k for k in keys if k not in created]
+    if missing:
+        created.update(conn.execute(
+            text(f"SELECT {spec.key_column}, {spec.value_column} FROM {spec.table} WHERE {spec.key_column} = ANY(CAST(:keys AS TEXT[]))"),
+            {"keys": missing},
+        ).all())
+    MASTER_CACHE.merge(lookup, created)
+    return created
+
+
+def quarantine_unknown_codes(conn: Connection, spec: BridgeSpec, pairs: List[tuple]) -> None:
+    """
+    미등록 코드 (policy_id, code) 쌍을 meta.etl_unknown_code에 기록.
+    - 대상 정책(tmp_policy)의 이전 격리 기록 중 이번에 해소된 코드는 삭제
+    - 남은 코드는 seen_count / last_seen_at 갱신
+    """
+    conn.execute(
+        text("""
+            WITH src AS (
+                SELECT DISTINCT t.policy_id, t.code
+                FROM unnest(CAST(:policy_ids AS TEXT[]), CAST(:codes AS TEXT[])) AS t(policy_id, code)
+            ), resolved AS (
+                DELETE FROM meta.etl_unknown_code q
+                USING tmp_policy p
+                WHERE q.bridge = :bridge
+                  AND q.policy_id = p.policy_id
+                  AND NOT EXISTS (
+                      SELECT 1 FROM src WHERE src.policy_id = q.policy_id AND src.code = q.code
+                  )
+            )
+            INSERT INTO meta.etl_unknown_code (bridge, code, policy_id)
+            SELECT :bridge, src.code, src.policy_id FROM src
+            ON CONFLICT (bridge, code, policy_id) DO UPDATE
+            SET last_seen_at = now(),
+                seen_count   = meta.etl_unknown_code.seen_count + 1
+        """),
+        {
+            "bridge": spec.table,
+            "policy_ids": [pid for pid, _ in pairs],
+            "codes": [code for _, code in pairs],
+        },
+    )
 
-    conn.execute(text("CREATE TEMP TABLE tmp_policy (policy_id TEXT) ON COMMIT DROP"))
-    conn.execute(text("CREATE TEMP TABLE tmp_policy_keyword (policy_id TEXT, keyword_id BIGINT) ON COMMIT DROP"))
 
-    if policy_ids:
-        conn.execute(text("INSERT INTO tmp_policy(policy_id) VALUES (:policy_id)"), policy_ids)
-    if target_pairs:
-        conn.execute(
-            text("INSERT INTO tmp_policy_keyword(policy_id, keyword_id) VALUES (:policy_id, :keyword_id)"),
-            target_pairs
-        )
-    r1 = conn.execute(text("""
-        INSERT INTO core.policy_keyword(policy_id, keyword_id)
-        SELECT t.policy_id, t.keyword_id
-        FROM tmp_policy_keyword t
-        LEFT JOIN core.policy_keyword pe
-          ON pe.policy_id = t.policy_id AND pe.keyword_id = t.keyword_id
-        WHERE pe.policy_id IS NULL
+BRIDGE_MERGE = "merge"        # 차집합 1회 계산 + MERGE (PG15+)
+BRIDGE_TWO_STEP = "two_step"  # INSERT ... ON CONFLICT + DELETE ... NOT EXISTS
+MERGE_MIN_SERVER_VERSION = (15,)
+
+def resolve_bridge_strategy(conn: Connection, strategy: Optional[str] = None) -> str:
+    """auto = 서버가 MERGE를 지원하면 merge, 아니면 two_step"""
+    strategy = strategy or ETL_BRIDGE_STRATEGY
+    if strategy in (BRIDGE_MERGE, BRIDGE_TWO_STEP):
+        return strategy
+    if strategy != "auto":
+        raise ValueError(f"Unknown ETL_BRIDGE_STRATEGY: {strategy}")
+    version = conn.dialect.server_version_info or ()
+    return BRIDGE_MERGE if tuple(version) >= MERGE_MIN_SERVER_VERSION else BRIDGE_TWO_STEP
+
+def _apply_bridge_two_step(conn: Connection, spec: BridgeSpec) -> tuple[int, int]:
+    """tmp 쌍 INSERT 후 대상 정책에서 빠진 쌍 DELETE (테이블을 두 번 훑음)"""
+    r1 = conn.execute(text(f"""
+        INSERT INTO core.{spec.table}(policy_id, {spec.fk_column})
+        SELECT t.policy_id, t.{spec.fk_column}
+        FROM {spec.tmp_table} t
+        ON CONFLICT (policy_id, {spec.fk_column}) DO NOTHING
     """))
-    inserted = r1.rowcount or 0
-    r2 = conn.execute(text("""
-        DELETE FROM core.policy_keyword pe
+    r2 = conn.execute(text(f"""
+        DELETE FROM core.{spec.table} pe
         USING tmp_policy p
         WHERE pe.policy_id = p.policy_id
           AND NOT EXISTS (
-              SELECT 1 FROM tmp_policy_keyword t
+              SELECT 1 FROM {spec.tmp_table} t
               WHERE t.policy_id = pe.policy_id
-                AND t.keyword_id = pe.keyword_id
+                AND t.{spec.fk_column} = pe.{spec.fk_column}
           )
     """))
-    deleted = r2.rowcount or 0
-
-    conn.commit()
-    if unknown:
-        print(f"⚠️ Unknown keywords not in master: {sorted(unknown)}")
+    return r1.rowcount or 0, r2.rowcount or 0
+
+def _bridge_diff_sql(spec: BridgeSpec) -> str:
+    """원하는 쌍(tmp)과 대상 정책의 현재 쌍 중 한쪽에만 있는 쌍 (wanted = 추가, NOT wanted = 삭제)"""
+    fk = spec.fk_column
+    return f"""
+        SELECT coalesce(t.policy_id, cur.policy_id) AS policy_id,
+               coalesce(t.{fk}, cur.{fk})           AS {fk},
+               t.policy_id IS NOT NULL              AS wanted
+        FROM {spec.tmp_table} t
+        FULL JOIN (
+            SELECT pe.policy_id, pe.{fk}
+            FROM core.{spec.table} pe
+            JOIN tmp_policy p ON p.policy_id = pe.policy_id
+        ) cur ON cur.policy_id = t.policy_id AND cur.{fk} = t.{fk}
+        WHERE t.policy_id IS NULL OR cur.policy_id IS NULL
+    """
 
-    return {"inserted": inserted, "deleted": deleted, "unknown": unknown}
+def _count_bridge_diff(conn: Connection, spec: BridgeSpec) -> tuple[int, int]:
+    """읽기 전용: 적용 시 INSERT/DELETE 될 쌍 수"""
+    inserted, deleted = conn.execute(text(f"""
+        SELECT count(*) FILTER (WHERE d.wanted), count(*) FILTER (WHERE NOT d.wanted)
+        FROM ({_bridge_diff_sql(spec)}) d
+    """)).one()
+    return inserted, deleted
 
-def sync_policy_eligibility_major(conn: Connection, items: list[NormalizedPolicy]) -> dict:
-    if not items:
+def _apply_bridge_merge(conn: Connection, spec: BridgeSpec) -> tuple[int, int]:
+    """
+    MERGE 한 문장으로 INSERT/DELETE 동시 적용.
+    - PG16 MERGE에는 WHEN NOT MATCHED BY SOURCE가 없으므로, 원하는 쌍(tmp)과
+      대상 정책의 현재 쌍을 FULL JOIN 하여 차이 나는 쌍만 diff로 만들고
+      (wanted = 추가할 쌍, NOT wanted = 지울 쌍) diff를 MERGE 소스로 사용
+    - PG16 MERGE는 RETURNING이 없으므로 액션별 건수는 diff에서 계산,
+      MERGE 처리 건수와 다르면(동시 변경) 경고
+    """
+    fk = spec.fk_column
+    diff = f"{spec.tmp_table}_diff"
+    conn.execute(text(f"CREATE TEMP TABLE {diff} ON COMMIT DROP AS {_bridge_diff_sql(spec)}"))
+    inserted, deleted = conn.execute(text(f"""
+        SELECT count(*) FILTER (WHERE wanted), count(*) FILTER (WHERE NOT wanted) FROM {diff}
+    """)).one()
+    if inserted or deleted:
+        merged = conn.execute(text(f"""
+            MERGE INTO core.{spec.table} pe
+            USING {diff} d
+            ON pe.policy_id = d.policy_id AND pe.{fk} = d.{fk}
+            WHEN MATCHED AND NOT d.wanted THEN DELETE
+            WHEN NOT MATCHED AND d.wanted THEN
+                INSERT (policy_id, {fk}) VALUES (d.policy_id, d.{fk})
+        """)).rowcount
+        if merged != inserted + deleted:
+            print(f"⚠️ {spec.table}: MERGE applied {merged} rows, expected {inserted + deleted} (concurrent change?)")
+    conn.execute(text(f"DROP TABLE {diff}"))
+    return inserted, deleted
+
+def sync_bridge(
+    conn: Connection,
+    batch: PolicyBatch,
+    spec: BridgeSpec,
+    *,
+    commit: bool = True,
+    strategy: Optional[str] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    브릿지 테이블 집합 기반 동기화.
+    1) 코드 -> master id 변환: 코드 사전(vocab)만 조회 후 배열 인덱싱으로 링크 전체에 적용
+       (미등록 코드는 spec.on_unknown 정책에 따라 생성/격리/버림)
+    2) (policy_id, fk) 쌍을 중복 제거 후 임시테이블에 binary COPY로 적재
+    3) 신규 쌍 INSERT / 대상 정책에서 빠진 쌍 DELETE
+       - merge   : 차집합 한 번 계산 후 MERGE 한 문장 (PG15+)
+       - two_step: INSERT, DELETE 각 한 문장 (fallback)
+    dry_run=True: master 생성/격리/링크 변경 없이 예상 건수만 계산 (--plan)
+    """
+    if not len(batch):
         return {"inserted": 0, "deleted": 0, "unknown": set()}
 
-    major_map = load_major_id_map(conn)
-
-    target_pairs, policy_ids, unknown = [], [], set()
-    for item in items:
-        policy_ids.append({"policy_id": item.id})
-        for m in item.majors:
-            mid = major_map.get(m)
-            if mid:
-                target_pairs.append({"policy_id": item.id, "major_id": mid})
+    id_map = get_lookup(conn, spec.lookup)
+
+    policy_ids = batch.ids
+    links = batch.links[spec.attr]
+    ref_ids = np.asarray([id_map.get(code) or 0 for code in links.vocab], dtype=np.int64)[links.code_idx]   # 0 = 미등록
+    known = ref_ids > 0
+    pair_policy_ids: List[str] = [policy_ids[i] for i in links.policy_idx[known].tolist()]
+    pair_ref_ids: List[int] = ref_ids[known].tolist()
+    unknown_pairs: List[tuple] = [
+        (policy_ids[i], links.vocab[c]) for i, c in zip(links.policy_idx[~known].tolist(), links.code_idx[~known].tolist())
+    ]
+
+    new_codes: List[str] = []
+    new_links = 0
+    if unknown_pairs and spec.on_unknown == UNKNOWN_CREATE and dry_run:
+        # 생성될 코드로의 링크는 모두 신규 INSERT (새 id는 기존 링크에 없음)
+        new_codes = creatable_master_codes(spec.lookup, (code for _, code in unknown_pairs))
+        creatable = set(new_codes)
+        new_links = len({(pid, code) for pid, code in unknown_pairs if code in creatable})
+        unknown_pairs = [(pid, code) for pid, code in unknown_pairs if code not in creatable]
+    elif unknown_pairs and spec.on_unknown == UNKNOWN_CREATE:
+        created = provision_master_codes(conn, spec.lookup, (code for _, code in unknown_pairs))
+        still_unknown: List[tuple] = []
+        for pid, code in unknown_pairs:
+            ref_id = created.get(code)
+            if ref_id:
+                pair_policy_ids.append(pid)
+                pair_ref_ids.append(ref_id)
             else:
-                unknown.add(m)
-
-    conn.execute(text("CREATE TEMP TABLE tmp_policy (policy_id TEXT) ON COMMIT DROP"))
-    conn.execute(text("CREATE TEMP TABLE tmp_policy_eligibility_major (policy_id TEXT, major_id BIGINT) ON COMMIT DROP"))
-
-    if policy_ids:
-        conn.execute(text("INSERT INTO tmp_policy(policy_id) VALUES (:policy_id)"), policy_ids)
-    if target_pairs:
-        conn.execute(
-            text("INSERT INTO tmp_policy_eligibility_major(policy_id, major_id) VALUES (:policy_id, :major_id)"),
-            target_pairs
-        )
-    r1 = conn.execute(text("""
-        INSERT INTO core.policy_eligibility_major(policy_id, major_id)
-        SELECT t.policy_id, t.major_id
-        FROM tmp_policy_eligibility_major t
-        LEFT JOIN core.policy_eligibility_major pe
-          ON pe.policy_id = t.policy_id AND pe.major_id = t.major_id
-        WHERE pe.policy_id IS NULL
-    """))
-    inserted = r1.rowcount or 0
-    r2 = conn.execute(text("""
-        DELETE FROM core.policy_eligibility_major pe
-        USING tmp_policy p
-        WHERE pe.policy_id = p.policy_id
-          AND NOT EXISTS (
-              SELECT 1 FROM tmp_policy_eligibility_major t
-              WHERE t.policy_id = pe.policy_id
-                AND t.major_id = pe.major_id
-          )
-    """))
-    deleted = r2.rowcount or 0
+                still_unknown.append((pid, code))
+        if created:
+            print(f"✅ Provisioned {len(created)} {spec.label} into master.")
+        unknown_pairs = still_unknown
+
+    _stage_tmp_policy(conn, policy_ids)
+    if spec.on_unknown != UNKNOWN_DROP and not dry_run:
+        quarantine_unknown_codes(conn, spec, unknown_pairs)
+
+    conn.execute(text(f"CREATE TEMP TABLE {spec.tmp_table} (policy_id text, {spec.fk_column} bigint) ON COMMIT DROP"))
+    copy_rows(
+        conn, spec.tmp_table, (("policy_id", "text"), (spec.fk_column, "int8")),
+        dict.fromkeys(zip(pair_policy_ids, pair_ref_ids)),
+    )
 
-    conn.commit()
-    if unknown:
-        print(f"⚠️ Unknown majors not in master: {sorted(unknown)}")
+    if dry_run:
+        inserted, deleted = _count_bridge_diff(conn, spec)
+        return {"inserted": inserted + new_links, "deleted": deleted,
+                "unknown": {code for _, code in unknown_pairs}, "master_new": len(new_codes)}
 
-    return {"inserted": inserted, "deleted": deleted, "unknown": unknown}
-
-def sync_policy_eligibility_specialization(conn: Connection, items: list[NormalizedPolicy]) -> dict:
-    if not items:
-        return {"inserted": 0, "deleted": 0, "unknown": set()}
+    if resolve_bridge_strategy(conn, strategy) == BRIDGE_MERGE:
+        inserted, deleted = _apply_bridge_merge(conn, spec)
+    else:
+        inserted, deleted = _apply_bridge_two_step(conn, spec)
 
-    spec_map = load_specialization_id_map(conn)
+    if commit:
+        conn.commit()
 
-    target_pairs, policy_ids, unknown = [], [], set()
-    for item in items:
-        policy_ids.append({"policy_id": item.id})
-        for s in item.specializations:
-            sid = spec_map.get(s)
-            if sid:
-                target_pairs.append({"policy_id": item.id, "specialization_id": sid})
-            else:
-                unknown.add(s)
-
-    conn.execute(text("CREATE TEMP TABLE tmp_policy (policy_id TEXT) ON COMMIT DROP"))
-    conn.execute(text("CREATE TEMP TABLE tmp_policy_eligibility_specialization (policy_id TEXT, specialization_id BIGINT) ON COMMIT DROP"))
-
-    if policy_ids:
-        conn.execute(text("INSERT INTO tmp_policy(policy_id) VALUES (:policy_id)"), policy_ids)
-    if target_pairs:
-        conn.execute(
-            text("INSERT INTO tmp_policy_eligibility_specialization(policy_id, specialization_id) VALUES (:policy_id, :specialization_id)"),
-            target_pairs
-        )
-    r1 = conn.execute(text("""
-        INSERT INTO core.policy_eligibility_specialization(policy_id, specialization_id)
-        SELECT t.policy_id, t.specialization_id
-        FROM tmp_policy_eligibility_specialization t
-        LEFT JOIN core.policy_eligibility_specialization pe
-          ON pe.policy_id = t.policy_id AND pe.specialization_id = t.specialization_id
-        WHERE pe.policy_id IS NULL
-    """))
-    inserted = r1.rowcount or 0
-    r2 = conn.execute(text("""
-        DELETE FROM core.policy_eligibility_specialization pe
-        USING tmp_policy p
-        WHERE pe.policy_id = p.policy_id
-          AND NOT EXISTS (
-              SELECT 1 FROM tmp_policy_eligibility_specialization t
-              WHERE t.policy_id = pe.policy_id
-                AND t.specialization_id = pe.specialization_id
-          )
-    """))
-    deleted = r2.rowcount or 0
-
-    conn.commit()
-    if unknown:
-        print(f"⚠️ Unknown specializations not in master: {sorted(unknown)}")
+    unknown = {code for _, code in unknown_pairs}
+    if unknown and spec.on_unknown != UNKNOWN_DROP:
+        print(f"⚠️ {len(unknown)} unknown {spec.label} quarantined -> meta.etl_unknown_code")
 
     return {"inserted": inserted, "deleted": deleted, "unknown": unknown}
 
-def sync_policy_eligibility_job_status(conn: Connection, items: list[NormalizedPolicy]) -> dict:
-    if not items:
-        return {"inserted": 0, "deleted": 0, "unknown": set()}
+def sync_policy_region(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> dict:
+    return sync_bridge(conn, batch, BRIDGE_BY_TABLE["policy_region"], commit=commit)
 
-    job_map = load_job_status_id_map(conn)
+def sync_policy_keywords(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> dict:
+    return sync_bridge(conn, batch, BRIDGE_BY_TABLE["policy_keyword"], commit=commit)
 
-    target_pairs, policy_ids, unknown = [], [], set()
-    for item in items:
-        policy_ids.append({"policy_id": item.id})
-        for j in item.job_status:
-            jid = job_map.get(j)
-            if jid:
-                target_pairs.append({"policy_id": item.id, "job_status_id": jid})
-            else:
-                unknown.add(j)
+def sync_policy_eligibility_major(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> dict:
+    return sync_bridge(conn, batch, BRIDGE_BY_TABLE["policy_eligibility_major"], commit=commit)
 
-    conn.execute(text("CREATE TEMP TABLE tmp_policy (policy_id TEXT) ON COMMIT DROP"))
-    conn.execute(text("CREATE TEMP TABLE tmp_policy_eligibility_job_status (policy_id TEXT, job_status_id BIGINT) ON COMMIT DROP"))
+def sync_policy_eligibility_specialization(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> dict:
+    return sync_bridge(conn, batch, BRIDGE_BY_TABLE["policy_eligibility_specialization"], commit=commit)
 
-    if policy_ids:
-        conn.execute(text("INSERT INTO tmp_policy(policy_id) VALUES (:policy_id)"), policy_ids)
-    if target_pairs:
-        conn.execute(
-            text("INSERT INTO tmp_policy_eligibility_job_status(policy_id, job_status_id) VALUES (:policy_id, :job_status_id)"),
-            target_pairs
-        )
-    r1 = conn.execute(text("""
-        INSERT INTO core.policy_eligibility_job_status(policy_id, job_status_id)
-        SELECT t.policy_id, t.job_status_id
-        FROM tmp_policy_eligibility_job_status t
-        LEFT JOIN core.policy_eligibility_job_status pe
-          ON pe.policy_id = t.policy_id AND pe.job_status_id = t.job_status_id
-        WHERE pe.policy_id IS NULL
-    """))
-    inserted = r1.rowcount or 0
-    r2 = conn.execute(text("""
-        DELETE FROM core.policy_eligibility_job_status pe
-        USING tmp_policy p
-        WHERE pe.policy_id = p.policy_id
-          AND NOT EXISTS (
-              SELECT 1 FROM tmp_policy_eligibility_job_status t
-              WHERE t.policy_id = pe.policy_id
-                AND t.job_status_id = pe.job_status_id
-          )
-    """))
-    deleted = r2.rowcount or 0
+def sync_policy_eligibility_job_status(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> dict:
+    return sync_bridge(conn, batch, BRIDGE_BY_TABLE["policy_eligibility_job_status"], commit=commit)
 
-    conn.commit()
-    if unknown:
-        print(f"⚠️ Unknown job statuses not in master: {sorted(unknown)}")
+def sync_policy_eligibility_education(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> dict:
+    return sync_bridge(conn, batch, BRIDGE_BY_TABLE["policy_eligibility_education"], commit=commit)
 
-    return {"inserted": inserted, "deleted": deleted, "unknown": unknown}
+def sync_policy_category(conn: Connection, batch: PolicyBatch, *, commit: bool = True) -> dict:
+    return sync_bridge(conn, batch, BRIDGE_BY_TABLE["policy_category"], commit=commit)
 
-def sync_policy_eligibility_education(conn: Connection, items: list[NormalizedPolicy]) -> dict:
-    if not items:
-        return {"inserted": 0, "deleted": 0, "unknown": set()}
+def core_sync_steps() -> List[tuple]:
+    """upsert_policy 이후 실행되는 하위 테이블 동기화 단계 (실행 순서대로)"""
+    steps = [(spec.table, partial(sync_bridge, spec=spec)) for spec in BRIDGES]
+    steps.append(("policy_eligibility", sync_policy_eligibility))
+    return steps
 
-    edu_map = load_education_id_map(conn)
+class SyncStepsError(RuntimeError):
+    """병렬 하위 테이블 동기화에서 실패한 테이블별 예외 모음 (errors: {테이블: 예외})"""
 
-    target_pairs, policy_ids, unknown = [], [], set()
-    for item in items:
-        policy_ids.append({"policy_id": item.id})
-        for e in item.educations:
-            eid = edu_map.get(e)
-            if eid:
-                target_pairs.append({"policy_id": item.id, "education_id": eid})
-            else:
-                unknown.add(e)
-
-    conn.execute(text("CREATE TEMP TABLE tmp_policy (policy_id TEXT) ON COMMIT DROP"))
-    conn.execute(text("CREATE TEMP TABLE tmp_policy_eligibility_education (policy_id TEXT, education_id BIGINT) ON COMMIT DROP"))
-
-    if policy_ids:
-        conn.execute(text("INSERT INTO tmp_policy(policy_id) VALUES (:policy_id)"), policy_ids)
-    if target_pairs:
-        conn.execute(
-            text("INSERT INTO tmp_policy_eligibility_education(policy_id, education_id) VALUES (:policy_id, :education_id)"),
-            target_pairs
-        )
-    r1 = conn.execute(text("""
-        INSERT INTO core.policy_eligibility_education(policy_id, education_id)
-        SELECT t.policy_id, t.education_id
-        FROM tmp_policy_eligibility_education t
-        LEFT JOIN core.policy_eligibility_education pe
-          ON pe.policy_id = t.policy_id AND pe.education_id = t.education_id
-        WHERE pe.policy_id IS NULL
-    """))
-    inserted = r1.rowcount or 0 
-    r2 = conn.execute(text("""
-        DELETE FROM core.policy_eligibility_education pe
-        USING tmp_policy p
-        WHERE pe.policy_id = p.policy_id
-          AND NOT EXISTS (
-              SELECT 1 FROM tmp_policy_eligibility_education t
-              WHERE t.policy_id = pe.policy_id
-                AND t.education_id = pe.education_id
-          )
-    """))
-    deleted = r2.rowcount or 0
-
-    conn.commit()
-    if unknown:
-        print(f"⚠️ Unknown educations not in master: {sorted(unknown)}")
+    def __init__(self, errors: Dict[str, BaseException]):
+        self.errors = errors
+        super().__init__("core sync failed for " + ", ".join(f"{name} ({type(e).__name__}: {e})" for name, e in errors.items()))
 
-    return {"inserted": inserted, "deleted": deleted, "unknown": unknown}
 
-def sync_policy_category(conn: Connection, items: list[NormalizedPolicy]) -> dict:
-    if not items:
-        return {"inserted": 0, "deleted": 0, "unknown": set()}
+def run_sync_steps_concurrently(
+    engine: Engine,
+    steps: List[tuple],
+    run_step: Callable[[str, Callable[[Connection], Any]], Any],
+    workers: int,
+) -> Dict[str, Any]:
+    """
+    하위 테이블 동기화 단계를 스레드 풀에서 동시에 실행 (단계마다 커넥션 하나, 각자 커밋).
+    - 단계들은 서로 다른 테이블에만 쓰고 core.policy는 읽기(FK 확인)만 하므로 서로 막지 않음
+    - 한 테이블이 실패해도 나머지는 끝까지 실행, 실패는 테이블별로 모아 SyncStepsError로 전달
+    - run_step(name, fn): fn(conn)을 계측하며 실행 (sync_core의 timed)
+    """
+    def run_one(name: str, fn: Callable) -> Any:
+        with engine.connect() as conn:
+            return run_step(name, lambda: fn(conn))
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=min(workers, len(steps)), thread_name_prefix="core-sync") as pool:
+        futures = {pool.submit(run_one, name, fn): name for name, fn in steps}
+        for fut in as_completed(futures):
+            name = futures[fut]
+            try:
+                results[name] = fut.result()
+            except Exception as e:
+                errors[name] = e
+                print(f"❌ {name} sync failed: {type(e).__name__}: {e}")
+            else:
+                print(f"✅ {name} sync -> +{results[name]['inserted']} / -{results[name]['deleted']}")
+    print(f"✅ {len(steps)} table syncs finished in {time.monotonic() - started:.2f}s (workers={min(workers, len(steps))}, failed={len(errors)})")
+    if errors:
+        # 실패한 트랜잭션에서 자동 생성한 master 코드가 캐시에 남지 않도록
+        MASTER_CACHE.invalidate()
+        raise SyncStepsError(errors)
+    return results
+
+def sync_core(
+    engine: Engine,
+    batch: PolicyBatch,
+    *,
+    single_tx: bool = ETL_SINGLE_TX,
+    bridge_workers: int = ETL_BRIDGE_WORKERS,
+) -> None:
+    """
+    정규화된 정책 배치를 core.policy 및 하위 테이블에 반영.
+    - single_tx=False: 단계마다 커넥션을 새로 열고 각각 커밋 (기존 방식)
+      * bridge_workers>1이면 upsert_policy(FK 대상) 커밋 후 하위 테이블 단계를 동시에 실행
+    - single_tx=True : 커넥션 하나, 트랜잭션 하나로 전체 단계 수행 후 한 번만 커밋
+                       (tmp_policy도 한 번만 생성, 조회 측에서는 배치 단위로 원자적으로 보임)
+    """
+    steps = core_sync_steps()
 
-    cat_map = load_subcategory_id_map(conn)
+    def timed(name: str, fn: Callable[[], Any]) -> Any:
+        with METRICS.step(name, rows_in=len(batch)) as st:
+            result = fn()
+            if isinstance(result, dict):
+                st.add_counts(result)
+        return result
 
-    target_pairs, policy_ids, unknown = [], [], set()
-    for item in items:
-        policy_ids.append({"policy_id": item.id})
-        for c in item.subcategories:
-            cid = cat_map.get(c)
-            if cid:
-                target_pairs.append({"policy_id": item.id, "category_id": cid})
-            else:
-                unknown.add(c)
+    if single_tx:
+        try:
+            with engine.begin() as conn:
+                n = timed("policy", lambda: upsert_policy(conn, batch, commit=False))
+                print(f"✅ Upserted {n} policies into core.policy.")
+                for name, fn in steps:
+                    result = timed(name, lambda: fn(conn, batch, commit=False))
+                    print(f"✅ {name} sync -> +{result['inserted']} / -{result['deleted']}")
+        except Exception:
+            # 롤백된 트랜잭션에서 자동 생성한 master 코드가 캐시에 남지 않도록
+            MASTER_CACHE.invalidate()
+            raise
+        return
 
-    conn.execute(text("CREATE TEMP TABLE tmp_policy (policy_id TEXT) ON COMMIT DROP"))
-    conn.execute(text("CREATE TEMP TABLE tmp_policy_category (policy_id TEXT, category_id BIGINT) ON COMMIT DROP"))
+    # 4. Policy 객체 리스트를 DB에 저장 (upsert)
+    with engine.connect() as conn:
+        n = timed("policy", lambda: upsert_policy(conn, batch))
+        print(f"✅ Upserted {n} policies into core.policy.")
 
-    if policy_ids:
-        conn.execute(text("INSERT INTO tmp_policy(policy_id) VALUES (:policy_id)"), policy_ids)
-    if target_pairs:
-        conn.execute(
-            text("INSERT INTO tmp_policy_category(policy_id, category_id) VALUES (:policy_id, :category_id)"),
-            target_pairs
+    # 5. 하위 테이블 동기화 (category, eligibility_*, keyword, region, eligibility)
+    if bridge_workers > 1:
+        run_sync_steps_concurrently(
+            engine,
+            [(name, partial(fn, batch=batch)) for name, fn in steps],
+            timed,
+            bridge_workers,
         )
+        return
 
-    r1 = conn.execute(text("""
-        INSERT INTO core.policy_category(policy_id, category_id)
-        SELECT t.policy_id, t.category_id
-        FROM tmp_policy_category t
-        LEFT JOIN core.policy_category pc
-          ON pc.policy_id = t.policy_id AND pc.category_id = t.category_id
-        WHERE pc.policy_id IS NULL
-    """))
-    inserted = r1.rowcount or 0
-
-    r2 = conn.execute(text("""
-        DELETE FROM core.policy_category pc
-        USING tmp_policy p
-        WHERE pc.policy_id = p.policy_id
-          AND NOT EXISTS (
-              SELECT 1 FROM tmp_policy_category t
-              WHERE t.policy_id = pc.policy_id
-                AND t.category_id = pc.category_id
-          )
-    """))
-    deleted = r2.rowcount or 0
+    for name, fn in steps:
+        with engine.connect() as conn:
+            result = timed(name, lambda: fn(conn, batch))
+            print(f"✅ {name} sync -> +{result['inserted']} / -{result['deleted']}")
 
-    conn.commit()
-    if unknown:
-        print(f"⚠️ Unknown subcategories not in master: {sorted(unknown)}")
+def record_stage_stats(engine: Engine) -> None:
+    """이번 실행의 step별 계측값을 meta.etl_stage_stats / ETL_METRICS_DIR/core.prom에 기록"""
+    raw = engine.raw_connection()
+    try:
+        METRICS.flush(raw.driver_connection)
+    finally:
+        raw.close()
+    print(f"✅ Stage stats: {METRICS.summary()}")
+
+# ---------- --plan (dry run) ----------
+def _plan_policy(conn: Connection, batch: PolicyBatch) -> Dict[str, int]:
+    """core.policy: 신규(INSERT) / 그룹 해시가 달라 갱신될(UPDATE) 정책 수"""
+    cols = policy_copy_columns(batch)
+    row = conn.execute(
+        text("""
+            SELECT count(*) FILTER (WHERE p.id IS NULL) AS inserted,
+                   count(*) FILTER (WHERE p.id IS NOT NULL
+                                      AND (p.group_hashes IS DISTINCT FROM CAST(t.group_hashes AS jsonb)
+                                           OR p.content_hash IS DISTINCT FROM t.content_hash)) AS updated
+            FROM unnest(CAST(:ids AS TEXT[]), CAST(:group_hashes AS TEXT[]), CAST(:content_hashes AS TEXT[]))
+                 AS t(id, group_hashes, content_hash)
+            LEFT JOIN core.policy p ON p.id = t.id
+        """),
+        {
+            "ids": cols["id"],
+            "group_hashes": cols["group_hashes"],
+            "content_hashes": cols["content_hash"],
+        },
+    ).mappings().one()
+    return {"inserted": row["inserted"], "updated": row["updated"], "deleted": 0}
+
+def _plan_eligibility(conn: Connection, batch: PolicyBatch) -> Dict[str, int]:
+    """core.policy_eligibility: 없는 정책은 INSERT, 있는 정책은 UPDATE (upsert는 항상 갱신)"""
+    ids = [str(pid) for pid in batch.ids if to_int_or_none(pid) is not None]
+    existing = conn.execute(
+        text("SELECT count(*) FROM core.policy_eligibility WHERE policy_id = ANY(CAST(:ids AS TEXT[]))"),
+        {"ids": ids},
+    ).scalar()
+    return {"inserted": len(ids) - existing, "updated": existing, "deleted": 0}
+
+def plan_core(engine: Engine, batch: PolicyBatch) -> List[Dict[str, Any]]:
+    """
+    sync_core를 실행하지 않고 테이블별 예상 INSERT/UPDATE/DELETE 건수 계산.
+    - 임시테이블 적재 + 읽기 전용 집합 연산만 수행, 트랜잭션은 항상 롤백
+    - master 자동 생성/미등록 코드 격리도 하지 않고 건수만 보고
+    """
+    plan: List[Dict[str, Any]] = []
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            plan.append({"table": "policy", **_plan_policy(conn, batch), "unknown": 0, "master_new": 0})
+            for spec in BRIDGES:
+                r = sync_bridge(conn, batch, spec, commit=False, dry_run=True)
+                plan.append({
+                    "table": spec.table, "inserted": r["inserted"], "updated": 0, "deleted": r["deleted"],
+                    "unknown": len(r["unknown"]), "master_new": r["master_new"],
+                })
+            plan.append({"table": "policy_eligibility", **_plan_eligibility(conn, batch), "unknown": 0, "master_new": 0})
+
+            # 최근 실행 기록 기반 예상 시간 (정책 1건당 평균 초 x 이번 정책 수)
+            rates = dict(conn.execute(
+                text("""
+                    SELECT step, sum(seconds) / nullif(sum(rows_in), 0)
+                    FROM (
+                        SELECT step, seconds, rows_in,
+                               row_number() OVER (PARTITION BY step ORDER BY id DESC) AS rn
+                        FROM meta.etl_stage_stats
+                        WHERE stage = 'core' AND ok
+                    ) h
+                    WHERE rn <= :n
+                    GROUP BY step
+                """),
+                {"n": PLAN_HISTORY_RUNS},
+            ).all())
+        finally:
+            trans.rollback()
+
+    for row in plan:
+        rate = rates.get(row["table"])
+        row["est_seconds"] = rate * len(batch) if rate is not None else None
+    return plan
+
+def print_plan(plan: List[Dict[str, Any]], n_items: int) -> None:
+    print(f"📋 Plan (dry run, rolled back) for {n_items} changed policies:")
+    print(f"   {'table':<36}{'insert':>9}{'update':>9}{'delete':>9}{'unknown':>9}{'new master':>12}{'est. sec':>10}")
+    for r in plan:
+        est = f"{r['est_seconds']:.2f}" if r["est_seconds"] is not None else "n/a"
+        print(f"   {r['table']:<36}{r['inserted']:>9}{r['updated']:>9}{r['deleted']:>9}{r['unknown']:>9}{r['master_new']:>12}{est:>10}")
+    known = [r["est_seconds"] for r in plan if r["est_seconds"] is not None]
+    if known:
+        missing = "" if len(known) == len(plan) else f" (no history for {len(plan) - len(known)} tables)"
+        print(f"   projected sync time ≈ {sum(known):.1f}s{missing}")
+    else:
+        print("   projected sync time: n/a (no core rows in meta.etl_stage_stats yet)")
+
+def run_etl_chunked(
+    engine: Engine,
+    read_conn: Connection,
+    batch_size: int,
+    executor: Optional[Executor] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> int:
+    """
+    변경분을 서버 사이드 커서로 batch_size 건씩 읽어 정규화/동기화/커밋을 반복.
+    - 메모리에는 항상 한 배치 분량만 유지
+    - read_conn은 읽기 전용, 스트리밍이 끝날 때까지 유지 (쓰기는 sync_core가 engine에서 여는 커넥션)
+    - 배치가 커밋되면 core.policy.content_hash가 갱신되므로,
+      중단 후 재실행 시 커밋된 배치는 자동으로 건너뜀 (체크포인트 = 마지막 커밋 policy_id)
+    """
+    processed = 0
+    started = time.monotonic()
+
+    for batch_no, rows in enumerate(iter_changed_rows(read_conn, batch_size, shard), start=1):
+        batch = normalize_policies(rows, executor)
+        del rows
+        if DEBUG and batch_no == 1:
+            print("✅ Sample normalized policy:")
+            pprint(batch.record(0))
+
+        sync_core(engine, batch)
+        processed += len(batch)
+        print(
+            f"✅ {_shard_label(shard)}[batch {batch_no}] committed {len(batch)} policies "
+            f"(total={processed}, last_policy_id={batch.ids[-1]}, elapsed={time.monotonic() - started:.1f}s)"
+        )
+        del batch
 
-    return {"inserted": inserted, "deleted": deleted, "unknown": unknown}
+    return processed
 
-def run_etl():
+@profiling.profiled("stg_to_core")   # PROFILE=cpu,mem,sql (profiling 참고)
+def run_etl(batch_size: int = ETL_BATCH_SIZE, plan: bool = False, engine: Optional[Engine] = None):
+    """engine을 넘기면(pipeline) 연결 테스트/부트스트랩은 호출자가 이미 수행한 것으로 간주"""
+    METRICS.steps.clear()   # 같은 프로세스에서 다시 호출돼도 이전 실행 계측값을 중복 기록하지 않도록
 
     # 1. 엔진 연결 및 DB 연결 테스트
-    engine = get_engine()
-    test_connection(engine)
+    if engine is None:
+        engine = get_engine()
+        test_connection(engine)
+        bootstrap(engine)
 
-    # 2. 변경된 정책 가져오기 (raw_rows)
+    executor = normalize_executor()
+    try:
+        if plan:
+            _plan_etl(engine, executor)
+        else:
+            run_sharded(engine, batch_size, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if not plan:
+            record_stage_stats(engine)
+
+def _plan_etl(engine: Engine, executor: Optional[Executor]):
+    """--plan: 변경분 조회 + 정규화 + 예상 건수/시간 출력 (core 반영 없음)"""
     with engine.connect() as conn:
         raw_rows = fetch_changed_rows(conn)
-        print(f"✅ Fetched {len(raw_rows)} changed/new policies.")
-        if DEBUG: pprint(raw_rows[:1])
-
-    # 3. raw_rows -> items (Policy 객체 리스트) 변환
-    items = [normalize_row(r) for r in raw_rows]
-    print(f"✅ Normalized {len(items)} policies into Policy objects.")
-    if DEBUG and items:
-        print("✅ Sample normalized policy:")
-        pprint(items[0])
-    if not items:
-        print("❌ No new or changed policies to process. ETL finished.")
+    batch = normalize_policies(raw_rows, executor)
+    if not batch:
+        print("❌ No new or changed policies to process. Nothing to plan.")
         return
+    print_plan(plan_core(engine, batch), len(batch))
+
+# ---------- 샤드 실행 ----------
+def _shard_label(shard: Optional[Tuple[int, int]]) -> str:
+    return "" if shard is None or shard[1] == 1 else f"[shard {shard[0]}/{shard[1]}] "
+
+def run_shard(
+    engine: Engine,
+    shard: int,
+    shards: int,
+    batch_size: int,
+    executor: Optional[Executor] = None,
+) -> Optional[int]:
+    """
+    샤드 하나를 버킷 잠금을 잡은 상태에서 동기화, 처리 건수 반환.
+    - 잠금은 변경분 조회(스트리밍) 커넥션에서 잡고 샤드가 끝날 때까지 유지
+      → 동시 커넥션 = 읽기 1 + 쓰기(sync_core) 1, ETL_BRIDGE_WORKERS=N이면 1 + N
+    - 다른 실행이 버킷 하나라도 잡고 있으면 건너뛰고 None (남은 변경분은 다음 실행이 처리)
+    """
+    buckets = shard_buckets(shard, shards)
+    with engine.connect() as read_conn:
+        if not try_lock_buckets(read_conn, buckets):
+            print(f"⏭️ {_shard_label((shard, shards))}Skipped: another run holds its lock.")
+            return None
+        try:
+            return _run_etl(engine, read_conn, batch_size, executor, (shard, shards) if shards > 1 else None)
+        finally:
+            # 조회 트랜잭션(실패 시 aborted 상태 포함)을 끝낸 뒤 해제, 세션 잠금은 롤백과 무관
+            read_conn.rollback()
+            unlock_buckets(read_conn, buckets)
 
-    # 4. Policy 객체 리스트를 DB에 저장 (upsert)
-    with engine.connect() as conn:
-        n = upsert_policy(conn, items)
-        print(f"✅ Upserted {n} policies into core.policy.")
-
-    # 5-1. policy_category 동기화
-    with engine.connect() as conn:
-        result = sync_policy_category(conn, items)
-        print(f"✅ policy_category sync -> +{result['inserted']} / -{result['deleted']}")
-
-    # 5-2. policy_eligibility_education 동기화
-    with engine.connect() as conn:
-        result = sync_policy_eligibility_education(conn, items)
-        print(f"✅ policy_eligibility_education sync -> +{result['inserted']} / -{result['deleted']}")
-
-    # 5-3. policy_eligibility_job_status 동기화
-    with engine.connect() as conn:
-        result = sync_policy_eligibility_job_status(conn, items)
-        print(f"✅ policy_eligibility_job_status sync -> +{result['inserted']} / -{result['deleted']}")
+def _shard_worker(url: str, shard: int, shards: int, batch_size: int) -> Dict[str, Any]:
+    """
+    샤드 프로세스 진입점: 자체 엔진으로 run_shard 실행.
+    계측값(step별 StepStats)과 오류는 부모 프로세스로 반환 (기록은 부모가 한 번에)
+    """
+    METRICS.steps.clear()   # 프로세스 하나가 샤드 여러 개를 순서대로 맡을 수 있음
+    engine = etl_metrics.instrument_engine(create_engine(url, future=True))
+    out: Dict[str, Any] = {"shard": shard, "processed": None, "error": None}
+    try:
+        out["processed"] = run_shard(engine, shard, shards, batch_size)
+    except Exception:
+        out["error"] = traceback.format_exc()
+    finally:
+        engine.dispose()
+    out["steps"] = METRICS.rows()
+    return out
 
-    # 5-4. policy_eligibility_major 동기화
-    with engine.connect() as conn:
-        result = sync_policy_eligibility_major(conn, items)
-        print(f"✅ policy_eligibility_major sync -> +{result['inserted']} / -{result['deleted']}")
+def run_sharded(
+    engine: Engine,
+    batch_size: int,
+    executor: Optional[Executor] = None,
+    shards: int = ETL_SHARDS,
+    only: Optional[int] = ETL_SHARD,
+    workers: int = ETL_SHARD_WORKERS,
+) -> int:
+    """
+    변경분을 shards개 샤드로 나눠 동기화, 전체 처리 건수 반환.
+    - shards=1 또는 only 지정: 현재 프로세스에서 샤드 하나 실행
+    - shards>1: 샤드마다 별도 프로세스 + 별도 DB 커넥션 (최대 workers개 동시), 정규화도 샤드 프로세스에서
+    - 실패한 샤드가 있으면 나머지 샤드를 마친 뒤 RuntimeError
+    """
+    if only is not None or shards == 1:
+        return run_shard(engine, only or 0, shards, batch_size, executor) or 0
+
+    shard_buckets(0, shards)   # 샤드 수 검증
+    url = engine.url.render_as_string(hide_password=False)
+    started = time.monotonic()
+    total, busy, failed = 0, [], []
+    # spawn: 부모의 커넥션/스레드(pipeline 풀)를 물려받지 않도록
+    with ProcessPoolExecutor(max_workers=min(workers or shards, shards), mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(_shard_worker, url, k, shards, batch_size) for k in range(shards)]
+        for fut in as_completed(futures):
+            r = fut.result()
+            METRICS.merge(r["steps"])
+            label = _shard_label((r["shard"], shards))
+            if r["error"] is not None:
+                failed.append(r["shard"])
+                print(f"❌ {label}Failed:\n{r['error']}")
+            elif r["processed"] is None:
+                busy.append(r["shard"])
+            else:
+                total += r["processed"]
+                print(f"✅ {label}Done: {r['processed']} policies ({time.monotonic() - started:.1f}s)")
+
+    print(f"✅ Sharded ETL finished. {total} policies synced (shards={shards}, skipped={busy or 'none'}, failed={failed or 'none'}).")
+    if failed:
+        raise RuntimeError(f"core sync failed for shards {sorted(failed)} of {shards}")
+    return total
+
+def _run_etl(
+    engine: Engine,
+    read_conn: Connection,
+    batch_size: int,
+    executor: Optional[Executor],
+    shard: Optional[Tuple[int, int]] = None,
+) -> int:
+    label = _shard_label(shard)
+
+    # 2~5. 배치 모드: 스트리밍 + 배치 단위 정규화/동기화
+    if batch_size > 0:
+        n = run_etl_chunked(engine, read_conn, batch_size, executor, shard)
+        if n == 0:
+            print(f"❌ {label}No new or changed policies to process. ETL finished.")
+        else:
+            print(f"✅ {label}Chunked ETL finished. {n} policies synced (batch_size={batch_size}).")
+        return n
 
-    # 5-5. policy_eligibility_specialization 동기화
-    with engine.connect() as conn:
-        result = sync_policy_eligibility_specialization(conn, items)
-        print(f"✅ policy_eligibility_specialization sync -> +{result['inserted']} / -{result['deleted']}")
-        
-    # 5-6. policy_keyword 동기화
-    with engine.connect() as conn:
-        result = sync_policy_keywords(conn, items)
-        print(f"✅ policy_keyword sync -> +{result['inserted']} / -{result['deleted']}")
-    
-    # 5-7. policy_region 동기화
-    with engine.connect() as conn:
-        result = sync_policy_region(conn, items)
-        print(f"✅ policy_region sync -> +{result['inserted']} / -{result['deleted']}")
+    # 2. 변경된 정책 가져오기 (raw_rows)
+    raw_rows = fetch_changed_rows(read_conn, shard)
+    read_conn.commit()
+    print(f"✅ {label}Fetched {len(raw_rows)} changed/new policies.")
+    if DEBUG: pprint(raw_rows[:1])
+
+    # 3. raw_rows -> batch (컬럼 단위 PolicyBatch) 변환, 이후 raw_rows는 불필요 (payload는 batch가 참조)
+    t0 = time.monotonic()
+    batch = normalize_policies(raw_rows, executor)
+    del raw_rows
+    print(f"✅ {label}Normalized {len(batch)} policies into a policy batch. ({time.monotonic() - t0:.2f}s, workers={ETL_NORMALIZE_WORKERS})")
+    if DEBUG and batch:
+        print("✅ Sample normalized policy:")
+        pprint(batch.record(0))
+    if not batch:
+        print(f"❌ {label}No new or changed policies to process. ETL finished.")
+        return 0
 
-    # 5-8. policy_eligibility 동기화
-    with engine.connect() as conn:
-        result = sync_policy_eligibility(conn, items)
-        print(f"✅ policy_eligibility sync -> +{result['inserted']} / -{result['deleted']}")
+    # 4~5. core.policy 및 하위 테이블 동기화
+    sync_core(engine, batch)
+    return len(batch)
 
 if __name__ == "__main__":
-    run_etl()
-    
+    import argparse
+    parser = argparse.ArgumentParser(description="STG -> CORE 정규화/동기화")
+    parser.add_argument("--plan", action="store_true", help="반영하지 않고 테이블별 예상 건수/시간만 출력 (dry run)")
+    args = parser.parse_args()
+    run_etl(plan=args.plan)
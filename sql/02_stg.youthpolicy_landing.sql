@@ -1,3 +1,24 @@
+create function stg.kst_ts(v text) returns timestamp with time zone
+    immutable
+    parallel safe
+    language plpgsql
+as
+$$
+begin
+  v := btrim(v);
+  if v !~ '^[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}$' then
+    return null;
+  end if;
+  return make_timestamp(substr(v, 1, 4)::int, substr(v, 6, 2)::int, substr(v, 9, 2)::int,
+                        substr(v, 12, 2)::int, substr(v, 15, 2)::int, substr(v, 18, 2)::int)
+         at time zone 'Asia/Seoul';
+exception when datetime_field_overflow then
+  return null;
+end
+$$;
+
+alter function stg.kst_ts(text) owner to admin;
+
 create table stg.youthpolicy_landing
 (
     policy_id     text                                   not null,
@@ -6,6 +27,8 @@ create table stg.youthpolicy_landing
     ingested_at   timestamp with time zone default now() not null,
     raw_ingest_id uuid                                   not null,
     page_no       integer                                not null,
+    last_mdfcn_at timestamp with time zone generated always as (stg.kst_ts(raw_json ->> 'lastMdfcnDt'::text)) stored,
+    pruned_at     timestamp with time zone,
     primary key (policy_id, record_hash)
 );
 
@@ -15,6 +38,14 @@ alter table stg.youthpolicy_landing
 create index idx_stg_landing_raw
     on stg.youthpolicy_landing (raw_ingest_id);
 
-create index idx_stg_landing_policy
-    on stg.youthpolicy_landing (policy_id);
+create index idx_stg_landing_policy_ingested
+    on stg.youthpolicy_landing (policy_id asc, ingested_at desc);
+
+create index idx_stg_landing_ingested_brin
+    on stg.youthpolicy_landing using brin (ingested_at);
+
+create index idx_stg_landing_mdfcn
+    on stg.youthpolicy_landing (last_mdfcn_at);
 
+create index idx_stg_landing_policy_mdfcn
+    on stg.youthpolicy_landing (policy_id, last_mdfcn_at);
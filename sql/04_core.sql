@@ -36,6 +36,9 @@ create table policy
     first_external_created timestamp with time zone,
     application_process    text,
     required_documents     text,
+    group_hashes           jsonb,
+    search_tsv             tsvector,
+    summary_content_hash   text,
     constraint ux_policy_source_extid
         unique (ext_source, ext_id)
 );
@@ -54,14 +57,49 @@ create index ix_policy_last_external_modified
 create index ix_policy_created_at
     on policy (created_at);
 
-create index ft_policy_text
-    on policy using gin (to_tsvector('simple'::regconfig,
-                                     (((((title::text || ' '::text) || summary_raw) || ' '::text) || description_raw) ||
-                                      ' '::text) || summary_ai));
+create function policy_search_tsv(title text, summary_raw text, description_raw text, summary_ai text) returns tsvector
+    immutable
+    parallel safe
+    language sql
+as
+$$
+  select setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+      || setweight(to_tsvector('simple', coalesce(summary_raw, '')), 'B')
+      || setweight(to_tsvector('simple', coalesce(description_raw, '')), 'C')
+      || setweight(to_tsvector('simple', coalesce(summary_ai, '')), 'D')
+$$;
+
+alter function policy_search_tsv(text, text, text, text) owner to admin;
+
+create function policy_status(apply_type text, apply_start date, apply_end date, today date) returns text
+    immutable
+    parallel safe
+    language sql
+as
+$$
+  select case
+    when apply_type = 'CLOSED'      then 'CLOSED'
+    when apply_type = 'ALWAYS_OPEN' then 'OPEN'
+    when apply_type = 'PERIODIC' and apply_start is not null and apply_end is not null then
+      case when today < apply_start then 'UPCOMING'
+           when today <= apply_end  then 'OPEN'
+           else 'CLOSED' end
+    else 'UNKNOWN'
+  end
+$$;
+
+alter function policy_status(text, date, date, date) owner to admin;
+
+create index ix_policy_search_tsv
+    on policy using gin (search_tsv);
 
 create index ix_policy_status
     on policy (status);
 
+create index ix_policy_summary_stale
+    on policy (id)
+    where (summary_content_hash IS DISTINCT FROM content_hash);
+
 create table policy_eligibility
 (
     policy_id               text                                   not null
@@ -0,0 +1,56 @@
+create schema if not exists meta;
+
+create table meta.etl_unknown_code
+(
+    bridge        text                                   not null,
+    code          text                                   not null,
+    policy_id     text                                   not null,
+    first_seen_at timestamp with time zone default now() not null,
+    last_seen_at  timestamp with time zone default now() not null,
+    seen_count    integer                  default 1     not null,
+    primary key (bridge, code, policy_id)
+);
+
+alter table meta.etl_unknown_code
+    owner to admin;
+
+create index idx_etl_unknown_code_policy
+    on meta.etl_unknown_code (policy_id);
+
+create table meta.ai_summary_cache
+(
+    text_hash  char(64)                               not null
+        primary key,
+    summary    text                                   not null,
+    model      text                                   not null,
+    created_at timestamp with time zone default now() not null
+);
+
+alter table meta.ai_summary_cache
+    owner to admin;
+
+create table meta.etl_stage_stats
+(
+    id          bigint generated always as identity
+        primary key,
+    run_id      uuid                                   not null,
+    recorded_at timestamp with time zone default now() not null,
+    stage       text                                   not null,
+    step        text                                   not null,
+    ok          boolean                  default true  not null,
+    calls       integer                  default 1     not null,
+    rows_in     bigint                   default 0     not null,
+    rows_out    bigint                   default 0     not null,
+    inserted    bigint                   default 0     not null,
+    updated     bigint                   default 0     not null,
+    deleted     bigint                   default 0     not null,
+    bytes       bigint                   default 0     not null,
+    round_trips bigint                   default 0     not null,
+    seconds     double precision                       not null
+);
+
+alter table meta.etl_stage_stats
+    owner to admin;
+
+create index idx_etl_stage_stats_step
+    on meta.etl_stage_stats (stage asc, step asc, id desc);
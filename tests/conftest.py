@@ -0,0 +1,13 @@
+"""Test setup: elt/ scripts are flat modules configured from the environment at import time."""
+
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "elt"))
+
+# import-time settings only; no test opens a database connection
+os.environ.setdefault("PG_DSN", "postgresql://test@localhost/test")
+os.environ.setdefault("DATABASE_URL", "postgresql://test@localhost/test")
+os.environ.setdefault("ETL_SOURCE", "youthcenter")
@@ -0,0 +1,116 @@
+import importlib
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+import fast_parse
+
+KST = timezone(timedelta(hours=9))
+
+
+@pytest.fixture(params=["4096", "0"], ids=["cached", "uncached"])
+def fp(request, monkeypatch):
+    """fast_parse loaded with and without the LRU caches"""
+    monkeypatch.setenv("FAST_PARSE_CACHE_SIZE", request.param)
+    module = importlib.reload(fast_parse)
+    yield module
+    monkeypatch.delenv("FAST_PARSE_CACHE_SIZE")
+    importlib.reload(fast_parse)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("20250101", date(2025, 1, 1)),
+        ("2025-01-01", date(2025, 1, 1)),
+        (" 20241231 ", date(2024, 12, 31)),
+        ("20240229", date(2024, 2, 29)),
+        ("20250229", None),           # not a leap year
+        ("20251301", None),
+        ("2025/01/01", None),
+        ("2025-1-1", None),
+        ("202501011", None),
+        ("２０２５０１０１", None),      # fullwidth digits
+        ("2025-0a-01", None),
+        ("", None),
+        (None, None),
+        (20250101, None),
+        (["20250101"], None),
+    ],
+)
+def test_parse_date(fp, value, expected):
+    assert fp.parse_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("20240823 ~ 20240913", (date(2024, 8, 23), date(2024, 9, 13))),
+        ("20240823~20240913", (date(2024, 8, 23), date(2024, 9, 13))),
+        ("2024-08-23 ~ 2024-09-13", (date(2024, 8, 23), date(2024, 9, 13))),
+        ("20240823 ~ ", (None, None)),
+        ("20240823 ~ 20240931", (None, None)),
+        ("20240823 - 20240913", (None, None)),
+        ("20240823 ~ 20240913 ~ 20241001", (None, None)),
+        ("20240823", (None, None)),
+        ("", (None, None)),
+        (None, (None, None)),
+    ],
+)
+def test_parse_period(fp, value, expected):
+    assert fp.parse_period(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2025-09-24 17:35:10", datetime(2025, 9, 24, 17, 35, 10, tzinfo=KST)),
+        (" 2025-09-24 17:35:10 ", datetime(2025, 9, 24, 17, 35, 10, tzinfo=KST)),
+        ("2024-8-1 9:00:00", datetime(2024, 8, 1, 9, 0, 0, tzinfo=KST)),   # strptime fallback
+        ("2025-02-30 00:00:00", None),
+        ("2025-09-24 24:00:00", None),
+        ("2025-09-24T17:35:10", None),
+        ("2025-09-24", None),
+        ("", None),
+        (None, None),
+        (1727166910, None),
+    ],
+)
+def test_parse_datetime_kst(fp, value, expected):
+    result = fp.parse_datetime_kst(value)
+    assert result == expected
+    if result is not None:
+        assert result.utcoffset() == timedelta(hours=9)
+
+
+def test_cache_hits_and_clear():
+    module = importlib.reload(fast_parse)
+    module.cache_clear()
+    for _ in range(3):
+        assert module.parse_date("20250101") == date(2025, 1, 1)
+        assert module.parse_period("20250101 ~ 20250201") == (date(2025, 1, 1), date(2025, 2, 1))
+        assert module.parse_datetime_kst("2025-01-01 00:00:00") == datetime(2025, 1, 1, tzinfo=KST)
+    info = module.cache_info()
+    for name in ("date", "period", "datetime_kst"):
+        assert (info[name].hits, info[name].misses) == (2, 1)
+
+    # non-string input never reaches the cache
+    module.parse_date(20250101)
+    module.parse_period(None)
+    assert module.cache_info()["date"].currsize == 1
+    assert module.cache_info()["period"].currsize == 1
+
+    module.cache_clear()
+    assert all(i.currsize == 0 for i in module.cache_info().values())
+
+
+def test_cache_disabled(monkeypatch):
+    monkeypatch.setenv("FAST_PARSE_CACHE_SIZE", "0")
+    module = importlib.reload(fast_parse)
+    try:
+        assert module.cache_info() == {}
+        module.cache_clear()   # no-op
+        assert module.parse_date("20250101") == date(2025, 1, 1)
+    finally:
+        monkeypatch.delenv("FAST_PARSE_CACHE_SIZE")
+        importlib.reload(fast_parse)
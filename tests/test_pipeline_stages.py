@@ -0,0 +1,113 @@
+from contextlib import contextmanager
+
+import pytest
+
+import pipeline
+from pipeline import BLOCKED, FAILED, OK, SKIPPED, Stage, select_stages
+
+
+@pytest.mark.parametrize(
+    "only, skip, start, expected",
+    [
+        ((), (), None, ["raw", "landing", "current", "core"]),
+        (("core", "raw"), (), None, ["raw", "core"]),                  # STAGES order, not argument order
+        ((), ("raw",), None, ["landing", "current", "core"]),
+        ((), (), "current", ["current", "core"]),
+        ((), ("core",), "landing", ["landing", "current"]),
+        (("raw", "current", "core"), (), "landing", ["current", "core"]),
+        (("landing",), ("landing",), None, []),
+        (("raw",), (), "core", []),
+        ((), ("raw", "landing", "current", "core"), None, []),
+    ],
+)
+def test_select_stages(only, skip, start, expected):
+    assert select_stages(only, skip, start) == expected
+
+
+@pytest.mark.parametrize("kwargs", [{"only": ["nope"]}, {"skip": ["Raw"]}, {"start": "stg"}])
+def test_select_stages_unknown(kwargs):
+    with pytest.raises(ValueError, match="Unknown stage"):
+        select_stages(**kwargs)
+
+
+class FakeEngine:
+    disposed = False
+
+    def dispose(self):
+        self.disposed = True
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """run_pipeline over fake STAGES without a DB -> (status, run order, bootstrap order, engine)"""
+    calls, boots, engine = [], [], FakeEngine()
+
+    @contextmanager
+    def open_pool():
+        yield object()
+
+    def stage(name, deps, fail=False):
+        def run(ctx):
+            calls.append(name)
+            if fail:
+                raise RuntimeError(f"{name} broke")
+            return "ok"
+        return Stage(name, deps, run, lambda ctx: boots.append(name))
+
+    def run_with(specs, selected, **kwargs):
+        monkeypatch.setattr(pipeline, "STAGES", tuple(stage(*s) for s in specs))
+        status = pipeline.run_pipeline(selected, **kwargs)
+        return status, calls, boots, engine
+
+    monkeypatch.setattr(pipeline, "open_pool", open_pool)
+    monkeypatch.setattr(pipeline, "pooled_engine", lambda pool: engine)
+    return run_with
+
+
+CHAIN = [("raw", ()), ("landing", ("raw",)), ("current", ("landing",)), ("core", ("current",))]
+
+
+def test_run_all_ok(fake_run):
+    status, calls, boots, engine = fake_run(CHAIN, ["raw", "landing", "current", "core"])
+    assert status == {"raw": OK, "landing": OK, "current": OK, "core": OK}
+    assert calls == boots == ["raw", "landing", "current", "core"]
+    assert engine.disposed
+
+
+def test_failure_blocks_downstream(fake_run):
+    specs = [("raw", ()), ("landing", ("raw",), True), ("current", ("landing",)), ("core", ("current",))]
+    status, calls, _, engine = fake_run(specs, ["raw", "landing", "current", "core"])
+    assert status == {"raw": OK, "landing": FAILED, "current": BLOCKED, "core": BLOCKED}
+    assert calls == ["raw", "landing"]
+    assert engine.disposed
+
+
+def test_failure_blocks_only_dependents(fake_run):
+    specs = [("a", (), True), ("b", ()), ("c", ("a",)), ("d", ("b",)), ("e", ("c", "d"))]
+    status, calls, _, _ = fake_run(specs, ["a", "b", "c", "d", "e"])
+    assert status == {"a": FAILED, "b": OK, "c": BLOCKED, "d": OK, "e": BLOCKED}
+    assert calls == ["a", "b", "d"]
+
+
+def test_unselected_upstream_counts_as_done(fake_run):
+    status, calls, boots, _ = fake_run(CHAIN, ["current", "core"], bootstrap=False)
+    assert status == {"raw": SKIPPED, "landing": SKIPPED, "current": OK, "core": OK}
+    assert calls == ["current", "core"]
+    assert boots == []
+
+
+def test_unselected_stage_does_not_propagate_failure(fake_run):
+    # an unselected stage is treated as already done, so it does not carry the failure downstream
+    specs = [("raw", (), True), ("landing", ("raw",)), ("current", ("landing",)), ("core", ("current",))]
+    status, calls, _, _ = fake_run(specs, ["raw", "current", "core"])
+    assert status == {"raw": FAILED, "landing": SKIPPED, "current": OK, "core": OK}
+    assert calls == ["raw", "current", "core"]
+
+
+def test_main_rejects_bad_selection(capsys):
+    with pytest.raises(SystemExit):
+        pipeline.main(["--only", "nope"])
+    assert "Unknown stage" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        pipeline.main(["--only", "raw", "--skip", "raw"])
+    assert "no stages selected" in capsys.readouterr().err
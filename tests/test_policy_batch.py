@@ -0,0 +1,130 @@
+import copy
+import json
+from pathlib import Path
+
+import numpy as np
+
+import stg_to_core as stc
+
+EXAMPLE = json.loads((Path(__file__).resolve().parent.parent / "tools" / "raw_json_example.json").read_text(encoding="utf-8"))
+
+
+def rows(*specs):
+    """(policy_id, overrides) -> fetch_changed_rows shaped rows"""
+    out = []
+    for i, (policy_id, overrides) in enumerate(specs):
+        raw = copy.deepcopy(EXAMPLE)
+        raw.update(plcyNo=policy_id, **overrides)
+        out.append({"policy_id": policy_id, "record_hash": f"h{i}", "raw_json": raw})
+    return out
+
+
+ROWS = rows(
+    ("1001", {"plcyNm": "a", "zipCd": "48310,48320", "plcyKywdNm": "교육지원", "inqCnt": "5"}),
+    ("1002", {"plcyNm": "b", "zipCd": "", "plcyKywdNm": "주거,교육지원", "inqCnt": "7"}),
+    ("1003", {"plcyNm": "c", "zipCd": "48320", "plcyKywdNm": None, "inqCnt": "9"}),
+)
+
+
+def test_code_links_round_trip():
+    lists = [["a", "b"], [], None, ["b", "c", "a"]]
+    links = stc.CodeLinks.from_lists(lists)
+    assert links.vocab == ["a", "b", "c"]
+    assert links.policy_idx.tolist() == [0, 0, 3, 3, 3]
+    assert links.code_idx.dtype == np.int32
+    assert links.codes == ["a", "b", "b", "c", "a"]
+    assert len(links) == 5
+    assert links.to_lists(4) == [["a", "b"], [], [], ["b", "c", "a"]]
+
+
+def test_code_links_concat_merges_vocab():
+    first = stc.CodeLinks.from_lists([["x"], ["y", "x"]])
+    second = stc.CodeLinks.from_lists([[], ["z", "y"]])
+    merged = stc.CodeLinks.concat([first, second], [0, 2])
+    assert merged.vocab == ["x", "y", "z"]
+    assert merged.to_lists(4) == [["x"], ["y", "x"], [], ["z", "y"]]
+    empty = stc.CodeLinks.concat([stc.CodeLinks.from_lists([[]]), first], [0, 1])
+    assert empty.to_lists(3) == [[], ["x"], ["y", "x"]]
+
+
+def test_from_frame_columns_and_values():
+    frame = stc.normalize_frame(ROWS)
+    batch = stc.PolicyBatch.from_frame(frame)
+    assert len(batch) == 3
+    assert batch.ids == ["1001", "1002", "1003"]
+    assert set(batch.columns) == set(stc.POLICY_SCALAR_FIELDS)
+    assert set(batch.links) == set(stc.POLICY_LIST_FIELDS)
+    # null-free numeric/bool fields are numpy arrays, values() hands out python values
+    assert isinstance(batch.columns["views"], np.ndarray)
+    assert batch.values("views") == [5, 7, 9]
+    assert all(type(v) is int for v in batch.values("views"))
+    assert all(type(v) is bool for v in batch.values("restrict_education"))
+    assert batch.values("title") == ["a", "b", "c"]
+    assert batch.links["regions"].to_lists(3) == [["48310", "48320"], [], ["48320"]]
+
+
+def test_from_frame_without_payload():
+    frame = stc.normalize_frame(ROWS).drop(columns="payload")
+    batch = stc.PolicyBatch.from_frame(frame)
+    assert batch.values("payload") == [None, None, None]
+
+
+def test_record_matches_frame_row():
+    frame = stc.normalize_frame(ROWS)
+    batch = stc.PolicyBatch.from_frame(frame)
+    for i in range(len(ROWS)):
+        record = batch.record(i)
+        for name in stc.POLICY_SCALAR_FIELDS:
+            assert getattr(record, name) == frame[name].iloc[i], name
+        for name in stc.POLICY_LIST_FIELDS:
+            assert getattr(record, name) == frame[name].iloc[i], name
+    assert batch.record(2).keywords == []
+
+
+def test_from_records_and_concat():
+    batch = stc.normalize_rows(ROWS)
+    records = [batch.record(i) for i in range(len(batch))]
+    assert [stc.PolicyBatch.from_records(records).record(i) for i in range(3)] == records
+
+    joined = stc.PolicyBatch.concat([stc.normalize_rows(ROWS[:1]), stc.normalize_rows(ROWS[1:])])
+    assert [joined.record(i) for i in range(3)] == records
+    assert len(stc.PolicyBatch.concat([])) == 0
+    assert len(stc.normalize_rows([])) == 0
+
+
+def test_replace_shares_untouched_columns():
+    batch = stc.normalize_rows(ROWS)
+    changed = batch.replace(title=["x", "y", "z"], keywords=[["k"], [], ["k", "m"]])
+    assert changed.values("title") == ["x", "y", "z"]
+    assert changed.links["keywords"].to_lists(3) == [["k"], [], ["k", "m"]]
+    assert changed.columns["summary_raw"] is batch.columns["summary_raw"]
+    assert batch.values("title") == ["a", "b", "c"]
+
+
+def test_copy_columns_duplicate_id_keeps_first_position_last_value():
+    dup = rows(
+        ("2001", {"plcyNm": "first"}),
+        ("2002", {"plcyNm": "other"}),
+        ("2001", {"plcyNm": "second"}),
+    )
+    cols = stc.policy_copy_columns(stc.normalize_rows(dup))
+    assert cols["id"] == ["2001", "2002"]
+    assert cols["title"] == ["second", "other"]
+    assert cols["content_hash"] == ["h2", "h1"]
+    assert json.loads(cols["payload"][0])["plcyNm"] == "second"
+    assert set(c for c, _ in stc.POLICY_COPY_COLUMNS) <= set(cols)
+
+
+def test_copy_columns_group_hashes():
+    batch = stc.normalize_rows(ROWS)
+    cols = stc.policy_copy_columns(batch)
+    for i in range(len(batch)):
+        hashes = json.loads(cols["group_hashes"][i])
+        assert set(hashes) == set(stc.POLICY_COLUMN_GROUPS)
+        for group, group_cols in stc.POLICY_COLUMN_GROUPS.items():
+            assert hashes[group] == stc._group_hash([cols[c][i] for c in group_cols])
+    # a change in one group only moves that group's hash
+    retitled = stc.policy_copy_columns(batch.replace(title=["a", "B", "c"]))
+    before, after = json.loads(cols["group_hashes"][1]), json.loads(retitled["group_hashes"][1])
+    assert before["text"] != after["text"]
+    assert {g: h for g, h in before.items() if g != "text"} == {g: h for g, h in after.items() if g != "text"}
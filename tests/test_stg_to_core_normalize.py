@@ -0,0 +1,140 @@
+import copy
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+import stg_to_core as stc
+
+KST = timezone(timedelta(hours=9))
+EXAMPLE = json.loads((Path(__file__).resolve().parent.parent / "tools" / "raw_json_example.json").read_text(encoding="utf-8"))
+
+
+def row(policy_id: str, **overrides) -> dict:
+    raw = copy.deepcopy(EXAMPLE)
+    raw["plcyNo"] = policy_id
+    for key, value in overrides.items():
+        if value is KeyError:
+            raw.pop(key, None)
+        else:
+            raw[key] = value
+    return {"policy_id": policy_id, "record_hash": f"h{policy_id}", "raw_json": raw}
+
+
+# one batch with mixed value types per key, so normalize_frame cannot rely on per-value caching
+ROWS = [
+    row("p01"),
+    row("p02", sprtTrgtMinAge="１２", sprtTrgtMaxAge=" 39 ", earnMinAmt=True, earnMaxAmt=5000),
+    row("p03", sprtTrgtMinAge=12, sprtTrgtMaxAge="abc", earnMinAmt=1, earnMaxAmt=""),
+    row("p04", inqCnt="abc", bizPrdEtcCn="-", srngMthdCn=" 서류심사 ", etcMttrCn=""),
+    row("p05", inqCnt=True, mrgSttsCd=55003, schoolCd=None, aplyPrdSeCd="0057002"),
+    row("p06", inqCnt=1, aplyYmd="", lastMdfcnDt=None, frstRegDt="2025-02-30 00:00:00"),
+    row("p07", zipCd=["48310", "", "48320"], mclsfNm="취업,,창업", plcyKywdNm=None),
+    row("p08", aplyYmd="20250101 ~ 20251210", bizPrdBgngYmd="2025-03-01", bizPrdEndYmd="2025/03/01"),
+    row("p09", **{k: KeyError for k in ("inqCnt", "sprtTrgtMinAge", "mrgSttsCd", "zipCd", "aplyYmd", "plcyNm")}),
+]
+
+
+def test_row_view_matches_frame():
+    batch = stc.PolicyBatch.from_frame(stc.normalize_frame(ROWS))
+    assert len(batch) == len(ROWS)
+    for i, r in enumerate(ROWS):
+        assert stc.normalize_row(r) == batch.record(i), r["policy_id"]
+
+
+def test_frame_columns_and_order():
+    frame = stc.normalize_frame(ROWS)
+    assert list(frame.columns) == [f.name for f in stc.fields(stc.NormalizedPolicy)]
+    assert frame["id"].tolist() == [r["policy_id"] for r in ROWS]
+    assert frame["content_hash"].tolist() == [r["record_hash"] for r in ROWS]
+    assert frame["summary_ai"].tolist() == [None] * len(ROWS)
+
+
+@pytest.mark.parametrize(
+    "policy_id, field, expected",
+    [
+        ("p01", "age_min", 19),
+        ("p02", "age_min", 12),           # fullwidth digits, as int()
+        ("p02", "age_max", 39),           # surrounding whitespace
+        ("p02", "income_min", None),      # bool is not a number
+        ("p02", "income_max", 5000),
+        ("p03", "age_min", 12),
+        ("p03", "age_max", None),
+        ("p03", "income_min", 1),         # not merged with the bool True of p02
+        ("p03", "income_max", None),
+        ("p04", "views", 0),              # unparseable inqCnt -> 0
+        ("p05", "views", 0),              # bool inqCnt -> 0
+        ("p06", "views", 1),
+        ("p09", "views", 0),              # missing inqCnt
+        ("p09", "age_min", 0),            # missing key defaults to 0
+    ],
+)
+def test_int_fields(policy_id, field, expected):
+    value = stc.normalize_row(next(r for r in ROWS if r["policy_id"] == policy_id))
+    assert getattr(value, field) == expected
+    assert type(getattr(value, field)) is not bool
+
+
+def test_int_rule_is_to_int_or_none():
+    assert stc.to_int_or_none("１２") == 12
+    assert stc.to_int_or_none(" -3 ") == -3
+    assert stc.to_int_or_none(True) is None
+    assert stc.to_int_or_none(12.9) == 12
+    assert stc.to_int_or_none(float("inf")) is None
+    assert stc.to_int_or_none("1.5") is None
+    assert stc.to_int_or_none("") is None
+
+
+def test_text_fields():
+    p04 = stc.normalize_row(ROWS[3])
+    assert p04.period_etc is None                  # "-"
+    assert p04.announcement == "서류심사"           # stripped
+    assert p04.info_etc is None                    # ""
+    p09 = stc.normalize_row(ROWS[8])
+    assert p09.title == ""
+    assert p09.regions == []
+
+
+def test_codes():
+    p01 = stc.normalize_row(ROWS[0])
+    assert p01.marital_status != stc.UNKNOWN
+    p05 = stc.normalize_row(ROWS[4])
+    assert p05.marital_status == stc.UNKNOWN       # non-string code
+    assert p05.restrict_education is True          # missing code counts as restricted
+    p09 = stc.normalize_row(ROWS[8])
+    assert p09.marital_status == stc.UNKNOWN
+
+
+def test_lists():
+    p07 = stc.normalize_row(ROWS[6])
+    assert p07.regions == ["48310", "48320"]
+    assert p07.subcategories == ["취업", "창업"]
+    assert p07.keywords == []
+
+
+def test_dates_and_status():
+    p01 = stc.normalize_row(ROWS[0])
+    assert (p01.apply_start, p01.apply_end) == (date(2025, 1, 1), date(2025, 12, 10))
+    assert p01.last_external_modified == datetime(2025, 9, 24, 17, 35, 10, tzinfo=KST)
+    p06 = stc.normalize_row(ROWS[5])
+    assert (p06.apply_start, p06.apply_end) == (None, None)
+    assert p06.last_external_modified is None
+    assert p06.first_external_created is None      # impossible date
+    p08 = stc.normalize_row(ROWS[7])
+    assert p08.period_start == date(2025, 3, 1)
+    assert p08.period_end is None
+    today = stc.kst_today()
+    for r in ROWS:
+        p = stc.normalize_row(r)
+        assert p.status == stc.policy_status(p.apply_type, p.apply_start, p.apply_end, today)
+
+
+def test_policy_status_rules():
+    today = date(2025, 6, 1)
+    assert stc.policy_status("CLOSED", None, None, today) == "CLOSED"
+    assert stc.policy_status("ALWAYS_OPEN", date(2020, 1, 1), date(2020, 2, 1), today) == "OPEN"
+    assert stc.policy_status("PERIODIC", date(2025, 7, 1), date(2025, 8, 1), today) == "UPCOMING"
+    assert stc.policy_status("PERIODIC", date(2025, 5, 1), date(2025, 6, 1), today) == "OPEN"
+    assert stc.policy_status("PERIODIC", date(2025, 5, 1), date(2025, 5, 31), today) == "CLOSED"
+    assert stc.policy_status("PERIODIC", None, date(2025, 5, 31), today) == "UNKNOWN"
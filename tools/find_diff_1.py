@@ -1,5 +1,5 @@
 import os
-import psycopg2
+import psycopg
 import pandas as pd
 from deepdiff import DeepDiff
 
@@ -19,11 +19,11 @@ def env_str(name: str, default: str | None = None) -> str:
 PG_DSN = env_str("PG_DSN")
 
 # ---------- Connect ----------
-conn = psycopg2.connect(PG_DSN)
+conn = psycopg.connect(PG_DSN)
 
 # ---------- Load duplicated records ----------
 query = """
-SELECT *
+SELECT policy_id, record_hash, ingested_at, raw_json
 FROM youthpolicy.stg.youthpolicy_landing
 WHERE policy_id IN (
     SELECT policy_id
@@ -31,7 +31,7 @@ WHERE policy_id IN (
     GROUP BY policy_id
     HAVING COUNT(*) > 1
 )
-ORDER BY policy_id;
+ORDER BY policy_id, last_mdfcn_at NULLS FIRST, ingested_at;
 """
 
 df = pd.read_sql(query, conn)
@@ -49,8 +49,8 @@ for policy_id, group in df.groupby("policy_id"):
                 other,
                 ignore_order=True,
                 exclude_paths=[
-                    "root['lastMdfcnDt']",
-                    "root['frstRegDt']",
+                    "root['raw_json']['lastMdfcnDt']",
+                    "root['raw_json']['frstRegDt']",
                     "root['ingested_at']",
                     "root['record_hash']",
                     "root['raw_ingest_id']"
@@ -1,5 +1,5 @@
 import os
-import psycopg2
+import psycopg
 import pandas as pd
 from deepdiff import DeepDiff
 from pathlib import Path
@@ -20,15 +20,18 @@ def env_str(name: str, default: str | None = None) -> str:
 
 PG_DSN = env_str("PG_DSN")
 REPORT_CSV_PATH = os.getenv("REPORT_CSV_PATH", "./youthpolicy_diff_report.csv")
+DIFF_SINCE = os.getenv("DIFF_SINCE") or None   # 예: 2025-10-01(KST) → 이후 수정된 버전이 있는 정책만 비교
 
 # ---------- Helpers ----------
 def pick_change_dt(record: dict) -> str | None:
     """
-    변경 시점으로 other 레코드의 lastMdfcnDt > ingested_at 순으로 선택.
+    변경 시점으로 other 레코드의 last_mdfcn_at(lastMdfcnDt) > ingested_at 순으로 선택.
     문자열/타임스탬프 모두 허용, 반환은 ISO 문자열.
     """
-    cand = record.get("lastMdfcnDt") or record.get("ingested_at")
-    if cand is None:
+    cand = record.get("last_mdfcn_at")
+    if cand is None or pd.isna(cand):
+        cand = record.get("ingested_at")
+    if cand is None or pd.isna(cand):
         return None
     # pandas Timestamp, datetime, str 모두 처리
     if isinstance(cand, pd.Timestamp):
@@ -54,22 +57,24 @@ def path_to_field(path: str) -> str:
     return path.replace("root['raw_json']", "").replace("root.", "").replace("root", "").strip()
 
 # ---------- Connect ----------
-conn = psycopg2.connect(PG_DSN)
+conn = psycopg.connect(PG_DSN)
 
 # ---------- Load duplicated records ----------
+# 대상 정책 선별은 (policy_id, last_mdfcn_at) 인덱스만 읽음 (raw_json detoast 없음)
 query = """
-SELECT *
+SELECT policy_id, record_hash, ingested_at, last_mdfcn_at, raw_json
 FROM youthpolicy.stg.youthpolicy_landing
 WHERE policy_id IN (
     SELECT policy_id
     FROM youthpolicy.stg.youthpolicy_landing
     GROUP BY policy_id
     HAVING COUNT(*) > 1
+       AND (%(since)s::text IS NULL OR max(last_mdfcn_at) >= %(since)s::timestamp AT TIME ZONE 'Asia/Seoul')
 )
-ORDER BY policy_id, ingested_at;  -- 시간순으로 정렬해 비교
+ORDER BY policy_id, last_mdfcn_at NULLS FIRST, ingested_at;  -- 수정 시각 순으로 정렬해 비교
 """
 
-df = pd.read_sql(query, conn)
+df = pd.read_sql(query, conn, params={"since": DIFF_SINCE})
 
 # ---------- Compare with DeepDiff ----------
 diff_rows: list[dict] = []
@@ -89,8 +94,9 @@ for policy_id, group in df.groupby("policy_id", sort=False):
             other,
             ignore_order=True,
             exclude_paths=[
-                "root['lastMdfcnDt']",
-                "root['frstRegDt']",
+                "root['raw_json']['lastMdfcnDt']",
+                "root['raw_json']['frstRegDt']",
+                "root['last_mdfcn_at']",
                 "root['ingested_at']",
                 "root['record_hash']",
                 "root['raw_ingest_id']"
@@ -12,6 +12,8 @@ Usage example:
     python tools/generate_data_for_ai.py --output tools/youthpolicy_ai.csv
 
 Pass ``-`` to ``--output`` to stream CSV data to stdout.
+
+Set ``PROFILE=cpu,mem,sql`` to write a profile of the run (see elt/profiling.py).
 """
 
 from __future__ import annotations
@@ -38,6 +40,12 @@ if load_dotenv is not None:
 
 
 BASE_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BASE_DIR.parent / "elt"))
+
+import etl_metrics  # noqa: E402
+import profiling  # noqa: E402
+from master_cache import get_lookup  # noqa: E402
+
 DEFAULT_FIELDS_PATH = BASE_DIR / "fileds.csv"
 DEFAULT_VALUES_PATH = BASE_DIR / "values.csv"
 
@@ -122,6 +130,11 @@ def parse_args() -> argparse.Namespace:
         action="append",
         help="Filter by specific policy_id (repeatable)",
     )
+    parser.add_argument(
+        "--modified-since",
+        default=None,
+        help="Only policies with a version modified (lastMdfcnDt, KST) at or after this time, e.g. 2025-10-01",
+    )
     return parser.parse_args()
 
 
@@ -179,24 +192,9 @@ def load_value_mappings(path: Path) -> Dict[str, Dict[str, str]]:
     return mappings
 
 
-def load_region_lookup(conn: psycopg.Connection) -> Dict[str, str]:
-    lookup: Dict[str, str] = {}
-    with conn.cursor(row_factory=dict_row) as cur:
-        cur.execute(
-            """
-            select zip_code, full_name
-              from master.region
-             where zip_code is not null
-               and full_name is not null
-            """
-        )
-        for row in cur:
-            zip_code = str(row["zip_code"]).strip()
-            full_name = str(row["full_name"]).strip()
-            if not zip_code or not full_name:
-                continue
-            lookup.setdefault(zip_code, full_name)
-    return lookup
+def load_region_lookup(conn: psycopg.Connection) -> Mapping[str, str]:
+    # zip_code -> full_name, shared process-wide cache with elt/stg_to_core
+    return get_lookup(conn, "region_full_name")
 
 
 def fetch_latest_policies(
@@ -204,16 +202,24 @@ def fetch_latest_policies(
     *,
     policy_ids: Sequence[str] | None = None,
     limit: int | None = None,
+    modified_since: str | None = None,
 ) -> Iterator[tuple[str, Dict[str, Any]]]:
     sql_parts: List[str] = [
         "select distinct on (policy_id) policy_id, raw_json",
         "from stg.youthpolicy_landing",
     ]
 
+    where: List[str] = []
     params: List[Any] = []
     if policy_ids:
-        sql_parts.append("where policy_id = any(%s)")
+        where.append("policy_id = any(%s)")
         params.append(list(policy_ids))
+    if modified_since:
+        # stored last_mdfcn_at (indexed) instead of raw_json->>'lastMdfcnDt'; a bare date/time is read as KST
+        where.append("policy_id in (select policy_id from stg.youthpolicy_landing where last_mdfcn_at >= %s::timestamp at time zone 'Asia/Seoul')")
+        params.append(modified_since)
+    if where:
+        sql_parts.append("where " + " and ".join(where))
 
     sql_parts.append("order by policy_id, ingested_at desc")
     if limit is not None and limit > 0:
@@ -425,6 +431,7 @@ def write_csv(
             output_handle.close()
 
 
+@profiling.profiled("generate_data_for_ai")
 def main() -> None:
     args = parse_args()
 
@@ -442,11 +449,13 @@ def main() -> None:
     header_set = set(headers)
 
     with psycopg.connect(dsn) as conn:
+        etl_metrics.instrument(conn)
         region_lookup = load_region_lookup(conn)
         for policy_id, payload in fetch_latest_policies(
             conn,
             policy_ids=args.policy_ids,
             limit=args.limit,
+            modified_since=args.modified_since,
         ):
             record = transform_policy(
                 policy_id,